@@ -0,0 +1,250 @@
+"""
+Headless benchmarks for the SpaceMouse poll_spacenav -> apply_to_canvas hot path.
+
+Runs the real plugin code against stand-in krita, PyQt5 and spacenavigator modules
+(benchmarks/standins) so it can be timed outside Krita. Reports per-call latency
+percentiles, throughput with 1 kHz synthetic input and memory allocated per call,
+as JSON that can be compared between versions:
+
+    python benchmarks/bench_hot_path.py --json bench.json
+    python benchmarks/bench_hot_path.py --compare bench.json
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, "standins"))
+sys.path.insert(1, os.path.dirname(BENCH_DIR))
+
+import spacenavigator  # noqa: E402  (stand-in)
+from krita import Krita  # noqa: E402  (stand-in)
+from PyQt5.QtCore import message_counts  # noqa: E402  (stand-in)
+from krita_spacemouse.extension import SpacenavControlExtension  # noqa: E402
+from krita_spacemouse.models.spacemouse_adapter import adapter  # noqa: E402
+from krita_spacemouse.models.sample_ring import DeviceSample  # noqa: E402
+from krita_spacemouse.models.zoom_state import ZoomState  # noqa: E402
+from krita_spacemouse.models.axis_mapping import build_axis_mapping  # noqa: E402
+from krita_spacemouse.models.motion_config import DEFAULT_MOTION_CONFIG  # noqa: E402
+from krita_spacemouse.models.backends.spacenavigator_backend import SpacenavigatorBackend  # noqa: E402
+from krita_spacemouse import event_handler  # noqa: E402
+
+SCHEMA_VERSION = 1
+
+# Synthetic device rate for the throughput benchmark
+INPUT_RATE_HZ = 1000
+
+def synthetic_sample(index, t_ns):
+    """Smooth figure-eight deflection on all six axes"""
+    phase = index / INPUT_RATE_HZ
+    return DeviceSample(t_ns,
+                        0.6 * math.sin(phase * 2.1), 0.5 * math.sin(phase * 4.2), 0.4 * math.sin(phase * 1.3),
+                        0.1 * math.sin(phase * 0.7), 0.1 * math.cos(phase * 0.9), 0.3 * math.cos(phase * 1.7),
+                        (0, 0))
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def summarize(name, durations_ns, extra=None):
+    durations_ns.sort()
+    count = len(durations_ns)
+    result = {
+        "name": name,
+        "iterations": count,
+        "mean_ns": sum(durations_ns) / count if count else 0,
+        "p50_ns": percentile(durations_ns, 0.50),
+        "p95_ns": percentile(durations_ns, 0.95),
+        "p99_ns": percentile(durations_ns, 0.99),
+        "max_ns": durations_ns[-1] if count else 0,
+    }
+    if extra:
+        result.update(extra)
+    return result
+
+def measure_allocations(func, iterations, prepare=None):
+    """Average bytes and blocks still allocated after each call, and peak transient bytes"""
+    gc.collect()
+    tracemalloc.start()
+    if prepare:
+        prepare()
+    func()  # Warm caches so one-off allocations are not counted
+    if prepare:
+        prepare()
+    before_bytes, _ = tracemalloc.get_traced_memory()
+    before_blocks = sys.getallocatedblocks()
+    tracemalloc.reset_peak()
+    for _ in range(iterations):
+        func()
+        if prepare:
+            prepare()
+    after_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    after_blocks = sys.getallocatedblocks()
+    tracemalloc.stop()
+    return {
+        "net_bytes_per_call": (after_bytes - before_bytes) / iterations,
+        "net_blocks_per_call": (after_blocks - before_blocks) / iterations,
+        "peak_transient_bytes": max(0, peak_bytes - before_bytes),
+    }
+
+def time_calls(func, iterations, warmup=200, prepare=None):
+    """Time each call individually; prepare runs untimed before every call"""
+    for _ in range(warmup):
+        if prepare:
+            prepare()
+        func()
+    durations = []
+    append = durations.append
+    clock = time.perf_counter_ns
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(iterations):
+            if prepare:
+                prepare()
+            start = clock()
+            func()
+            append(clock() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return durations
+
+class Harness:
+    """Real extension wired to the stand-in Krita object model"""
+    def __init__(self, poll_interval_ms):
+        self.poll_interval_ms = poll_interval_ms
+        self.krita = Krita.instance()
+        self.extension = SpacenavControlExtension(self.krita)
+        self.window = self.krita.window
+        self.sample_index = 0
+        self.t_ns = time.perf_counter_ns()
+        spacenavigator.set_state(None)
+        # The stand-in device is driven through spacenavigator on every platform
+        adapter.set_backend(SpacenavigatorBackend())
+        adapter.open_device(0, "SpaceNavigator")
+        # As connect() does: builds the filter chain and axis mapping, installs the callbacks
+        self.extension._start_polling()
+        # Commit every tick; the stand-in timers never fire on their own
+        self.extension.frame_pacer.frame_interval = 0.0
+        # The harness feeds the ring itself; stop the reader thread for determinism
+        adapter._stop_reader()
+
+    def push_samples(self, count):
+        """Feed count samples spaced at INPUT_RATE_HZ into the adapter ring"""
+        step = 1_000_000_000 // INPUT_RATE_HZ
+        ring = adapter._ring
+        for _ in range(count):
+            self.t_ns += step
+            ring.push(synthetic_sample(self.sample_index, self.t_ns))
+            self.sample_index += 1
+
+    def feed_tick(self):
+        """Buffer one poll interval's worth of 1 kHz input (untimed)"""
+        self.push_samples(max(1, self.poll_interval_ms * INPUT_RATE_HZ // 1000))
+
+    def tick(self):
+        event_handler.poll_spacenav(self.extension)
+
+    def close(self):
+        adapter.close_device()
+
+def bench_poll_spacenav(iterations, poll_interval_ms):
+    harness = Harness(poll_interval_ms)
+    samples_per_tick = max(1, poll_interval_ms * INPUT_RATE_HZ // 1000)
+    canvas_widget = harness.window.canvas_widget
+    paints_before = canvas_widget.paints
+    durations = time_calls(harness.tick, iterations, prepare=harness.feed_tick)
+    paints = canvas_widget.paints - paints_before
+    allocations = measure_allocations(harness.tick, min(iterations, 2000), prepare=harness.feed_tick)
+    harness.close()
+
+    total_s = sum(durations) / 1e9
+    extra = {
+        "poll_interval_ms": poll_interval_ms,
+        "samples_per_tick": samples_per_tick,
+        "ticks_per_second": iterations / total_s if total_s else 0,
+        "samples_per_second": iterations * samples_per_tick / total_s if total_s else 0,
+        "repaints_per_tick": paints / (iterations + 200),
+        "filter_chain": harness.extension.filter_chain is not None,
+    }
+    extra.update(allocations)
+    return summarize(f"poll_spacenav@{poll_interval_ms}ms", durations, extra)
+
+def bench_function(name, func, iterations):
+    durations = time_calls(func, iterations)
+    result = summarize(name, durations)
+    result.update(measure_allocations(func, min(iterations, 2000)))
+    return result
+
+def run(iterations):
+    window = Krita.instance().window
+    hscroll = window.subwindow.hscroll
+    vscroll = window.subwindow.vscroll
+    view = window.view
+    canvas = window.canvas
+    zoom_state = ZoomState()
+    mapping = build_axis_mapping(DEFAULT_MOTION_CONFIG)
+    axes = (0.42, -0.3, 0.1, 0.05, -0.02, 0.2)
+
+    results = [
+        bench_poll_spacenav(iterations, 5),
+        bench_poll_spacenav(iterations, 30),
+        bench_function("apply_deadzone", lambda: event_handler.apply_deadzone(0.42, 0.15), iterations),
+        bench_function("axis_mapping", lambda: mapping.apply(axes), iterations),
+        bench_function("apply_panning", lambda: event_handler.apply_panning(hscroll, vscroll, 3, -2), iterations),
+        bench_function("apply_zooming", lambda: event_handler.apply_zooming(view, 0.0001, zoom_state), iterations),
+        bench_function("apply_rotation", lambda: event_handler.apply_rotation(canvas, 0.25), iterations),
+    ]
+    return {
+        "schema": SCHEMA_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "iterations": iterations,
+        "log_messages": message_counts(),
+        "results": results,
+    }
+
+def compare(current, baseline):
+    """Print p50/p99 ratios against a previous JSON report"""
+    previous = {result["name"]: result for result in baseline.get("results", [])}
+    print(f"{'benchmark':28} {'p50 ns':>10} {'base':>10} {'ratio':>7} {'p99 ns':>10} {'base':>10} {'ratio':>7}")
+    for result in current["results"]:
+        base = previous.get(result["name"])
+        if base is None:
+            print(f"{result['name']:28} {result['p50_ns']:>10} {'-':>10} {'-':>7}")
+            continue
+        p50_ratio = result["p50_ns"] / base["p50_ns"] if base["p50_ns"] else float("inf")
+        p99_ratio = result["p99_ns"] / base["p99_ns"] if base["p99_ns"] else float("inf")
+        print(f"{result['name']:28} {result['p50_ns']:>10} {base['p50_ns']:>10} {p50_ratio:>7.2f} "
+              f"{result['p99_ns']:>10} {base['p99_ns']:>10} {p99_ratio:>7.2f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=5000, help="timed calls per benchmark")
+    parser.add_argument("--json", metavar="PATH", help="write the report to PATH instead of stdout")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a previous JSON report")
+    args = parser.parse_args(argv)
+
+    report = run(args.iterations)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report, json.load(f))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    elif not args.compare:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+if __name__ == "__main__":
+    main()
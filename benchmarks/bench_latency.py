@@ -0,0 +1,202 @@
+"""
+Perceived-latency benchmark for the motion predictor, driven by the replay harness.
+
+Replays a recording (.smrec) or, without one, a synthetic pan sweep with release
+pauses through the real extension once per prediction mode. The poll tick runs at
+--tick-ms and every committed frame is painted --render-ms later (delaying the
+next tick when rendering takes longer), where the harness records the committed
+canvas position and closes the predictor's tick-to-paint measurement. The
+perceived latency is the input delay that best explains the presented pan
+velocity (least-squares fit over 0 to 150 ms); the overshoot is the lead the
+predictor wrote off when the puck was released:
+
+    python benchmarks/bench_latency.py
+    python benchmarks/bench_latency.py --recording session.smrec --render-ms 12 --json latency.json
+"""
+
+import argparse
+import bisect
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, "standins"))
+sys.path.insert(1, os.path.dirname(BENCH_DIR))
+
+from krita import Krita  # noqa: E402  (stand-in)
+from PyQt5.QtCore import message_counts  # noqa: E402  (stand-in)
+from krita_spacemouse.extension import SpacenavControlExtension  # noqa: E402
+from krita_spacemouse.models.spacemouse_adapter import adapter  # noqa: E402
+from krita_spacemouse.models.sample_ring import DeviceSample  # noqa: E402
+from krita_spacemouse.models.recorder import SampleRecorder, Recording  # noqa: E402
+from krita_spacemouse.models.axis_mapping import build_axis_mapping  # noqa: E402
+from krita_spacemouse.models.motion_config import DEFAULT_MOTION_CONFIG  # noqa: E402
+from krita_spacemouse.models.predictor import PREDICT_CONSTANT, PREDICT_TREND  # noqa: E402
+from krita_spacemouse import event_handler  # noqa: E402
+
+SCHEMA_VERSION = 1
+
+# (name, prediction model or None for prediction off)
+MODES = (("off", None), ("constant", PREDICT_CONSTANT), ("trend", PREDICT_TREND))
+
+# Synthetic recording: 1 kHz pan sweeps, each followed by a release
+SWEEP_RATE_HZ = 1000
+SWEEP_SECONDS = 1.2
+PAUSE_SECONDS = 0.4
+SWEEPS = 3
+
+# Input delays tried when fitting the presented motion
+MAX_SHIFT_MS = 150
+
+def write_sweep(path):
+    """Half-sine pushes of rising speed on x, the puck released between them"""
+    recorder = SampleRecorder(path)
+    t = 0
+    step = 1_000_000_000 // SWEEP_RATE_HZ
+    for sweep in range(SWEEPS):
+        frequency = 0.5 * (sweep + 1) / SWEEP_SECONDS
+        for index in range(int(SWEEP_SECONDS * SWEEP_RATE_HZ)):
+            phase = 2.0 * math.pi * frequency * index / SWEEP_RATE_HZ
+            recorder.write(DeviceSample(t, 0.8 * math.sin(phase), 0.0, 0.0, 0.0, 0.0, 0.0, (0, 0)))
+            t += step
+        for index in range(int(PAUSE_SECONDS * SWEEP_RATE_HZ)):
+            recorder.write(DeviceSample(t, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, (0, 0)))
+            t += step
+    recorder.close()
+
+def mapped_pan(path, config):
+    """Recorded offsets (ns) and the pan x each record maps to after dead zone and curve"""
+    mapping = build_axis_mapping(config)
+    recording = Recording(path)
+    try:
+        origin = recording.timestamp(0)
+        offsets = [recording.timestamp(index) - origin for index in range(len(recording))]
+        values = [mapping.apply((s.x, s.y, s.z, s.roll, s.pitch, s.yaw))[0] for s in recording]
+    finally:
+        recording.close()
+    return offsets, values
+
+def fit_latency(frames, offsets, values):
+    """Input delay (ms) whose mapped pan best matches the presented velocity, and the fit's r^2"""
+    velocity = []
+    for (t0, x0), (t1, x1) in zip(frames, frames[1:]):
+        if t1 > t0:
+            velocity.append(((t0 + t1) // 2, (x1 - x0) / (t1 - t0)))
+    best = (0, 0.0)
+    velocity_energy = sum(v * v for _, v in velocity)
+    if not velocity_energy:
+        return best
+    for shift_ms in range(MAX_SHIFT_MS + 1):
+        shift = shift_ms * 1_000_000
+        cross = energy = 0.0
+        for t, v in velocity:
+            index = bisect.bisect_right(offsets, t - shift) - 1
+            value = values[index] if index >= 0 else 0.0
+            cross += v * value
+            energy += value * value
+        if energy:
+            # Fraction of the presented velocity explained by the best scale fit
+            r2 = cross * cross / (energy * velocity_energy)
+            if r2 > best[1]:
+                best = (shift_ms, r2)
+    return best
+
+def run_mode(extension, path, name, model, amount, tick_ms, render_ms):
+    """Replay once with the given prediction model; returns presented (offset ns, x) frames"""
+    config = DEFAULT_MOTION_CONFIG.replace(prediction_enabled=model is not None,
+                                           prediction_model=model or 0, prediction=amount)
+    extension.set_motion_config(config)
+    extension.connect_replay(path, realtime=True)
+    extension.frame_pacer.frame_interval = 0.0  # Commit every tick; the stand-in timers never fire
+    # The stand-in canvas paints synchronously; the harness delivers the delayed paint instead
+    extension.transform_batch.latency_probe = None
+    predictor = extension.predictor
+    backend = adapter.get_backend()
+    hscroll = Krita.instance().window.subwindow.hscroll
+    tick = tick_ms * 1_000_000
+    render = render_ms * 1_000_000
+
+    frames = []
+    clock = time.perf_counter_ns
+    next_tick = clock()
+    while not backend.finished:
+        time.sleep(max(0, next_tick - clock()) / 1e9)
+        tick_t = clock()
+        event_handler.poll_spacenav(extension)
+        position = hscroll.value()
+        # Rendering blocks the GUI thread, so a render longer than the tick delays the next one
+        paint_t = tick_t + render
+        time.sleep(max(0, paint_t - clock()) / 1e9)
+        paint_t = clock()
+        frames.append((paint_t - backend._start, position))
+        if predictor is not None:
+            predictor.paint(paint_t)
+        next_tick = max(next_tick + tick, paint_t)
+
+    extension.disconnect()
+    result = {"name": name, "frames": len(frames)}
+    if predictor is not None:
+        result["measured_tick_to_paint_ms"] = predictor.latency * 1000.0
+        result["overshoot_px"] = (abs(predictor.overshoot[0]) + abs(predictor.overshoot[1])) * config.pan_scale
+    return frames, result
+
+def run(path, tick_ms, render_ms, amount):
+    krita = Krita.instance()
+    extension = SpacenavControlExtension(krita)
+    extension.settings_loaded = True  # Use the configs set below, not a settings file
+    offsets, values = mapped_pan(path, DEFAULT_MOTION_CONFIG)
+    results = []
+    for name, model in MODES:
+        frames, result = run_mode(extension, path, name, model, amount, tick_ms, render_ms)
+        latency_ms, r2 = fit_latency(frames, offsets, values)
+        result.update({"perceived_latency_ms": latency_ms, "fit_r2": r2})
+        results.append(result)
+    return {
+        "schema": SCHEMA_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "recording": path,
+        "tick_ms": tick_ms,
+        "render_ms": render_ms,
+        "prediction": amount,
+        "log_messages": message_counts(),
+        "results": results,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--recording", metavar="PATH", help="replay PATH instead of the synthetic sweep")
+    parser.add_argument("--tick-ms", type=int, default=10, help="poll tick interval")
+    parser.add_argument("--render-ms", type=int, default=8, help="simulated commit-to-present time")
+    parser.add_argument("--prediction", type=float, default=1.0, help="fraction of the latency compensated")
+    parser.add_argument("--json", metavar="PATH", help="write the report to PATH instead of stdout")
+    args = parser.parse_args(argv)
+
+    path = args.recording
+    temporary = None
+    if path is None:
+        handle, temporary = tempfile.mkstemp(suffix=".smrec")
+        os.close(handle)
+        write_sweep(temporary)
+        path = temporary
+    try:
+        report = run(path, args.tick_ms, args.render_ms, args.prediction)
+    finally:
+        if temporary is not None:
+            os.unlink(temporary)
+    if temporary is not None:
+        report["recording"] = "synthetic sweep"
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Startup cost of the SpaceMouse plugin.
+
+Imports krita_spacemouse (which registers the extension, as Krita does at launch)
+in fresh interpreters against the stand-in modules, and reports the wall time, the
+plugin's own import/initialize breakdown and whether any heavy module (device
+backend, NumPy) was loaded before a device is connected:
+
+    python benchmarks/bench_startup.py --runs 20 --json startup.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Modules that should only load on first connect
+DEFERRED_MODULES = ("spacenavigator", "pywinusb", "numpy")
+
+PROBE = """
+import sys, time, json
+sys.path.insert(0, {standins!r})
+sys.path.insert(1, {root!r})
+import PyQt5.QtCore, krita  # Already loaded by Krita before plugins
+start = time.perf_counter()
+import krita_spacemouse
+elapsed = (time.perf_counter() - start) * 1000.0
+from krita_spacemouse.startup_profile import STARTUP_TIMES
+print(json.dumps({{
+    "total_ms": elapsed,
+    "stages": STARTUP_TIMES,
+    "deferred_loaded": [name for name in {deferred!r} if name in sys.modules],
+    "plugin_modules": sorted(name for name in sys.modules if name.startswith("krita_spacemouse")),
+}}))
+"""
+
+def probe():
+    code = PROBE.format(standins=os.path.join(BENCH_DIR, "standins"), root=os.path.dirname(BENCH_DIR),
+                        deferred=DEFERRED_MODULES)
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def run(runs):
+    samples = [probe() for _ in range(runs)]
+    totals = sorted(sample["total_ms"] for sample in samples)
+    stages = {name: statistics.median(sample["stages"].get(name, 0.0) for sample in samples)
+              for name in samples[0]["stages"]}
+    return {
+        "runs": runs,
+        "python": sys.version.split()[0],
+        "total_ms_p50": statistics.median(totals),
+        "total_ms_min": totals[0],
+        "stages_ms_p50": stages,
+        "deferred_loaded": samples[0]["deferred_loaded"],
+        "plugin_modules": len(samples[0]["plugin_modules"]),
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="fresh interpreters to time")
+    parser.add_argument("--json", metavar="PATH", help="write the report to PATH instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run(args.runs)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Stand-in spacenavd daemon for exercising SpacenavdBackend without a device.
+
+Listens on a UNIX socket and sends every client the original spacenavd event
+packets for a recording made with the plugin (.smrec) or, without one, a
+synthetic pan/zoom sweep. --drop-after closes the client connection after that
+many packets to exercise the backend's reconnect path:
+
+    python benchmarks/spnavd_server.py /tmp/spnav.sock --recording session.smrec --loop
+
+Point the plugin at it with SpacenavdBackend(socket_path="/tmp/spnav.sock").
+"""
+
+import argparse
+import math
+import os
+import socket
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, "standins"))
+sys.path.insert(1, os.path.dirname(BENCH_DIR))
+
+from krita_spacemouse.models.backends.spacenavd_backend import (  # noqa: E402
+    AXIS_SCALE, EVENT, EVENT_MOTION, EVENT_PRESS, EVENT_RELEASE)
+from krita_spacemouse.models.recorder import Recording, buttons_to_mask  # noqa: E402
+from krita_spacemouse.models.sample_ring import DeviceSample  # noqa: E402
+
+SWEEP_SAMPLES = 500
+SWEEP_PERIOD_NS = 8_000_000
+
+def synthetic_sweep():
+    """One second-ish of pan and zoom with a button tap in the middle"""
+    for index in range(SWEEP_SAMPLES):
+        phase = index / SWEEP_SAMPLES * 2.0 * math.pi
+        button = 1 if SWEEP_SAMPLES // 2 <= index < SWEEP_SAMPLES // 2 + 20 else 0
+        yield DeviceSample(index * SWEEP_PERIOD_NS, 0.6 * math.sin(phase), 0.4 * math.cos(phase),
+                           0.3 * math.sin(2.0 * phase), 0.0, 0.0, 0.2 * math.sin(phase), (button, 0))
+
+def encode(sample, previous, period_ms):
+    """spacenavd packets for one sample: button transitions, then the motion event"""
+    packets = []
+    mask = buttons_to_mask(sample.buttons)
+    changed = mask ^ previous
+    while changed:
+        bit = changed & -changed
+        number = bit.bit_length() - 1
+        packets.append(EVENT.pack(EVENT_PRESS if mask & bit else EVENT_RELEASE, number, 0, 0, 0, 0, 0, 0))
+        changed ^= bit
+    # Inverse of SpacenavdBackend._make_state
+    axes = (sample.x, sample.y, sample.z, -sample.pitch, sample.roll, -sample.yaw)
+    packets.append(EVENT.pack(EVENT_MOTION, *(round(value * AXIS_SCALE) for value in axes), period_ms))
+    return packets, mask
+
+def replay(connection, samples, speed, drop_after):
+    """Send samples at their recorded pace; returns False when the client went away"""
+    sent = 0
+    mask = 0
+    previous_t = None
+    for sample in samples:
+        period_ms = 0
+        if previous_t is not None:
+            delay = (sample.t - previous_t) / 1e9 / speed
+            period_ms = round(delay * 1000.0)
+            if delay > 0:
+                time.sleep(delay)
+        previous_t = sample.t
+        packets, mask = encode(sample, mask, period_ms)
+        try:
+            connection.sendall(b"".join(packets))
+        except OSError:
+            return False
+        sent += len(packets)
+        if drop_after and sent >= drop_after:
+            return False
+    return True
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("socket", help="UNIX socket path to listen on")
+    parser.add_argument("--recording", metavar="PATH", help=".smrec recording to replay (default: synthetic sweep)")
+    parser.add_argument("--speed", type=float, default=1.0, help="playback speed multiplier")
+    parser.add_argument("--loop", action="store_true", help="repeat the recording until the client disconnects")
+    parser.add_argument("--drop-after", type=int, default=0, metavar="N",
+                        help="close the connection after N packets (exercises reconnects)")
+    args = parser.parse_args(argv)
+
+    if os.path.exists(args.socket):
+        os.unlink(args.socket)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(args.socket)
+    server.listen(1)
+    try:
+        while True:
+            connection, _ = server.accept()
+            with connection:
+                while True:
+                    if args.recording:
+                        recording = Recording(args.recording)
+                        samples = list(recording)
+                        recording.close()
+                    else:
+                        samples = synthetic_sweep()
+                    if not replay(connection, samples, args.speed, args.drop_after) or not args.loop:
+                        break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        os.unlink(args.socket)
+
+if __name__ == "__main__":
+    main()
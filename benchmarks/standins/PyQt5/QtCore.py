@@ -0,0 +1,245 @@
+# Stand-in PyQt5.QtCore: signals are synchronous, timers never fire on their own
+import threading
+
+_messages = {"debug": 0, "warning": 0, "critical": 0}
+
+def qDebug(message):
+    _messages["debug"] += 1
+
+def qWarning(message):
+    _messages["warning"] += 1
+
+def qCritical(message):
+    _messages["critical"] += 1
+
+def message_counts():
+    """Log calls made by the plugin since start-up"""
+    return dict(_messages)
+
+class Qt:
+    Horizontal = 1
+    Vertical = 2
+    PreciseTimer = 0
+    CoarseTimer = 1
+    AutoConnection = 0
+    QueuedConnection = 2
+
+class QEvent:
+    Paint = 12
+    Show = 17
+
+    def __init__(self, event_type):
+        self._type = event_type
+
+    def type(self):
+        return self._type
+
+class _BoundSignal:
+    __slots__ = ("_slots",)
+
+    def __init__(self):
+        self._slots = []
+
+    def connect(self, slot, *args):
+        self._slots.append(slot)
+
+    def disconnect(self, slot=None):
+        if slot is None:
+            self._slots.clear()
+        elif slot in self._slots:
+            self._slots.remove(slot)
+
+    def emit(self, *args):
+        for slot in list(self._slots):
+            slot(*args)
+
+class pyqtSignal:
+    """Descriptor creating one bound signal per instance"""
+    def __init__(self, *types, **kwargs):
+        self._name = None
+
+    def __set_name__(self, owner, name):
+        self._name = "_signal_" + name
+
+    def __get__(self, obj, owner):
+        if obj is None:
+            return self
+        signal = obj.__dict__.get(self._name)
+        if signal is None:
+            signal = obj.__dict__[self._name] = _BoundSignal()
+        return signal
+
+def pyqtSlot(*types, **kwargs):
+    def decorator(func):
+        return func
+    return decorator
+
+class _MetaObject:
+    __slots__ = ("_name",)
+
+    def __init__(self, name):
+        self._name = name
+
+    def className(self):
+        return self._name
+
+class QObject:
+    destroyed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        self._event_filters = []
+        self._object_name = ""
+
+    def objectName(self):
+        return self._object_name
+
+    def setObjectName(self, name):
+        self._object_name = name
+
+    def metaObject(self):
+        return _MetaObject(type(self).__name__)
+
+    def installEventFilter(self, obj):
+        self.__dict__.setdefault("_event_filters", []).append(obj)
+
+    def removeEventFilter(self, obj):
+        filters = self.__dict__.get("_event_filters", [])
+        if obj in filters:
+            filters.remove(obj)
+
+    def send_event(self, event):
+        """Deliver an event to installed filters (benchmark helper)"""
+        for obj in self.__dict__.get("_event_filters", []):
+            obj.eventFilter(self, event)
+
+    def eventFilter(self, obj, event):
+        return False
+
+    def moveToThread(self, thread):
+        pass
+
+class QTimer(QObject):
+    """Timer whose timeout only fires when the harness calls fire()"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.timeout = _BoundSignal()
+        self._active = False
+        self._interval = 0
+        self._single_shot = False
+
+    def start(self, interval=None):
+        if interval is not None:
+            self._interval = interval
+        self._active = True
+
+    def stop(self):
+        self._active = False
+
+    def isActive(self):
+        return self._active
+
+    def setInterval(self, interval):
+        self._interval = interval
+
+    def interval(self):
+        return self._interval
+
+    def setSingleShot(self, single_shot):
+        self._single_shot = single_shot
+
+    def setTimerType(self, timer_type):
+        pass
+
+    def fire(self):
+        if self._single_shot:
+            self._active = False
+        self.timeout.emit()
+
+    @staticmethod
+    def singleShot(interval, callback):
+        callback()
+
+class QThread(QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+
+    def run(self):
+        pass
+
+    def wait(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(None if timeout is None else timeout / 1000.0)
+        return True
+
+    def isRunning(self):
+        return self._thread is not None and self._thread.is_alive()
+
+class QSettings:
+    """In-memory settings store shared per path (groups and arrays as "/"-joined keys)"""
+    IniFormat = 1
+    NoError = 0
+    _files = {}
+
+    def __init__(self, path=None, format=None):
+        self._values = self._files.setdefault(path, {})
+        self._prefix = []
+
+    def _key(self, key):
+        return "/".join(self._prefix + [key])
+
+    def value(self, key, default=None, type=None):
+        return self._values.get(self._key(key), default)
+
+    def setValue(self, key, value):
+        self._values[self._key(key)] = value
+
+    def remove(self, key):
+        prefix = self._key(key)
+        for name in [name for name in self._values if name == prefix or name.startswith(prefix + "/")]:
+            del self._values[name]
+
+    def clear(self):
+        self._values.clear()
+
+    def beginGroup(self, name):
+        self._prefix.append(name)
+
+    def endGroup(self):
+        self._prefix.pop()
+
+    def _children(self):
+        prefix = "/".join(self._prefix)
+        prefix = prefix + "/" if prefix else ""
+        return [name[len(prefix):].split("/") for name in self._values if name.startswith(prefix)]
+
+    def childKeys(self):
+        return sorted({parts[0] for parts in self._children() if len(parts) == 1})
+
+    def childGroups(self):
+        return sorted({parts[0] for parts in self._children() if len(parts) > 1})
+
+    def beginWriteArray(self, name, size=0):
+        self.setValue(f"{name}/size", size)
+        self._prefix.append(name)
+
+    def beginReadArray(self, name):
+        size = self.value(f"{name}/size", 0)
+        self._prefix.append(name)
+        return size
+
+    def setArrayIndex(self, index):
+        self._prefix[-1:] = [self._prefix[-1].split("/")[0] + f"/{index + 1}"]
+
+    def endArray(self):
+        self._prefix.pop()
+
+    def status(self):
+        return self.NoError
+
+    def sync(self):
+        pass
@@ -0,0 +1,14 @@
+# Stand-in PyQt5.QtGui
+class _Screen:
+    def refreshRate(self):
+        return 60.0
+
+class QGuiApplication:
+    _instance = None
+
+    @staticmethod
+    def instance():
+        return QGuiApplication._instance
+
+    def primaryScreen(self):
+        return _Screen()
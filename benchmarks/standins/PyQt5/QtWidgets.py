@@ -0,0 +1,60 @@
+# Stand-in PyQt5.QtWidgets: the widget classes the plugin names, with just enough behaviour
+from .QtCore import QObject, pyqtSignal
+
+class QApplication:
+    @staticmethod
+    def instance():
+        return None
+
+class QWidget(QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._updates_enabled = True
+
+    def updatesEnabled(self):
+        return self._updates_enabled
+
+    def setUpdatesEnabled(self, enabled):
+        self._updates_enabled = enabled
+
+class QScrollBar(QWidget):
+    valueChanged = pyqtSignal(int)
+
+    def __init__(self, orientation, minimum=-100000, maximum=100000):
+        super().__init__()
+        self._orientation = orientation
+        self._value = 0
+        self._minimum = minimum
+        self._maximum = maximum
+
+    def orientation(self):
+        return self._orientation
+
+    def value(self):
+        return self._value
+
+    def setValue(self, value):
+        value = max(self._minimum, min(self._maximum, value))
+        if value != self._value:
+            self._value = value
+            self.valueChanged.emit(value)
+
+class QMdiSubWindow(QWidget):
+    pass
+
+class QMdiArea(QWidget):
+    subWindowActivated = pyqtSignal(object)
+
+class QMainWindow(QWidget):
+    pass
+
+class QMessageBox:
+    @staticmethod
+    def warning(*args):
+        pass
+
+class QDockWidget(QWidget):
+    pass
+
+class QToolButton(QWidget):
+    pass
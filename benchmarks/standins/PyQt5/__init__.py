@@ -0,0 +1 @@
+# Stand-in PyQt5 package for headless benchmarks - only what the plugin touches
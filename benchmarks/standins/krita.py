@@ -0,0 +1,198 @@
+# Stand-in krita module: a fake window/view/canvas/scrollbar object model for headless runs
+from PyQt5.QtCore import QObject, QEvent, Qt, pyqtSignal
+from PyQt5.QtWidgets import QWidget, QScrollBar, QMdiArea, QMdiSubWindow, QMainWindow
+
+_PAINT_EVENT = QEvent(QEvent.Paint)
+
+class KisOpenGLCanvas2(QWidget):
+    """Canvas widget; counts the repaints a real canvas would schedule"""
+    def __init__(self):
+        super().__init__()
+        self.update_requests = 0
+        self.paints = 0
+
+    def request_update(self):
+        if self.updatesEnabled():
+            self.update_requests += 1
+            self.paints += 1
+            self.send_event(_PAINT_EVENT)
+
+    def setUpdatesEnabled(self, enabled):
+        was_enabled = self.updatesEnabled()
+        super().setUpdatesEnabled(enabled)
+        if enabled and not was_enabled:
+            self.request_update()
+
+class Canvas:
+    def __init__(self, widget):
+        self._widget = widget
+        self._zoom = 1.0
+        self._rotation = 0.0
+
+    def zoomLevel(self):
+        return self._zoom
+
+    def setZoomLevel(self, value):
+        self._zoom = value
+        self._widget.request_update()
+
+    def rotation(self):
+        return self._rotation
+
+    def setRotation(self, value):
+        self._rotation = value
+        self._widget.request_update()
+
+class Document:
+    def __init__(self, resolution=300):
+        self._resolution = resolution
+
+    def resolution(self):
+        return self._resolution
+
+    def setResolution(self, value):
+        self._resolution = value
+
+class View(QObject):
+    def __init__(self, document, canvas):
+        super().__init__()
+        self._document = document
+        self._canvas = canvas
+
+    def canvas(self):
+        return self._canvas
+
+    def document(self):
+        return self._document
+
+class _SubWindow(QMdiSubWindow):
+    def __init__(self, canvas_widget):
+        super().__init__()
+        self.canvas_widget = canvas_widget
+        self.hscroll = QScrollBar(Qt.Horizontal)
+        self.vscroll = QScrollBar(Qt.Vertical)
+        # Scrolling moves the canvas, which repaints it
+        self.hscroll.valueChanged.connect(lambda value: canvas_widget.request_update())
+        self.vscroll.valueChanged.connect(lambda value: canvas_widget.request_update())
+
+    def findChildren(self, cls):
+        children = [self.hscroll, self.vscroll, self.canvas_widget]
+        return [child for child in children if isinstance(child, cls)]
+
+class _MdiArea(QMdiArea):
+    def __init__(self, subwindow):
+        super().__init__()
+        self._subwindow = subwindow
+
+    def currentSubWindow(self):
+        return self._subwindow
+
+class _MainWindow(QMainWindow):
+    def __init__(self, mdi_area):
+        super().__init__()
+        self._mdi_area = mdi_area
+
+    def findChild(self, cls):
+        return self._mdi_area if isinstance(self._mdi_area, cls) else None
+
+class Window(QObject):
+    activeViewChanged = pyqtSignal()
+    windowClosed = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.document = Document()
+        self.canvas_widget = KisOpenGLCanvas2()
+        self.canvas = Canvas(self.canvas_widget)
+        self.view = View(self.document, self.canvas)
+        self.subwindow = _SubWindow(self.canvas_widget)
+        self._qwindow = _MainWindow(_MdiArea(self.subwindow))
+
+    def activeView(self):
+        return self.view
+
+    def qwindow(self):
+        return self._qwindow
+
+class Notifier(QObject):
+    viewCreated = pyqtSignal(object)
+    viewClosed = pyqtSignal(object)
+    imageCreated = pyqtSignal(object)
+    imageClosed = pyqtSignal(str)
+    windowCreated = pyqtSignal()
+    applicationClosing = pyqtSignal()
+
+    def setActive(self, active):
+        pass
+
+class Action(QObject):
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+        self.triggered_count = 0
+
+    def trigger(self):
+        self.triggered_count += 1
+
+class Krita(QObject):
+    _instance = None
+
+    def __init__(self):
+        super().__init__()
+        self.window = Window()
+        self._notifier = Notifier()
+        self._settings = {}
+        self._actions = {}
+        self.extensions = []
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = Krita()
+        return cls._instance
+
+    def activeWindow(self):
+        return self.window
+
+    def activeDocument(self):
+        return self.window.document
+
+    def dockers(self):
+        return []
+
+    def notifier(self):
+        return self._notifier
+
+    def action(self, name):
+        action = self._actions.get(name)
+        if action is None:
+            action = self._actions[name] = Action(name)
+        return action
+
+    def readSetting(self, group, name, default):
+        return self._settings.get((group, name), default)
+
+    def writeSetting(self, group, name, value):
+        self._settings[(group, name)] = value
+
+    def addExtension(self, extension):
+        self.extensions.append(extension)
+
+    def addDockWidgetFactory(self, factory):
+        pass
+
+class Extension(QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+class DockWidget(QWidget):
+    pass
+
+class DockWidgetFactoryBase:
+    DockRight = 1
+
+class DockWidgetFactory:
+    def __init__(self, name, area, factory):
+        self.name = name
+        self.area = area
+        self.factory = factory
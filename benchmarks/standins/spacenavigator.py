@@ -0,0 +1,37 @@
+# Stand-in spacenavigator: virtual devices whose state the harness sets directly
+from collections import namedtuple
+
+SpaceNavigator = namedtuple("SpaceNavigator", ["t", "x", "y", "z", "roll", "pitch", "yaw", "buttons"])
+
+_states = {}
+_active_device = None
+
+class _Device:
+    def __init__(self, number):
+        self.number = number
+        self.is_open = True
+
+    def read(self):
+        return _states.get(self.number) if self.is_open else None
+
+    def close(self):
+        self.is_open = False
+
+def set_state(state, device_number=0):
+    _states[device_number] = state
+
+def open(callback=None, button_callback=None, button_callbacks=None, set_nonblocking_loop=True,
+         device=None, DeviceNumber=0):
+    global _active_device
+    _active_device = _Device(DeviceNumber)
+    return _active_device
+
+def close():
+    if _active_device is not None:
+        _active_device.close()
+
+def read():
+    return _active_device.read() if _active_device is not None else None
+
+def list_devices():
+    return ["SpaceNavigator"]
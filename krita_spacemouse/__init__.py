@@ -1,15 +1,23 @@
+import time
+_import_start = time.perf_counter()
+
 from krita import Krita
 from .extension import SpacenavControlExtension
+from .startup_profile import record, summary
 from PyQt5 import QtCore
 
+record("import", _import_start)
+
 def initialize():
     app = Krita.instance()
     if app:
         try:
             # Register the extension
+            start = time.perf_counter()
             app.addExtension(SpacenavControlExtension(app))
+            record("initialize", start)
             QtCore.qDebug("Krita_Spacemouse plugin v1.0 registered")
-            QtCore.qDebug("Plugin initialization complete")
+            QtCore.qDebug(f"Plugin initialization complete ({summary()})")
         except Exception as e:
             QtCore.qCritical(f"Failed to initialize SpaceMouse plugin: {e}")
     else:
@@ -1,4 +1,123 @@
-# button_handler.py - Ultra-minimal
+# button_handler.py - Dispatches SpaceMouse buttons, chords and long presses to Krita actions
+import time
+from PyQt5.QtCore import QObject, QTimer, Qt, pyqtSignal
+from PyQt5 import QtCore
+from krita import Krita
+from .models.spacemouse_adapter import adapter, BUTTON_EVENT
+from .models.event_buffer import SpaceMouseEventBuffer, EVENT_FIELDS
+from .models.button_map import ButtonDispatchTable, DEFAULT_BUTTON_BINDINGS
+
+# Hold time that turns a press into a long press
+LONG_PRESS_MS = 500
+
+# The same action never fires twice within this window (switch chatter)
+DEBOUNCE_NS = 40000000
+
+class ButtonDispatcher(QObject):
+    """Runs button bindings on the GUI thread, outside the motion poll tick.
+
+    The reader thread calls notify() when button transitions are queued; a queued
+    signal then drains them here, so a press never runs inside poll_spacenav and
+    panning never waits for an action.
+    """
+    events_pending = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._buffer = SpaceMouseEventBuffer()
+        self._table = ButtonDispatchTable(DEFAULT_BUTTON_BINDINGS)
+        self._actions = {}          # Action name -> cached QAction
+        self._mask = 0              # Buttons currently held
+        self._gesture = 0           # Every button held since the last full release
+        self._fired = False         # The current gesture already triggered an action
+        self._last_action = None
+        self._last_fire = 0
+        self._hold_timer = QTimer(self)
+        self._hold_timer.setSingleShot(True)
+        self._hold_timer.timeout.connect(self._hold_elapsed)
+        self.events_pending.connect(self.drain, Qt.QueuedConnection)
+
+    def set_bindings(self, bindings):
+        """Compile trigger -> action name bindings; cached action handles are dropped"""
+        self._table = ButtonDispatchTable(bindings)
+        self._actions.clear()
+        self.reset()
+
+    def reset(self):
+        self._hold_timer.stop()
+        self._mask = 0
+        self._gesture = 0
+        self._fired = False
+
+    def notify(self):
+        """Thread-safe wake-up from the reader thread"""
+        self.events_pending.emit()
+
+    def drain(self):
+        """Handle every queued button transition"""
+        buffer = self._buffer
+        count = adapter.poll_device_events(buffer)
+        types = buffer.types
+        data = buffer.data
+        for index in range(buffer.first, buffer.first + count):
+            if types[index] == BUTTON_EVENT:
+                base = index * EVENT_FIELDS
+                self.process_button_event(data[base], data[base + 1])
+
+    def process_button_event(self, button_id, press_state):
+        bit = 1 << button_id
+        if press_state:
+            self._mask |= bit
+            self._gesture |= self._mask
+            self._hold_timer.stop()
+            if self._fired:
+                return
+            entry = self._table.lookup(self._gesture)
+            if entry is None:
+                return
+            if not entry.deferred:
+                self._fire(entry.press)
+            elif entry.hold is not None:
+                self._hold_timer.start(LONG_PRESS_MS)
+        else:
+            self._mask &= ~bit
+            self._hold_timer.stop()
+            if not self._fired:
+                # Release completes a deferred press of the largest chord held
+                entry = self._table.lookup(self._gesture)
+                if entry is not None:
+                    self._fire(entry.press)
+            if not self._mask:
+                self._gesture = 0
+                self._fired = False
+
+    def _hold_elapsed(self):
+        if self._fired or self._mask != self._gesture:
+            return
+        entry = self._table.lookup(self._gesture)
+        if entry is not None:
+            self._fire(entry.hold)
+
+    def _fire(self, action_name):
+        self._fired = True
+        if action_name is None:
+            return
+        now = time.perf_counter_ns()
+        if action_name == self._last_action and now - self._last_fire < DEBOUNCE_NS:
+            return
+        self._last_action = action_name
+        self._last_fire = now
+
+        action = self._actions.get(action_name)
+        if action is None:
+            # Resolve once; Krita's action registry is stable for the session
+            action = Krita.instance().action(action_name)
+            if action is None:
+                QtCore.qWarning(f"SpaceMouse button bound to unknown action: {action_name}")
+                return
+            self._actions[action_name] = action
+        action.trigger()
+
 def process_button_event(self, button_id, press_state):
-    """Minimal button handler - just store state"""
-    self.button_states[button_id] = press_state
+    """Route a button transition to the extension's dispatcher"""
+    self.buttons.process_button_event(button_id, press_state)
@@ -0,0 +1,163 @@
+# connection_supervisor.py - Device error handling and reconnection with back-off
+import errno
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from PyQt5 import QtCore
+from .models.log_limiter import RateLimitedLog
+
+# Error classes
+ERROR_TRANSIENT = "transient"        # Would-block, interrupted or timed-out reads; the next tick may succeed
+ERROR_DISCONNECTED = "disconnected"  # The device or daemon went away; reopen it
+ERROR_PERMISSION = "permission"      # Access denied; only the user can fix it, so retry slowly
+ERROR_INTERNAL = "internal"          # Anything else, i.e. a plugin bug
+
+TRANSIENT_ERRNOS = frozenset((errno.EAGAIN, errno.EINTR, errno.ETIMEDOUT, errno.EBUSY))
+PERMISSION_ERRNOS = frozenset((errno.EACCES, errno.EPERM))
+
+# Supervisor states
+STATE_DISCONNECTED = "disconnected"  # Not connected by the user
+STATE_CONNECTED = "connected"
+STATE_DEGRADED = "degraded"          # Polling, but recent ticks failed
+STATE_RECONNECTING = "reconnecting"  # Polling suspended; a reconnect attempt is scheduled
+STATE_FAILED = "failed"              # Polling suspended; the source cannot be reopened (e.g. a replay)
+
+# Consecutive failed ticks tolerated before polling is suspended and the device reopened
+FAILURE_LIMITS = {ERROR_TRANSIENT: 50, ERROR_INTERNAL: 20}
+
+# Reconnect back-off: the first retry after RETRY_INITIAL, doubling up to RETRY_MAX
+RETRY_INITIAL = 250   # ms
+RETRY_MAX = 10000     # ms
+
+def classify_error(error):
+    """Map an exception from a device read or poll tick to an ERROR_* class"""
+    code = getattr(error, "errno", None)
+    if isinstance(error, PermissionError) or code in PERMISSION_ERRNOS:
+        return ERROR_PERMISSION
+    if isinstance(error, (BlockingIOError, InterruptedError, TimeoutError)) or code in TRANSIENT_ERRNOS:
+        return ERROR_TRANSIENT
+    if isinstance(error, (OSError, EOFError)):
+        # ENODEV, EIO, EPIPE, ECONNRESET, ENOENT, EBADF ... all mean the handle is gone
+        return ERROR_DISCONNECTED
+    return ERROR_INTERNAL
+
+class ConnectionSupervisor(QObject):
+    """Decides what a failing poll tick means for the connection.
+
+    The poll tick reports every error here instead of logging it. Messages go
+    through a RateLimitedLog, so a failing device writes one line per interval
+    rather than one per tick. Transient and internal errors are tolerated until
+    FAILURE_LIMITS consecutive ticks have failed; a lost device or denied access
+    suspends polling at once, so the timer stops instead of spinning on a dead
+    handle. Reconnection is then retried with exponential back-off (hotplug can
+    trigger an immediate retry). state_changed reports every transition to the
+    docker.
+    """
+    # state (STATE_*), human-readable message
+    state_changed = pyqtSignal(str, str)
+
+    def __init__(self, suspend, reconnect, parent=None):
+        super().__init__(parent)
+        self._suspend = suspend      # Stops polling and closes the device
+        self._reconnect = reconnect  # Reopens the device and restarts polling; returns True on success
+        self.state = STATE_DISCONNECTED
+        self.message = "Disconnected"
+        self.reconnectable = False   # Whether the source can be reopened (False for replays)
+        self.failures = 0            # Consecutive failed ticks; read on the hot path
+        self.attempts = 0            # Reconnect attempts since the device was lost
+        self.last_error = None
+        self.log = RateLimitedLog()
+        self._lost_reason = None
+        self._retry_timer = QTimer()
+        self._retry_timer.setSingleShot(True)
+        self._retry_timer.timeout.connect(self._retry)
+
+    @property
+    def waiting(self):
+        """Polling is suspended because the device was lost"""
+        return self.state in (STATE_RECONNECTING, STATE_FAILED)
+
+    def started(self, reconnectable=True):
+        """Polling started (connect, replay or a successful reconnect)"""
+        self._retry_timer.stop()
+        self.reconnectable = reconnectable
+        self.failures = 0
+        self.attempts = 0
+        self._lost_reason = None
+        self.log.flush()
+        self._set_state(STATE_CONNECTED, "Connected")
+
+    def stopped(self):
+        """User disconnect: cancel any pending reconnect"""
+        self._retry_timer.stop()
+        self.failures = 0
+        self._lost_reason = None
+        self.log.flush()
+        self._set_state(STATE_DISCONNECTED, "Disconnected")
+
+    def report_success(self):
+        """A tick read the device again after failures (only called while failures is non-zero)"""
+        self.failures = 0
+        self.log.flush()
+        if self.state == STATE_DEGRADED:
+            self._set_state(STATE_CONNECTED, "Connected")
+
+    def report_error(self, error, context):
+        """Classify and log a failed tick; suspends polling when the device is unusable"""
+        kind = classify_error(error)
+        self.failures += 1
+        self.last_error = error
+        self.log.log(f"{context}: {error}", QtCore.qCritical if kind == ERROR_INTERNAL else QtCore.qWarning)
+        if self.waiting:
+            return kind
+        limit = FAILURE_LIMITS.get(kind)
+        if limit is None:
+            self.device_lost(f"Device {'access denied' if kind == ERROR_PERMISSION else 'lost'}: {error}", kind)
+        elif self.failures >= limit:
+            self.device_lost(f"{self.failures} failed reads in a row: {error}", kind)
+        elif self.state == STATE_CONNECTED:
+            self._set_state(STATE_DEGRADED, f"Read errors ({kind}): {error}")
+        return kind
+
+    def device_lost(self, reason, kind=ERROR_DISCONNECTED):
+        """Suspend polling and schedule reconnection (hotplug removal calls this too)"""
+        if self.waiting:
+            return
+        self._suspend()
+        self._lost_reason = reason
+        self.attempts = 0
+        if not self.reconnectable:
+            self._set_state(STATE_FAILED, f"Stopped - {reason}")
+            return
+        self._schedule_retry(RETRY_MAX if kind == ERROR_PERMISSION else RETRY_INITIAL)
+
+    def retry_now(self):
+        """Hotplug saw the device return: skip the rest of the back-off"""
+        if self.state == STATE_RECONNECTING:
+            self._retry_timer.stop()
+            self._retry()
+
+    def retry_delay(self):
+        """Back-off before the next attempt, in ms"""
+        return min(RETRY_MAX, RETRY_INITIAL << min(self.attempts, 16))
+
+    def _schedule_retry(self, delay):
+        self._retry_timer.start(delay)
+        self._set_state(STATE_RECONNECTING, f"{self._lost_reason} - retrying in {delay / 1000:g} s")
+
+    def _retry(self):
+        self.attempts += 1
+        attempts = self.attempts
+        try:
+            if self._reconnect():
+                QtCore.qDebug(f"SpaceMouse reconnected after {attempts} attempt(s)")
+                return  # started() has reset the state
+        except Exception as e:
+            self.log.log(f"Error reconnecting SpaceMouse: {e}")
+        self._schedule_retry(max(self._retry_timer.interval(), self.retry_delay()))
+
+    def _set_state(self, state, message):
+        changed = state != self.state
+        self.state = state
+        self.message = message
+        if changed and state in (STATE_RECONNECTING, STATE_FAILED):
+            QtCore.qWarning(f"SpaceMouse {state}: {message}")
+        self.state_changed.emit(state, message)
@@ -0,0 +1,69 @@
+# device_monitor.py - Background device enumeration and hotplug detection
+import threading
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from PyQt5 import QtCore
+
+# How often the hotplug watcher re-enumerates devices
+HOTPLUG_INTERVAL = 2000  # ms
+
+class DeviceMonitor(QObject):
+    """Enumerates devices on a worker thread and caches the result.
+
+    HID enumeration can take a long time, so it never runs on the GUI thread:
+    refresh() starts a worker and the list arrives through devices_changed, which
+    Qt delivers on the GUI thread. While watching, the list is re-enumerated every
+    HOTPLUG_INTERVAL and devices_changed is only emitted when it differs.
+    """
+    # Device names as returned by the backend (duplicates for identical devices)
+    devices_changed = pyqtSignal(list)
+
+    def __init__(self, enumerate_devices, parent=None):
+        super().__init__(parent)
+        self._enumerate = enumerate_devices
+        self.devices = None          # Cached result of the last enumeration (None = never enumerated)
+        self._lock = threading.Lock()
+        self._worker = None
+        self._pending = False        # Another refresh was requested while a worker ran
+        self._timer = QTimer()
+        self._timer.timeout.connect(self.refresh)
+
+    def refresh(self, force=False):
+        """Enumerate on a worker thread; force emits even if the list is unchanged"""
+        with self._lock:
+            if self._worker is not None:
+                self._pending = True
+                return
+            self._worker = threading.Thread(target=self._run, args=(force,), name="SpaceMouseEnumerator",
+                                            daemon=True)
+            self._worker.start()
+
+    def start_watching(self):
+        """Begin hotplug detection (enumerates immediately)"""
+        if not self._timer.isActive():
+            self._timer.start(HOTPLUG_INTERVAL)
+            self.refresh(force=True)
+
+    def stop_watching(self):
+        self._timer.stop()
+
+    def is_watching(self):
+        return self._timer.isActive()
+
+    def _run(self, force):
+        """Worker thread body - only touches the cache and emits signals"""
+        while True:
+            try:
+                devices = list(self._enumerate())
+            except Exception as e:
+                QtCore.qWarning(f"Error enumerating SpaceMouse devices: {e}")
+                devices = []
+            changed = devices != self.devices
+            self.devices = devices
+            if changed or force:
+                self.devices_changed.emit(devices)
+            with self._lock:
+                if not self._pending:
+                    self._worker = None
+                    return
+                self._pending = False
+                force = False
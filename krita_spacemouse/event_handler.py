@@ -1,59 +1,91 @@
 # event_handler.py - SpaceMouse canvas control
-from krita import Krita
 from PyQt5 import QtCore
-from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QMdiArea, QScrollBar
+from time import perf_counter_ns
 from .models.spacemouse_adapter import adapter
+from .models.stage_timer import (STAGE_TICK, STAGE_TARGETS, STAGE_READ, STAGE_FILTER,
+                                 STAGE_COMMIT, STAGE_PAN, STAGE_ZOOM, STAGE_ROTATE)
 
 def poll_spacenav(extension):
+    stats = extension.stats
+    tick_start = perf_counter_ns()
+    stats.record_tick_start(tick_start, extension.timer.interval())
     try:
-        window = Krita.instance().activeWindow()
-        if not window or not window.activeView():
-            return
-        
-        # Get the docker from the extension by finding it in the dockers list
-        docker = None
-        dockers = Krita.instance().dockers()
-        for d in dockers:
-            if d.objectName() == "spacenavDocker":
-                docker = d
-                break
-        
-        if not docker:
+        # View and scrollbars come from the target cache - no object-tree walks per tick
+        targets = extension.targets.resolve()
+        t_targets = perf_counter_ns()
+        stats.record(STAGE_TARGETS, t_targets - tick_start)
+        if not targets:
+            extension.scheduler.report_activity(False)
             return
 
-        # Read SpaceMouse data and apply to canvas
+        # Drain samples buffered by the adapter reader thread and apply to canvas (never blocks)
+        moving = False
         try:
-            state = adapter.read_device_state()
-            if state:
-                # Get settings from UI - configuration tab
-                pan_scale = docker.configuration_tab.get_pan_scale() if hasattr(docker, 'configuration_tab') else None
-                zoom_scale = docker.configuration_tab.get_zoom_scale() if hasattr(docker, 'configuration_tab') else None
-                rotation_speed = docker.configuration_tab.get_rotation_speed() if hasattr(docker, 'configuration_tab') else None
-                dead_zone = docker.configuration_tab.get_dead_zone() if hasattr(docker, 'configuration_tab') else None
-                
-                # Skip processing if we can't get configuration values
-                if pan_scale is None or zoom_scale is None or rotation_speed is None or dead_zone is None:
-                    QtCore.qWarning("Configuration tab not available, skipping SpaceMouse processing")
-                    return
-                
-                # Apply dead zone and get processed values - let UI sensitivities handle all scaling
-                x_pan_raw = apply_deadzone(state.x, dead_zone)
-                y_pan_raw = apply_deadzone(state.y, dead_zone) * -1  # Invert Y for natural movement
-                z_zoom_raw = apply_deadzone(state.z, dead_zone)
-                yaw_raw = apply_deadzone(state.yaw, dead_zone)
-                
-                # Only process if there's any movement (apply_deadzone already handles deadzone filtering)
-                if x_pan_raw != 0 or y_pan_raw != 0 or z_zoom_raw != 0 or yaw_raw != 0:
-                    apply_to_canvas(window, x_pan_raw, y_pan_raw, z_zoom_raw, yaw_raw, 
-                                  pan_scale, zoom_scale, rotation_speed)
-                    
+            # Settings snapshot published by the configuration tab (or the defaults)
+            config = extension.motion_config
+            chain = extension.filter_chain
+
+            pan_x = pan_y = zoom = rotation = 0.0
+            input_t = newest_t = 0
+            if chain is not None:
+                # Vectorized pipeline over every sample since the last tick (smoothing, curves, mapping)
+                samples = adapter.read_device_samples()
+                t_read = perf_counter_ns()
+                stats.record(STAGE_READ, t_read - t_targets)
+                if samples:
+                    input_t = samples[0].t
+                    newest_t = samples[-1].t
+                    pan_x, pan_y, zoom, rotation = chain.process(samples)
+            else:
+                state = adapter.read_device_state()
+                t_read = perf_counter_ns()
+                stats.record(STAGE_READ, t_read - t_targets)
+                if state:
+                    input_t = newest_t = state.t
+                    # Curve lookups and the mapping matrix (Y inversion included)
+                    pan_x, pan_y, zoom, rotation = extension.axis_mapping.apply(
+                        (state.x, state.y, state.z, state.roll, state.pitch, state.yaw))
+            # Optional glide: integrate velocity at a fixed timestep, independent of the poll interval
+            inertia = extension.inertia
+            if inertia is not None:
+                moved = inertia.update((pan_x, pan_y, zoom, rotation), tick_start)
+                pan_x, pan_y, zoom, rotation = moved or (0.0, 0.0, 0.0, 0.0)
+            # Optional lead: extrapolate to the expected paint time using the measured tick-to-paint latency
+            predictor = extension.predictor
+            if predictor is not None:
+                pan_x, pan_y, zoom, rotation = predictor.update((pan_x, pan_y, zoom, rotation), newest_t, tick_start)
+            stats.record(STAGE_FILTER, perf_counter_ns() - t_read)
+
+            # Only process if there's any movement (the dead zone already zeroes resting axes)
+            if pan_x != 0 or pan_y != 0 or zoom != 0 or rotation != 0:
+                moving = True
+                # Accumulate in float; the frame pacer applies it at most once per display frame
+                extension.accumulator.add(
+                    -pan_x * config.pan_scale,          # Scrolling moves the canvas the other way
+                    -pan_y * config.pan_scale,
+                    zoom * config.zoom_scale,           # Log-space: in and out are symmetric
+                    rotation * config.rotation_speed,
+                    input_t,
+                )
+                extension.frame_pacer.request_commit()
+            if extension.supervisor.failures:
+                extension.supervisor.report_success()
+
         except Exception as read_error:
-            QtCore.qWarning(f"Error reading SpaceMouse: {read_error}")
+            stats.record_error()
+            # Classified, rate-limited, and suspends polling if the device is gone
+            extension.supervisor.report_error(read_error, "Error reading SpaceMouse")
+
+        # Lets the scheduler back off to the idle rate once the puck rests
+        extension.scheduler.report_activity(moving)
+        tick_end = perf_counter_ns()
+        stats.record(STAGE_TICK, tick_end - tick_start)
+        extension.tracer.span("poll tick", tick_start, tick_end)
 
     except Exception as e:
-        QtCore.qCritical(f"Error in poll_spacenav: {e}")
-        extension.timer.stop()  # Stop on any error
+        stats.record_error()
+        # Tolerated for a few ticks, then polling restarts through the supervisor's reconnect
+        extension.supervisor.report_error(e, "Error in poll_spacenav")
 
 def apply_deadzone(value, deadzone):
     """Apply deadzone to raw input value with smooth scaling"""
@@ -65,100 +97,92 @@ def apply_deadzone(value, deadzone):
     scaled_value = (abs(value) - deadzone) / (1.0 - deadzone)
     return sign * scaled_value
 
-def apply_to_canvas(window, x_pan_raw, y_pan_raw, z_zoom_raw, yaw_raw, pan_scale, zoom_scale, rotation_speed):
-    """Apply movement to the Krita canvas"""
+def commit_motion(extension):
+    """Apply the motion accumulated since the last frame (called by the frame pacer)"""
+    accumulator = extension.accumulator
+    if not accumulator.has_motion():
+        return
+    targets = extension.targets.resolve()
+    if not targets:
+        return
+    input_t = accumulator.input_t
+    dx, dy, zoom, rotation = accumulator.take()
+
+    # One canvas repaint for the combined pan/zoom/rotation delta
+    stats = extension.stats
+    commit_start = perf_counter_ns()
+    if extension.predictor is not None:
+        extension.predictor.commit()
+    batch = extension.transform_batch
+    batch.begin(targets)
     try:
-        view = window.activeView()
-        if not view:
-            return
-            
-        canvas = view.canvas()
-        if not canvas:
-            return
+        apply_to_canvas(targets, dx, dy, zoom, rotation, extension.zoom_state, stats)
+    finally:
+        batch.end()
+        commit_end = perf_counter_ns()
+        stats.record(STAGE_COMMIT, commit_end - commit_start)
+        # Input-to-commit latency; the batch's paint filter closes the input-to-paint span
+        extension.tracer.commit(input_t, commit_start, commit_end)
+
+def apply_to_canvas(targets, dx, dy, zoom, rotation, zoom_state, stats=None):
+    """Apply movement to the Krita canvas, timing each stage when stats are given.
 
+    zoom is a log-space delta integrated into zoom_state (a ZoomState).
+    """
+    try:
         # Apply panning
-        if x_pan_raw != 0 or y_pan_raw != 0:
-            apply_panning(window, x_pan_raw, y_pan_raw, pan_scale)
+        if (dx != 0 or dy != 0) and targets.hscroll is not None:
+            start = perf_counter_ns()
+            apply_panning(targets.hscroll, targets.vscroll, dx, dy)
+            if stats is not None:
+                stats.record(STAGE_PAN, perf_counter_ns() - start)
 
         # Apply zooming
-        if z_zoom_raw != 0:
-            apply_zooming(view, z_zoom_raw, zoom_scale)
+        if zoom != 0.0:
+            start = perf_counter_ns()
+            apply_zooming(targets.view, zoom, zoom_state)
+            if stats is not None:
+                stats.record(STAGE_ZOOM, perf_counter_ns() - start)
 
         # Apply rotation
-        if yaw_raw != 0:
-            apply_rotation(canvas, yaw_raw, rotation_speed)
+        if rotation != 0:
+            start = perf_counter_ns()
+            apply_rotation(targets.canvas, rotation)
+            if stats is not None:
+                stats.record(STAGE_ROTATE, perf_counter_ns() - start)
             
     except Exception as e:
+        if stats is not None:
+            stats.record_error()
         QtCore.qWarning(f"Error applying canvas transformation: {e}")
 
-def apply_panning(window, x_pan_raw, y_pan_raw, pan_scale):
-    """Apply panning movement to the canvas using scroll bars"""
+def apply_panning(hscroll, vscroll, dx, dy):
+    """Apply whole-pixel panning movement to the canvas using scroll bars"""
     try:
-        # Find the scroll bars through MDI area
-        qwin = window.qwindow()
-        subwindow = qwin.findChild(QMdiArea).currentSubWindow()
-        if not subwindow:
-            QtCore.qWarning("No subwindow found for panning")
-            return
-            
-        hscroll = vscroll = None
-        for sb in subwindow.findChildren(QScrollBar):
-            if sb.orientation() == Qt.Horizontal:
-                hscroll = sb
-            elif sb.orientation() == Qt.Vertical:
-                vscroll = sb
-                
-        if hscroll and vscroll:
-            # Use direct pan scale from UI
-            dx = int(-x_pan_raw * pan_scale)  # Inverted horizontal
-            dy = int(-y_pan_raw * pan_scale)  # Inverted vertical
-            
-            # Apply panning via scroll bars
-            hscroll.setValue(hscroll.value() + dx)
-            vscroll.setValue(vscroll.value() + dy)
-        else:
-            QtCore.qWarning("Scrollbars not found")
-            
+        # Apply panning via scroll bars
+        hscroll.setValue(hscroll.value() + dx)
+        vscroll.setValue(vscroll.value() + dy)
+
     except Exception as e:
         QtCore.qWarning(f"Error applying panning: {e}")
 
-def apply_zooming(view, z_zoom_raw, zoom_scale):
-    """Apply zooming to the canvas with DPI correction"""
+def apply_zooming(view, zoom, zoom_state):
+    """Add a log-space zoom delta to the locally held zoom and write it to the canvas"""
     try:
-        # Get current zoom level - account for DPI scaling bug in Krita
-        canvas_zoom_raw = view.canvas().zoomLevel()
-        
-        # Get document DPI to calculate actual zoom percentage
-        document = Krita.instance().activeDocument()
-        doc_dpi = document.resolution()  # Document DPI
-        baseline_dpi = 72.0  # Krita's baseline DPI for zoom calculations
-        dpi_factor = doc_dpi / baseline_dpi
-        
-        # Calculate actual UI zoom percentage (correct for DPI bug in reading)
-        actual_zoom_percent = (canvas_zoom_raw / dpi_factor) * 100
-                
-        # Use direct zoom scale from UI
-        zoom_factor = 1.0 + (z_zoom_raw * zoom_scale)
-        
-        # Apply zoom factor to actual zoom percentage
-        new_actual_percent = actual_zoom_percent * zoom_factor
-        
-        # Only apply zoom if the change is significant enough
-        new_zoom_decimal = max(5.0, min(3200.0, new_actual_percent)) / 100.0
-        
-        # Set the new zoom level (no DPI conversion needed for setZoomLevel)
-        view.canvas().setZoomLevel(new_zoom_decimal)
-        
+        now = perf_counter_ns()
+        # Reads zoom and DPI from Krita only when the view changes or a new gesture starts
+        zoom_state.sync(view, now)
+        view.canvas().setZoomLevel(zoom_state.step(zoom, now))
+
     except Exception as zoom_error:
-        QtCore.qDebug(f"Zoom error: {zoom_error}")
+        zoom_state.invalidate()
         QtCore.qWarning(f"Error with smooth zoom: {zoom_error}")
 
-def apply_rotation(canvas, yaw_raw, rotation_speed):
-    """Apply rotation to the canvas"""
+def apply_rotation(canvas, rotation):
+    """Apply a rotation delta in degrees to the canvas"""
     try:
         current_rotation = canvas.rotation()
-        # Use direct rotation speed from UI
-        new_rotation = (current_rotation + (yaw_raw * rotation_speed)) % 360
+        new_rotation = (current_rotation + rotation) % 360
         canvas.setRotation(new_rotation)
         
     except Exception as e:
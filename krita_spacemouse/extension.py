@@ -1,23 +1,77 @@
 # extension.py - Main SpaceMouse extension controller
-from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QMessageBox, QDockWidget
 from PyQt5 import QtCore
 from krita import Extension, Krita, DockWidgetFactory, DockWidgetFactoryBase
-from .models.spacemouse_adapter import adapter
-from .event_handler import poll_spacenav
+from .models.spacemouse_adapter import adapter, BUTTON_EVENT
+from .event_handler import poll_spacenav, commit_motion
+from .navigation_targets import NavigationTargetCache
+from .models.motion_config import DEFAULT_MOTION_CONFIG
+from .poll_scheduler import PollScheduler
+from .frame_pacer import FramePacer
+from .transform_batch import TransformBatch
+from .models.motion_accumulator import MotionAccumulator
+from .models.zoom_state import ZoomState
+from .models.inertia import InertialMotion
+from .models.predictor import MotionPredictor
+from .models.axis_mapping import build_axis_mapping, mapping_key
+from .models.backends.replay_backend import ReplayBackend
+from .models.stage_timer import HotPathStats
+from .models.latency_tracer import LatencyTracer
+from .button_handler import ButtonDispatcher
+from .device_monitor import DeviceMonitor
+from .connection_supervisor import ConnectionSupervisor
+from .profile_manager import ProfileManager
 
 class SpacenavControlExtension(Extension):
     def __init__(self, parent):
         super().__init__(parent)
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.timer_event_handler)
+        # Adaptive scheduler owns the poll timer; self.timer kept for direct access
+        self.scheduler = PollScheduler(self.timer_event_handler)
+        self.timer = self.scheduler.timer
         self.docker = None
+        # Resolved docker/view/scrollbar targets shared by every poll tick
+        self.targets = NavigationTargetCache()
+        # Sub-pixel motion carried between ticks, applied at most once per display frame
+        self.accumulator = MotionAccumulator()
+        self.frame_pacer = FramePacer(self.frame_event_handler)
+        self.transform_batch = TransformBatch()
+        # Zoom held locally in log space; Krita is read back only at gesture start
+        self.zoom_state = ZoomState()
+        # Per-stage timing histograms shown in the Diagnostics tab
+        self.stats = HotPathStats()
+        # Opt-in motion-to-photon tracer (Chrome trace export from the Diagnostics tab)
+        self.tracer = LatencyTracer()
+        self.transform_batch.tracer = self.tracer
+        adapter.tracer = self.tracer
+        # Button bindings, dispatched from the reader thread's wake-up rather than the poll tick
+        self.buttons = ButtonDispatcher()
+        # Cached, worker-thread device enumeration with hotplug detection
+        self.devices = DeviceMonitor(adapter.list_devices)
+        self.devices.devices_changed.connect(self._on_devices_changed)
+        self._known_device = None    # (name, number) of the last device connected by the user
+        # Classifies tick errors, rate-limits their logging and reconnects a lost device with back-off
+        self.supervisor = ConnectionSupervisor(self._stop_polling, self._reconnect)
+        # Named profiles, switched by document and tool; saved off the GUI thread
+        self.profiles = ProfileManager()
+        self.profiles.profile_changed.connect(self._on_profile_changed)
+        # Motion settings snapshot of the active profile, replaced wholesale on every change
+        self.motion_config = None
+        self.filter_chain = None
+        self.axis_mapping = None         # Response curve tables and mapping matrix, built with the chain
+        self._filter_chain_stale = True  # Built on connect, so NumPy is not imported at Krita startup
+        self.inertia = None              # InertialMotion when inertial glide is enabled
+        self.predictor = None            # MotionPredictor when latency prediction is enabled
+        self.settings_loaded = False     # Saved settings are read on first connect or when the configuration tab opens
+        self.set_motion_config(DEFAULT_MOTION_CONFIG)
 
     def setup(self):
         # Create factory function that captures extension reference
         def create_spacenav_docker():
             from .views.docker import SpacenavDocker
-            return SpacenavDocker(self)
+            docker = SpacenavDocker(self)
+            self.docker = docker
+            self.targets.set_docker(docker)
+            return docker
         
         # Create and register factory
         Krita.instance().addDockWidgetFactory(
@@ -31,8 +85,65 @@ class SpacenavControlExtension(Extension):
     def timer_event_handler(self):
         poll_spacenav(self)
 
+    def frame_event_handler(self):
+        commit_motion(self)
+
+    def set_motion_config(self, config):
+        """Publish a new settings snapshot to the poll loop and the scheduler"""
+        previous = self.motion_config
+        self.motion_config = config
+        if previous is None or (previous.smoothing_mode, previous.smoothing, mapping_key(previous)) != (
+                config.smoothing_mode, config.smoothing, mapping_key(config)):
+            # Curve tables are rebuilt and filter state restarts only when a filter parameter actually changed
+            self._filter_chain_stale = True
+            if self.scheduler.isActive():
+                self._build_filter_chain()
+        if not config.inertia_enabled:
+            self.inertia = None
+        elif self.inertia is None:
+            self.inertia = InertialMotion(config.inertia, config.damping)
+        else:
+            self.inertia.configure(config.inertia, config.damping)
+        if not config.prediction_enabled:
+            self.predictor = None
+        elif self.predictor is None:
+            self.predictor = MotionPredictor(config.prediction_model, config.prediction)
+        else:
+            self.predictor.configure(config.prediction_model, config.prediction)
+        self.transform_batch.latency_probe = self.predictor
+        self.scheduler.configure(config.poll_rate, config.idle_timeout, config.adaptive_polling)
+        self.transform_batch.enabled = config.batch_transforms
+
+    def _build_filter_chain(self):
+        from .models.input_filters import build_filter_chain
+        self.axis_mapping = build_axis_mapping(self.motion_config)
+        self.filter_chain = build_filter_chain(self.motion_config, self.axis_mapping)
+        self._filter_chain_stale = False
+
+    def load_saved_settings(self):
+        """Apply the settings file once, unless the configuration tab already published its state"""
+        if self.settings_loaded:
+            return
+        self.settings_loaded = True
+        try:
+            # Publishes the active profile's config through profile_changed
+            bindings = self.profiles.load()
+        except Exception as e:
+            QtCore.qWarning(f"Failed to load SpaceMouse settings: {e}")
+            return
+        if bindings:
+            self.buttons.set_bindings(bindings)
+
+    def _on_profile_changed(self, name):
+        self.set_motion_config(self.profiles.active_config)
+
+    def set_button_bindings(self, bindings):
+        """Compile trigger -> Krita action name bindings into the dispatch table and persist them"""
+        self.buttons.set_bindings(bindings)
+        self.profiles.set_bindings(bindings)
+
     def get_available_devices(self):
-        """Get list of available SpaceMouse devices from model"""
+        """Get list of available SpaceMouse devices from model (blocking; prefer self.devices)"""
         try:
             return adapter.list_devices()
         except Exception as e:
@@ -41,28 +152,113 @@ class SpacenavControlExtension(Extension):
 
     def connect(self, device_name, device_number=0):
         # Connect to SpaceMouse device using device name and number
+        self.load_saved_settings()
         result = adapter.open_device(device_number, device_name)
         if result == -1:
             QMessageBox.warning(None, "SpaceMouse Error", f"No SpaceMouse device found: {device_name} (#{device_number}).")
             return
+        self._known_device = (device_name, device_number)
+        # Hotplug detection follows the connected device even while the docker is hidden
+        self.devices.start_watching()
+        self._start_polling()
 
-        # Get poll rate from docker if available, otherwise use default
-        poll_rate = 30  # Default fallback
-        try:
-            dockers = Krita.instance().dockers()
-            for docker in dockers:
-                if docker.objectName() == "spacenavDocker" and hasattr(docker, 'configuration_tab'):
-                    poll_rate = docker.configuration_tab.get_poll_rate()
-                    break
-        except Exception as e:
-            QtCore.qDebug(f"Could not get poll rate from docker, using default: {e}")
-        
-        self.timer.start(poll_rate)
+    def add_device(self, device_name, device_number=0):
+        """Open another device merged into the navigation stream; returns its slot or -1"""
+        slot = adapter.add_device(device_number, device_name)
+        if slot == -1:
+            QMessageBox.warning(None, "SpaceMouse Error", f"Could not add SpaceMouse device: {device_name} (#{device_number}).")
+        return slot
+
+    def set_out_of_process(self, enabled):
+        """Read the device in a separate Python process (takes effect on the next connect)"""
+        adapter.set_process_mode(enabled)
+
+    def set_combine_rule(self, rule):
+        """Select how several connected devices are merged (device_merge.COMBINE_*)"""
+        adapter.set_combine_rule(rule)
+
+    def connect_replay(self, path, realtime=True):
+        """Drive navigation from a recorded input file instead of a device"""
+        self._known_device = None
+        self.load_saved_settings()
+        adapter.set_backend(ReplayBackend(path, realtime))
+        result = adapter.open_device()
+        if result == -1:
+            adapter.restore_default_backend()
+            QMessageBox.warning(None, "SpaceMouse Error", f"Could not replay recording: {path}")
+            return False
+        self._start_polling()
+        return True
+
+    def start_recording(self, path):
+        adapter.start_recording(path)
+
+    def stop_recording(self):
+        return adapter.stop_recording()
+
+    def _start_polling(self):
+        # Poll rate from the published settings snapshot (defaults if no docker exists yet)
+        adapter.set_motion_callback(self.scheduler.notify_motion)
+        # Only button events are consumed as events; motion is read from the sample ring
+        adapter.set_event_mask(BUTTON_EVENT)
+        adapter.set_button_callback(self.buttons.notify)
+        self.buttons.reset()
+        self.accumulator.reset()
+        self.zoom_state.invalidate()
+        if self._filter_chain_stale:
+            self._build_filter_chain()
+        elif self.filter_chain is not None:
+            self.filter_chain.reset()
+        if self.inertia is not None:
+            self.inertia.reset()
+        if self.predictor is not None:
+            self.predictor.reset()
+        self.frame_pacer.update_refresh_rate()
+        self.stats.break_tick_sequence()
+        self.scheduler.start(self.motion_config.poll_rate)
+        self.supervisor.started(reconnectable=self._known_device is not None)
+
+    def _reconnect(self):
+        """Supervisor retry: reopen the known device and resume polling; returns True on success"""
+        device_name, device_number = self._known_device
+        if adapter.open_device(device_number, device_name) != 0:
+            return False
+        self._start_polling()
+        return True
+
+    def _on_devices_changed(self, devices):
+        """Hotplug: release an unplugged device and reconnect it as soon as it returns"""
+        if self._known_device is None:
+            return
+        device_name, device_number = self._known_device
+        if device_name is None:
+            present = len(devices) > device_number
+        else:
+            present = devices.count(device_name) > device_number
+        if not present and not self.supervisor.waiting:
+            self.supervisor.device_lost(f"{device_name} unplugged")
+        elif present and self.supervisor.waiting:
+            self.supervisor.retry_now()
 
     def disconnect(self):
-        if self.timer.isActive():
-            self.timer.stop()
+        # User-initiated: forget the device and stop hotplug enumeration until the next connect
+        self._known_device = None
+        self.devices.stop_watching()
+        self.supervisor.stopped()
+        self._stop_polling()
+
+    def _stop_polling(self):
+        self.scheduler.stop()
+        self.frame_pacer.cancel()
+        self.accumulator.reset()
+        adapter.set_motion_callback(None)
+        adapter.set_button_callback(None)
+        self.buttons.reset()
         adapter.close_device()
+        adapter.restore_default_backend()
+        self.targets.invalidate()
+        self.zoom_state.invalidate()
 
     def stop(self):
         self.disconnect()
+        self.profiles.flush()
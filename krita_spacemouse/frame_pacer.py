@@ -0,0 +1,57 @@
+# frame_pacer.py - Commits accumulated canvas motion at most once per display frame
+import math
+import time
+from PyQt5.QtCore import QObject, QTimer, Qt
+from PyQt5.QtGui import QGuiApplication
+
+# Used when the screen does not report a refresh rate
+DEFAULT_REFRESH_RATE = 60.0
+
+class FramePacer(QObject):
+    """Rate-limits canvas commits to the screen refresh rate.
+
+    Poll ticks call request_commit() as often as they like. The first request after a
+    frame interval has elapsed commits immediately; requests inside the interval arm a
+    single-shot precise timer for the start of the next frame, so the poll rate and
+    the redraw rate are independent.
+    """
+    def __init__(self, commit_callback, parent=None):
+        super().__init__(parent)
+        self._commit_callback = commit_callback
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._commit)
+        self._last_commit = 0.0
+        self.frame_interval = 1.0 / DEFAULT_REFRESH_RATE
+
+    def update_refresh_rate(self):
+        """Read the primary screen refresh rate and use it as the frame interval"""
+        rate = 0.0
+        app = QGuiApplication.instance()
+        if app is not None:
+            screen = app.primaryScreen()
+            if screen is not None:
+                rate = screen.refreshRate()
+        if rate <= 0:
+            rate = DEFAULT_REFRESH_RATE
+        self.frame_interval = 1.0 / rate
+        return rate
+
+    def request_commit(self):
+        """Commit now if a frame interval has passed, otherwise at the next frame"""
+        if self._timer.isActive():
+            return  # Already scheduled for the next frame
+        remaining = self._last_commit + self.frame_interval - time.perf_counter()
+        if remaining <= 0:
+            self._commit()
+        else:
+            self._timer.start(max(1, math.ceil(remaining * 1000)))
+
+    def cancel(self):
+        """Drop a pending commit"""
+        self._timer.stop()
+
+    def _commit(self):
+        self._last_commit = time.perf_counter()
+        self._commit_callback()
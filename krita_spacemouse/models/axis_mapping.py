@@ -0,0 +1,156 @@
+"""
+Per-axis response curves and the axis-to-action mapping matrix.
+Each device axis (x, y, z, roll, pitch, yaw) goes through its own response curve
+(dead zone, then expo), precomputed into a lookup table, so shaping is an indexed
+read. The curved axes are then mixed by a 6 x 6 matrix into the output channels.
+Rows are outputs and columns device axes, so one matrix expresses remapping,
+inversion and cross-coupling. Outputs 0-3 drive pan x, pan y, zoom and rotation;
+outputs 4 and 5 are not bound to a canvas action yet.
+
+AxisMapping is rebuilt only when its settings change. This module is pure Python;
+input_filters turns the same tables into NumPy arrays for the vectorized chain.
+"""
+
+AXIS_NAMES = ("X", "Y", "Z", "Roll", "Pitch", "Yaw")
+OUTPUT_NAMES = ("Pan X", "Pan Y", "Zoom", "Rotate")
+OUTPUT_PAN_X = 0
+OUTPUT_PAN_Y = 1
+OUTPUT_ZOOM = 2
+OUTPUT_ROTATE = 3
+
+# Lookup table resolution over [-LUT_RANGE, LUT_RANGE]; odd, so 0.0 has its own entry.
+# Some devices report a little past full scale, hence the range above 1.
+LUT_SIZE = 4097
+LUT_RANGE = 1.5
+LUT_SCALE = (LUT_SIZE - 1) / (2.0 * LUT_RANGE)
+LUT_CENTER = (LUT_SIZE - 1) // 2
+
+# Largest dead zone a curve accepts; a larger one would leave no live range
+MAX_DEAD_ZONE = 0.95
+
+def clamp_curve(dead_zone, expo):
+    """Dead zone limited to [0, MAX_DEAD_ZONE] and expo to [0, 1] (NaN becomes 0)"""
+    dead_zone = min(dead_zone, MAX_DEAD_ZONE) if dead_zone > 0.0 else 0.0
+    expo = min(expo, 1.0) if expo > 0.0 else 0.0
+    return dead_zone, expo
+
+def _matrix(*entries):
+    """6 x 6 matrix from (output, axis, coefficient) entries"""
+    rows = [[0.0] * 6 for _ in range(6)]
+    for output, axis, coefficient in entries:
+        rows[output][axis] = coefficient
+    return tuple(tuple(row) for row in rows)
+
+# x pans right, y pans up (hence the inversion), z zooms and yaw rotates; roll and pitch unused
+STANDARD_MATRIX = _matrix((OUTPUT_PAN_X, 0, 1.0), (OUTPUT_PAN_Y, 1, -1.0), (OUTPUT_ZOOM, 2, 1.0),
+                          (OUTPUT_ROTATE, 5, 1.0))
+# Tilting the cap pans as well, for panning without sliding the cap
+TILT_PAN_MATRIX = _matrix((OUTPUT_PAN_X, 0, 1.0), (OUTPUT_PAN_X, 3, 1.0), (OUTPUT_PAN_Y, 1, -1.0),
+                          (OUTPUT_PAN_Y, 4, 1.0), (OUTPUT_ZOOM, 2, 1.0), (OUTPUT_ROTATE, 5, 1.0))
+# Roll rotates the canvas instead of yaw
+ROLL_ROTATE_MATRIX = _matrix((OUTPUT_PAN_X, 0, 1.0), (OUTPUT_PAN_Y, 1, -1.0), (OUTPUT_ZOOM, 2, 1.0),
+                             (OUTPUT_ROTATE, 3, 1.0))
+
+MAPPING_PRESETS = (
+    ("Standard", STANDARD_MATRIX),
+    ("Tilt to Pan", TILT_PAN_MATRIX),
+    ("Roll to Rotate", ROLL_ROTATE_MATRIX),
+)
+
+def format_matrix(matrix):
+    """Settings-file form: rows separated by ';', coefficients by ','"""
+    return ";".join(",".join(f"{value:g}" for value in row) for row in matrix)
+
+def parse_matrix(text):
+    """Inverse of format_matrix; the standard matrix for empty or malformed text"""
+    try:
+        rows = tuple(tuple(float(value) for value in row.split(",")) for row in text.split(";"))
+    except (AttributeError, ValueError):
+        return STANDARD_MATRIX
+    if len(rows) != 6 or any(len(row) != 6 for row in rows):
+        return STANDARD_MATRIX
+    return rows
+
+def format_axis_values(values):
+    """Settings-file form of optional per-axis values: blanks use the global setting"""
+    return ",".join("" if value is None else f"{value:g}" for value in values)
+
+def parse_axis_values(text):
+    """Inverse of format_axis_values; six Nones for empty or malformed text"""
+    parts = text.split(",") if isinstance(text, str) else []
+    if len(parts) != 6:
+        return (None,) * 6
+    try:
+        return tuple(float(part) if part.strip() else None for part in parts)
+    except ValueError:
+        return (None,) * 6
+
+def build_curve_lut(dead_zone, expo):
+    """Dead zone (rescaled to the full range) followed by the linear/cubic expo blend"""
+    dead_zone, expo = clamp_curve(dead_zone, expo)
+    table = []
+    live = 1.0 - dead_zone
+    if live <= 0.0:
+        return [0.0] * LUT_SIZE
+    for index in range(LUT_SIZE):
+        value = (index - LUT_CENTER) / LUT_SCALE
+        magnitude = abs(value) - dead_zone
+        if magnitude <= 0.0:
+            table.append(0.0)
+            continue
+        shaped = magnitude / live
+        if value < 0.0:
+            shaped = -shaped
+        table.append(shaped * (1.0 - expo) + shaped * shaped * shaped * expo)
+    return table
+
+class AxisMapping:
+    """Precompiled curves and matrix for one MotionConfig"""
+    __slots__ = ('matrix', 'luts', 'rows', 'used_axes', '_curved')
+
+    def __init__(self, matrix, dead_zones, expos):
+        self.matrix = matrix
+        # Axes with identical curve settings share one table
+        tables = {}
+        self.luts = []
+        for dead_zone, expo in zip(dead_zones, expos):
+            key = (dead_zone, expo)
+            if key not in tables:
+                tables[key] = build_curve_lut(dead_zone, expo)
+            self.luts.append(tables[key])
+        # Sparse rows: only the non-zero coefficients of each used output
+        self.rows = tuple(tuple((axis, coefficient) for axis, coefficient in enumerate(row) if coefficient)
+                          for row in matrix[:len(OUTPUT_NAMES)])
+        # Axes that no used output reads are not looked up at all
+        self.used_axes = tuple(sorted({axis for row in self.rows for axis, coefficient in row}))
+        self._curved = [0.0] * 6
+
+    def apply(self, axes):
+        """Curve and mix six axis values; returns the (pan x, pan y, zoom, rotation) outputs"""
+        luts = self.luts
+        curved = self._curved
+        for axis in self.used_axes:
+            value = axes[axis]
+            if -LUT_RANGE <= value <= LUT_RANGE:
+                index = int((value + LUT_RANGE) * LUT_SCALE + 0.5)
+            else:
+                # Saturate past the table (infinities included); NaN reads as rest
+                index = LUT_SIZE - 1 if value > 0.0 else 0 if value < 0.0 else LUT_CENTER
+            curved[axis] = luts[axis][index]
+        outputs = []
+        for row in self.rows:
+            total = 0.0
+            for axis, coefficient in row:
+                total += curved[axis] * coefficient
+            outputs.append(total)
+        return outputs
+
+def build_axis_mapping(config):
+    """AxisMapping for a MotionConfig; per-axis curve settings fall back to the global ones"""
+    dead_zones = tuple(config.dead_zone if value is None else value for value in config.axis_dead_zones)
+    expos = tuple(config.expo if value is None else value for value in config.axis_expo)
+    return AxisMapping(config.axis_matrix, dead_zones, expos)
+
+def mapping_key(config):
+    """The MotionConfig fields an AxisMapping depends on"""
+    return (config.dead_zone, config.expo, config.axis_dead_zones, config.axis_expo, config.axis_matrix)
@@ -0,0 +1,36 @@
+# models/backends - device backends behind SpaceMouseAdapter
+import os
+import sys
+
+SPNAV_SOCKET = "/var/run/spnav.sock"
+
+def default_backend_class():
+    """spacenavd when its daemon is running, else native HID on Linux, spacenavigator (pywinusb) elsewhere"""
+    if os.name == "posix" and os.path.exists(SPNAV_SOCKET):
+        # spacenavd grabs the device, so reading evdev/hidraw directly would see nothing
+        from .spacenavd_backend import SpacenavdBackend
+        return SpacenavdBackend
+    if sys.platform.startswith("linux"):
+        from .linux_hid_backend import LinuxHidBackend
+        return LinuxHidBackend
+    from .spacenavigator_backend import SpacenavigatorBackend
+    return SpacenavigatorBackend
+
+def create_default_backend():
+    return default_backend_class()()
+
+def backend_class(name):
+    """Backend class by its name attribute (used by the device process)"""
+    if name == "spacenavd":
+        from .spacenavd_backend import SpacenavdBackend
+        return SpacenavdBackend
+    if name == "linux-hid":
+        from .linux_hid_backend import LinuxHidBackend
+        return LinuxHidBackend
+    if name == "replay":
+        from .replay_backend import ReplayBackend
+        return ReplayBackend
+    if name == "spacenavigator":
+        from .spacenavigator_backend import SpacenavigatorBackend
+        return SpacenavigatorBackend
+    raise ValueError(f"Unknown SpaceMouse backend: {name}")
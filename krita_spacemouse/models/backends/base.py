@@ -0,0 +1,40 @@
+"""
+Interface every device backend behind SpaceMouseAdapter implements.
+"""
+
+class DeviceBackend:
+    """One device source read by a DeviceReader thread.
+
+    read() must never block for long and treats an unchanged t as "no new
+    report". States have the layout (t, x, y, z, roll, pitch, yaw, buttons) with
+    axes normalised to about [-1, 1] and spacenavigator's axis conventions.
+
+    Polled backends are read about once per millisecond. Event-driven backends
+    set event_driven and implement wait(), which the reader calls between reads
+    to block until data arrives.
+    """
+    name = "backend"
+    event_driven = False
+
+    def open(self, device_number=0, device_name=None):
+        """Open the device; returns a truthy handle on success, None if not found"""
+        raise NotImplementedError
+
+    def close(self):
+        raise NotImplementedError
+
+    def read(self):
+        """Latest device state or None"""
+        raise NotImplementedError
+
+    def wait(self, timeout):
+        """Block until data is readable or timeout (seconds) passes (event-driven backends)"""
+        raise NotImplementedError
+
+    def list_devices(self):
+        """Names of the devices this backend can open (duplicates for identical devices)"""
+        return []
+
+    def options(self):
+        """Constructor keyword arguments (JSON types) that recreate this backend in the device process"""
+        return {}
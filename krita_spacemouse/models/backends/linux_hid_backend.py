@@ -0,0 +1,269 @@
+"""
+Native Linux device backend reading evdev (/dev/input/event*) or hidraw (/dev/hidraw*).
+The device is opened non-blocking; the reader blocks in wait() on a selector (epoll)
+and read() drains every pending report. Reports are read into one reused bytearray
+and decoded in place through a memoryview with precompiled struct.Struct objects.
+Any path can be given instead of a discovered device, so a FIFO or a file of
+recorded reports can stand in for one.
+"""
+
+import os
+import selectors
+import stat
+import struct
+from time import perf_counter_ns, sleep
+from .base import DeviceBackend
+from ..sample_ring import DeviceSample
+
+PROTOCOL_EVDEV = "evdev"
+PROTOCOL_HIDRAW = "hidraw"
+
+# Vendors of 3Dconnexion devices (Logitech-era ids are limited to the 3Dconnexion product range)
+VENDOR_3DCONNEXION = 0x256f
+VENDOR_LOGITECH = 0x046d
+LOGITECH_PRODUCTS = range(0xc603, 0xc640)
+
+# Raw axis range of the HID reports, as spacenavigator scales them
+AXIS_SCALE = 350.0
+
+# Native struct input_event: struct timeval, __u16 type, __u16 code, __s32 value
+INPUT_EVENT = struct.Struct("@llHHi")
+EV_SYN = 0x00
+EV_KEY = 0x01
+EV_REL = 0x02
+EV_ABS = 0x03
+SYN_REPORT = 0
+BTN_0 = 0x100
+BTN_MISC_END = 0x120
+
+# hidraw reports: id 1 translation (or all six axes), id 2 rotation, id 3 buttons
+THREE_AXES = struct.Struct("<3h")
+SIX_AXES = struct.Struct("<6h")
+REPORT_TRANSLATION = 1
+REPORT_ROTATION = 2
+REPORT_BUTTONS = 3
+# Report lengths (with id byte) used to frame reports read from a FIFO or file
+REPORT_SIZES = {REPORT_TRANSLATION: 7, REPORT_ROTATION: 7, REPORT_BUTTONS: 3}
+REPORT_SIZES_SIX_AXIS = {REPORT_TRANSLATION: 13, REPORT_BUTTONS: 3}
+
+READ_EVENTS = 64
+MIN_BUTTONS = 2
+
+def _read_text(path):
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+def _is_3dconnexion(vendor, product):
+    return vendor == VENDOR_3DCONNEXION or (vendor == VENDOR_LOGITECH and product in LOGITECH_PRODUCTS)
+
+def discover_devices():
+    """List (name, device path) of 3Dconnexion devices, evdev nodes first, then hidraw"""
+    found = []
+    input_dir = "/sys/class/input"
+    if os.path.isdir(input_dir):
+        for node in sorted(os.listdir(input_dir), key=lambda n: (len(n), n)):
+            if not node.startswith("event"):
+                continue
+            device_dir = os.path.join(input_dir, node, "device")
+            try:
+                vendor = int(_read_text(os.path.join(device_dir, "id", "vendor")), 16)
+                product = int(_read_text(os.path.join(device_dir, "id", "product")), 16)
+            except ValueError:
+                continue
+            if _is_3dconnexion(vendor, product):
+                found.append((_read_text(os.path.join(device_dir, "name")), f"/dev/input/{node}"))
+    if found:
+        return found
+
+    hidraw_dir = "/sys/class/hidraw"
+    if os.path.isdir(hidraw_dir):
+        for node in sorted(os.listdir(hidraw_dir), key=lambda n: (len(n), n)):
+            uevent = dict(line.split("=", 1) for line in
+                          _read_text(os.path.join(hidraw_dir, node, "device", "uevent")).splitlines() if "=" in line)
+            try:
+                _, vendor, product = (int(part, 16) for part in uevent.get("HID_ID", "").split(":"))
+            except ValueError:
+                continue
+            if _is_3dconnexion(vendor, product):
+                found.append((uevent.get("HID_NAME", node), f"/dev/{node}"))
+    return found
+
+class LinuxHidBackend(DeviceBackend):
+    """Reads a SpaceMouse through evdev or hidraw without third-party libraries.
+
+    path overrides discovery (e.g. a FIFO or a recorded report file); protocol is
+    inferred from the path ("event*" is evdev, anything else hidraw) unless given.
+    six_axis selects the single 13-byte report of newer devices when framing
+    hidraw reports from a file.
+    """
+    name = "linux-hid"
+    event_driven = True
+
+    def __init__(self, path=None, protocol=None, six_axis=False):
+        self.path = path
+        self.protocol = protocol
+        self.six_axis = six_axis
+        self._fd = None
+        self._selector = None
+        self._framed = False       # Reports arrive as a byte stream (FIFO/file), not one per read
+        self._buffer = bytearray(INPUT_EVENT.size * READ_EVENTS)
+        self._view = memoryview(self._buffer)
+        self._fill = 0             # Bytes of an incomplete report carried to the next read
+        self._raw = [0] * 6        # x, y, z, rx, ry, rz as reported (HID conventions)
+        self._buttons = 0
+        self._button_count = MIN_BUTTONS
+        self._state = None
+        self._dirty = False
+        self._eof = False          # A FIFO or file has no more data (it stays readable)
+
+    def list_devices(self):
+        return [name for name, path in discover_devices()]
+
+    def options(self):
+        return {"path": self.path, "protocol": self.protocol, "six_axis": self.six_axis}
+
+    def open(self, device_number=0, device_name=None):
+        path = self.path
+        if path is None:
+            matches = [device_path for name, device_path in discover_devices()
+                       if device_name is None or name == device_name]
+            if device_number >= len(matches):
+                return None
+            path = matches[device_number]
+        protocol = self.protocol or (PROTOCOL_EVDEV if os.path.basename(path).startswith("event")
+                                     else PROTOCOL_HIDRAW)
+
+        self._fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+        self._framed = not stat.S_ISCHR(os.fstat(self._fd).st_mode)
+        self._selector = selectors.DefaultSelector()
+        try:
+            self._selector.register(self._fd, selectors.EVENT_READ)
+        except PermissionError:
+            # epoll refuses regular files; they are always readable, so select() works
+            self._selector.close()
+            self._selector = selectors.SelectSelector()
+            self._selector.register(self._fd, selectors.EVENT_READ)
+        self.protocol = protocol
+        self._fill = 0
+        self._raw = [0] * 6
+        self._buttons = 0
+        self._eof = False
+        self._state = DeviceSample(perf_counter_ns(), 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, (0,) * MIN_BUTTONS)
+        return path
+
+    def close(self):
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def fileno(self):
+        return self._fd
+
+    def wait(self, timeout):
+        """Block until a report is readable; returns whether one is"""
+        if self._selector is None or self._eof:
+            # At the end of a FIFO or file select() returns at once, so sleep instead of spinning
+            sleep(timeout)
+            return False
+        return bool(self._selector.select(timeout))
+
+    def read(self):
+        """Drain every pending report without blocking; returns the latest state"""
+        fd = self._fd
+        if fd is None:
+            return None
+        while self._selector.select(0):
+            try:
+                count = os.readv(fd, [self._view[self._fill:]])
+            except BlockingIOError:
+                break
+            if not count:
+                self._eof = True
+                break  # End of a recorded file, or the FIFO writer closed
+            self._eof = False
+            if self.protocol == PROTOCOL_EVDEV:
+                self._parse_evdev(self._fill + count)
+            elif self._framed:
+                self._parse_hidraw_stream(self._fill + count)
+            else:
+                self._parse_hidraw_report(self._view[:count])
+        if self._dirty:
+            self._dirty = False
+            self._state = self._make_state()
+        return self._state
+
+    def _carry(self, used, total):
+        """Move the bytes of an incomplete report to the front of the buffer"""
+        rest = total - used
+        if rest:
+            self._buffer[:rest] = self._buffer[used:total]
+        self._fill = rest
+
+    def _parse_evdev(self, total):
+        used = total - total % INPUT_EVENT.size
+        raw = self._raw
+        for _sec, _usec, event_type, code, value in INPUT_EVENT.iter_unpack(self._view[:used]):
+            if event_type == EV_REL or event_type == EV_ABS:
+                if code < 6:
+                    raw[code] = value
+            elif event_type == EV_KEY:
+                if BTN_0 <= code < BTN_MISC_END:
+                    bit = 1 << (code - BTN_0)
+                    self._buttons = self._buttons | bit if value else self._buttons & ~bit
+            elif event_type == EV_SYN and code == SYN_REPORT:
+                self._dirty = True
+        self._carry(used, total)
+
+    def _parse_hidraw_stream(self, total):
+        sizes = REPORT_SIZES_SIX_AXIS if self.six_axis else REPORT_SIZES
+        view = self._view
+        offset = 0
+        while offset < total:
+            size = sizes.get(view[offset])
+            if size is None:
+                offset = total  # Unknown report id: drop the rest of this chunk
+                break
+            if offset + size > total:
+                break
+            self._parse_hidraw_report(view[offset:offset + size])
+            offset += size
+        self._carry(offset, total)
+
+    def _parse_hidraw_report(self, report):
+        report_id = report[0]
+        raw = self._raw
+        if report_id == REPORT_TRANSLATION:
+            if len(report) >= 1 + SIX_AXES.size:
+                raw[:] = SIX_AXES.unpack_from(report, 1)
+            else:
+                raw[0], raw[1], raw[2] = THREE_AXES.unpack_from(report, 1)
+        elif report_id == REPORT_ROTATION:
+            raw[3], raw[4], raw[5] = THREE_AXES.unpack_from(report, 1)
+        elif report_id == REPORT_BUTTONS:
+            self._buttons = int.from_bytes(report[1:], "little")
+        else:
+            return
+        self._dirty = True
+
+    def _make_state(self):
+        """Build the normalised state with spacenavigator's axis signs"""
+        raw = self._raw
+        buttons = self._buttons
+        if buttons >> self._button_count:
+            self._button_count = buttons.bit_length()
+        return DeviceSample(
+            perf_counter_ns(),
+            raw[0] / AXIS_SCALE,
+            -raw[1] / AXIS_SCALE,
+            -raw[2] / AXIS_SCALE,
+            -raw[4] / AXIS_SCALE,   # roll
+            -raw[3] / AXIS_SCALE,   # pitch
+            raw[5] / AXIS_SCALE,    # yaw
+            tuple((buttons >> index) & 1 for index in range(self._button_count)),
+        )
@@ -0,0 +1,84 @@
+"""
+Device backend that plays back a recording made with SampleRecorder.
+Lets stutter reports be reproduced exactly and benchmarks run without hardware.
+"""
+
+import time
+from ..recorder import Recording
+from ..sample_ring import DeviceSample
+from .base import DeviceBackend
+
+class ReplayBackend(DeviceBackend):
+    """Feeds recorded samples back through the adapter reader thread.
+
+    In real-time mode read() returns the record whose offset from the start of the
+    recording has most recently elapsed, reproducing the original timing. Otherwise
+    every read() advances by one record, replaying as fast as the reader polls.
+    Once a recording that does not loop has ended, read() returns a rest sample
+    (axes at zero, no buttons), so a recording that ends with the puck deflected
+    does not keep the canvas moving.
+    """
+    name = "replay"
+
+    def __init__(self, path, realtime=True, loop=False):
+        self.path = path
+        self.realtime = realtime
+        self.loop = loop
+        self._recording = None
+        self._index = 0
+        self._start = 0
+        self._rest = None
+        self.finished = False
+
+    def open(self, device_number=0, device_name=None):
+        self._recording = Recording(self.path)
+        if not len(self._recording):
+            self.close()
+            return None
+        self._index = 0
+        self._start = time.perf_counter_ns()
+        self.finished = False
+        return self._recording
+
+    def close(self):
+        if self._recording is not None:
+            self._recording.close()
+            self._recording = None
+
+    def read(self):
+        recording = self._recording
+        if recording is None:
+            return None
+        if self.finished:
+            return self._rest
+        count = len(recording)
+
+        if self.realtime:
+            elapsed = time.perf_counter_ns() - self._start
+            origin = recording.timestamp(0)
+            index = self._index
+            # Advance past every record whose recorded offset has elapsed
+            while index + 1 < count and recording.timestamp(index + 1) - origin <= elapsed:
+                index += 1
+            self._index = index
+        else:
+            index = self._index
+            if index + 1 < count:
+                self._index = index + 1
+
+        if index + 1 >= count:
+            # The last record is being returned
+            if self.loop:
+                self._index = 0
+                self._start = time.perf_counter_ns()
+            else:
+                self.finished = True
+                last = recording[count - 1]
+                self._rest = DeviceSample(last.t + 1, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, (0,) * len(last.buttons))
+        return recording[index]
+
+    def list_devices(self):
+        return [f"Replay: {self.path}"]
+
+    def options(self):
+        return {"path": self.path, "realtime": self.realtime, "loop": self.loop}
@@ -0,0 +1,183 @@
+"""
+Device backend talking to the spacenavd daemon over its UNIX socket.
+spacenavd owns the device and pushes events to every connected client, so this
+backend is event-driven: the reader thread blocks in wait() on the socket's
+selector and read() only decodes what has already arrived. If the daemon goes
+away (restart, socket removed) the axes are zeroed and the connection is retried
+in the background; the device stays "open" from the adapter's point of view.
+"""
+
+import os
+import selectors
+import socket
+import struct
+from time import perf_counter_ns, sleep
+from .base import DeviceBackend
+from . import SPNAV_SOCKET
+from ..sample_ring import DeviceSample
+
+# Original spacenavd protocol: every event is eight native int32s
+#   motion:          0, x, y, z, rx, ry, rz, period (ms)
+#   press / release: 1 / 2, button number, unused...
+EVENT = struct.Struct("=8i")
+EVENT_MOTION = 0
+EVENT_PRESS = 1
+EVENT_RELEASE = 2
+
+# spacenavd reports raw HID units (at sensitivity 1) with y, z, ry and rz negated
+AXIS_SCALE = 350.0
+
+READ_EVENTS = 64
+MIN_BUTTONS = 2
+
+# Delay between reconnect attempts after the daemon went away (seconds)
+RECONNECT_INTERVAL = 1.0
+
+class SpacenavdBackend(DeviceBackend):
+    """Reads events from spacenavd; socket_path points at the daemon or a stand-in server"""
+    name = "spacenavd"
+    event_driven = True
+
+    def __init__(self, socket_path=SPNAV_SOCKET):
+        self.socket_path = socket_path
+        self._socket = None
+        self._selector = None
+        self._buffer = bytearray(EVENT.size * READ_EVENTS)
+        self._view = memoryview(self._buffer)
+        self._fill = 0             # Bytes of an incomplete event carried to the next read
+        self._axes = [0] * 6       # x, y, z, rx, ry, rz as sent by spacenavd
+        self._buttons = 0
+        self._button_count = MIN_BUTTONS
+        self._state = None
+        self._dirty = False
+        self._opened = False
+        self._next_connect = 0.0
+        self.reconnects = 0        # Successful reconnects since open()
+
+    def list_devices(self):
+        return ["spacenavd"] if os.path.exists(self.socket_path) else []
+
+    def options(self):
+        return {"socket_path": self.socket_path}
+
+    def open(self, device_number=0, device_name=None):
+        if device_number != 0 or not self._connect():
+            return None
+        self._opened = True
+        self.reconnects = 0
+        self._axes = [0] * 6
+        self._buttons = 0
+        self._state = DeviceSample(perf_counter_ns(), 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, (0,) * MIN_BUTTONS)
+        return self.socket_path
+
+    def close(self):
+        self._opened = False
+        self._disconnect()
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+
+    def fileno(self):
+        return self._socket.fileno() if self._socket is not None else None
+
+    def _connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            return False
+        sock.setblocking(False)
+        self._socket = sock
+        if self._selector is None:
+            self._selector = selectors.DefaultSelector()
+        self._selector.register(sock, selectors.EVENT_READ)
+        self._fill = 0
+        return True
+
+    def _disconnect(self):
+        if self._socket is None:
+            return
+        self._selector.unregister(self._socket)
+        self._socket.close()
+        self._socket = None
+        self._fill = 0
+
+    def _connection_lost(self):
+        """Drop the socket and release every axis and button so motion stops"""
+        self._disconnect()
+        self._axes = [0] * 6
+        self._buttons = 0
+        self._dirty = True
+        self._next_connect = perf_counter_ns() + RECONNECT_INTERVAL * 1e9
+
+    def wait(self, timeout):
+        if self._socket is not None:
+            self._selector.select(timeout)
+            return
+        if not self._opened:
+            return
+        # Disconnected: retry at RECONNECT_INTERVAL, sleeping in between
+        now = perf_counter_ns()
+        if now >= self._next_connect:
+            if self._connect():
+                self.reconnects += 1
+                return
+            self._next_connect = now + RECONNECT_INTERVAL * 1e9
+        sleep(min(timeout, (self._next_connect - now) / 1e9))
+
+    def read(self):
+        """Decode every event that has arrived without blocking; returns the latest state"""
+        sock = self._socket
+        while sock is not None:
+            try:
+                count = sock.recv_into(self._view[self._fill:])
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                self._connection_lost()
+                break
+            if not count:
+                self._connection_lost()  # Daemon closed the connection
+                break
+            self._parse(self._fill + count)
+        if self._dirty:
+            self._dirty = False
+            self._state = self._make_state()
+        return self._state
+
+    def _parse(self, total):
+        used = total - total % EVENT.size
+        axes = self._axes
+        for event in EVENT.iter_unpack(self._view[:used]):
+            kind = event[0]
+            if kind == EVENT_MOTION:
+                axes[:] = event[1:7]
+            elif kind == EVENT_PRESS:
+                self._buttons |= 1 << event[1]
+            elif kind == EVENT_RELEASE:
+                self._buttons &= ~(1 << event[1])
+            else:
+                continue
+            self._dirty = True
+        rest = total - used
+        if rest:
+            self._buffer[:rest] = self._buffer[used:total]
+        self._fill = rest
+
+    def _make_state(self):
+        """Build the normalised state with spacenavigator's axis signs"""
+        axes = self._axes
+        buttons = self._buttons
+        if buttons >> self._button_count:
+            self._button_count = buttons.bit_length()
+        return DeviceSample(
+            perf_counter_ns(),
+            axes[0] / AXIS_SCALE,
+            axes[1] / AXIS_SCALE,
+            axes[2] / AXIS_SCALE,
+            axes[4] / AXIS_SCALE,    # roll
+            -axes[3] / AXIS_SCALE,   # pitch
+            -axes[5] / AXIS_SCALE,   # yaw
+            tuple((buttons >> index) & 1 for index in range(self._button_count)),
+        )
@@ -0,0 +1,49 @@
+"""
+Device backend built on the spacenavigator (pywinusb) library.
+spacenavigator is imported on first use, so Krita's startup never loads pywinusb
+for users who do not connect a device.
+"""
+
+from .base import DeviceBackend
+
+_spacenavigator = None
+
+def _module():
+    """Import spacenavigator on first use"""
+    global _spacenavigator
+    if _spacenavigator is None:
+        import spacenavigator
+        _spacenavigator = spacenavigator
+    return _spacenavigator
+
+class SpacenavigatorBackend(DeviceBackend):
+    """Backend that reads one HID device through spacenavigator.
+
+    spacenavigator's module-level read() only follows the most recently opened
+    device, so each backend reads through the device object open() returned; that
+    lets several backends (one per device) run side by side.
+    """
+    name = "spacenavigator"
+
+    def __init__(self):
+        self._device = None
+
+    def open(self, device_number=0, device_name=None):
+        """Open the device; returns a truthy handle on success"""
+        self._device = _module().open(DeviceNumber=device_number, device=device_name)
+        return self._device
+
+    def close(self):
+        device = self._device
+        self._device = None
+        if device is not None:
+            device.close()
+
+    def read(self):
+        """Latest device state (t, x, y, z, roll, pitch, yaw, buttons) or None"""
+        device = self._device
+        return device.read() if device is not None else None
+
+    def list_devices(self):
+        devices = _module().list_devices()
+        return devices if devices else []
@@ -0,0 +1,75 @@
+"""
+Button mapping for the SpaceMouse plugin.
+Bindings map trigger strings to Krita action names. A trigger is one or more 1-based
+button numbers joined by "+" (a chord), optionally followed by " hold" for a long press:
+"1", "1+2", "2 hold". Bindings are compiled into a table keyed by button bitmask.
+"""
+
+HOLD_SUFFIX = " hold"
+
+# Nothing is bound until the user adds bindings in the configuration tab
+DEFAULT_BUTTON_BINDINGS = {}
+
+def parse_trigger(text):
+    """Parse a trigger string into (button mask, long press); raises ValueError if malformed"""
+    text = text.strip().lower()
+    long_press = text.endswith(HOLD_SUFFIX)
+    if long_press:
+        text = text[:-len(HOLD_SUFFIX)]
+    mask = 0
+    for part in text.split("+"):
+        number = int(part)
+        if number < 1:
+            raise ValueError(f"Button numbers start at 1: {part}")
+        mask |= 1 << (number - 1)
+    return mask, long_press
+
+def format_trigger(mask, long_press=False):
+    """Inverse of parse_trigger"""
+    numbers = [str(bit + 1) for bit in range(mask.bit_length()) if mask >> bit & 1]
+    return "+".join(numbers) + (HOLD_SUFFIX if long_press else "")
+
+class ButtonEntry:
+    """Actions bound to one button mask"""
+    __slots__ = ('press', 'hold', 'deferred')
+
+    def __init__(self):
+        self.press = None      # Action name fired on press (or release, if deferred)
+        self.hold = None       # Action name fired after the long-press delay
+        self.deferred = False  # Wait for release: a hold or a larger chord may still follow
+
+class ButtonDispatchTable:
+    """Bindings compiled to a dict of button mask -> ButtonEntry"""
+    __slots__ = ('entries',)
+
+    def __init__(self, bindings):
+        entries = {}
+        for trigger, action_name in bindings.items():
+            if not action_name:
+                continue
+            try:
+                mask, long_press = parse_trigger(trigger)
+            except ValueError:
+                continue
+            entry = entries.get(mask)
+            if entry is None:
+                entry = entries[mask] = ButtonEntry()
+            if long_press:
+                entry.hold = action_name
+            else:
+                entry.press = action_name
+
+        # A mask must wait for release when it can still grow into a bound chord
+        for mask, entry in entries.items():
+            entry.deferred = entry.hold is not None or any(
+                other != mask and other & mask == mask for other in entries)
+        self.entries = entries
+
+    def lookup(self, mask):
+        return self.entries.get(mask)
+
+    def action_names(self):
+        names = set()
+        for entry in self.entries.values():
+            names.update(name for name in (entry.press, entry.hold) if name)
+        return names
@@ -0,0 +1,96 @@
+"""
+Merging of several SpaceMouse devices into one input stream.
+Readers report each device's latest state; InputMerger combines the latest state of
+every device into a single DeviceSample, so the poll tick still drains one ring and
+runs one filter chain no matter how many devices are connected.
+"""
+
+import threading
+from .sample_ring import DeviceSample
+
+# Combine rules
+COMBINE_SUM = 0         # Add the axes of all devices (clamped to [-1, 1])
+COMBINE_PRIORITY = 1    # The first deflected device (lowest slot) drives every axis
+COMBINE_OWNERSHIP = 2   # Each axis is read from the device that owns it
+
+COMBINE_NAMES = ("Sum", "Priority", "Per-Axis Ownership")
+
+# Default ownership: translation from the primary device, rotation from the second
+DEFAULT_OWNERS = (0, 0, 0, 1, 1, 1)
+
+# Deflection at which a device takes over under COMBINE_PRIORITY
+PRIORITY_THRESHOLD = 0.05
+
+class AxisConfig:
+    """Per-device gain for x, y, z, roll, pitch, yaw (negative inverts, 0 disables)"""
+    __slots__ = ('gains',)
+
+    def __init__(self, gains=(1.0, 1.0, 1.0, 1.0, 1.0, 1.0)):
+        self.gains = tuple(float(gain) for gain in gains)
+
+    def apply(self, state):
+        gains = self.gains
+        return (state.x * gains[0], state.y * gains[1], state.z * gains[2],
+                state.roll * gains[3], state.pitch * gains[4], state.yaw * gains[5])
+
+class InputMerger:
+    """Latest state per device and the rule combining them (called from reader threads)"""
+    def __init__(self, rule=COMBINE_SUM, owners=DEFAULT_OWNERS):
+        self.rule = rule
+        self.owners = tuple(owners)
+        self._axes = {}      # slot -> 6-tuple of axes after AxisConfig
+        self._buttons = {}   # slot -> button tuple
+        self._lock = threading.Lock()
+
+    def configure(self, rule, owners=None):
+        self.rule = rule
+        if owners is not None:
+            self.owners = tuple(owners)
+
+    def remove(self, slot):
+        with self._lock:
+            self._axes.pop(slot, None)
+            self._buttons.pop(slot, None)
+
+    def clear(self):
+        with self._lock:
+            self._axes.clear()
+            self._buttons.clear()
+
+    def update(self, slot, state, axis_config, t):
+        """Store one device's new state and return the merged DeviceSample"""
+        axes = axis_config.apply(state) if axis_config is not None else (
+            state.x, state.y, state.z, state.roll, state.pitch, state.yaw)
+        with self._lock:
+            self._axes[slot] = axes
+            self._buttons[slot] = tuple(state.buttons)
+            slots = sorted(self._axes)
+            merged = self._combine(slots)
+            # Buttons of later devices follow the primary device's buttons
+            buttons = ()
+            for other in slots:
+                buttons += self._buttons[other]
+        return DeviceSample(t, merged[0], merged[1], merged[2], merged[3], merged[4], merged[5], buttons)
+
+    def _combine(self, slots):
+        all_axes = self._axes
+        rule = self.rule
+        if rule == COMBINE_OWNERSHIP:
+            owners = self.owners
+            merged = []
+            for axis in range(6):
+                owned = all_axes.get(owners[axis])
+                merged.append(owned[axis] if owned is not None else 0.0)
+            return merged
+        if rule == COMBINE_PRIORITY:
+            for slot in slots:
+                axes = all_axes[slot]
+                if max(abs(value) for value in axes) > PRIORITY_THRESHOLD:
+                    return axes
+        # COMBINE_SUM, and COMBINE_PRIORITY while every device rests
+        merged = [0.0] * 6
+        for slot in slots:
+            axes = all_axes[slot]
+            for axis in range(6):
+                merged[axis] += axes[axis]
+        return [max(-1.0, min(1.0, value)) for value in merged]
@@ -0,0 +1,119 @@
+"""
+Device process: reads a SpaceMouse backend outside Krita's interpreter.
+Started by ProcessReader with the plugin directory on sys.path, so only the models
+package is imported (no krita or PyQt5):
+
+    python -m models.device_process RING_PATH BACKEND [--options JSON] [--device-number N] [--device-name NAME]
+
+Samples go into the SharedRingWriter on the ring file RING_PATH. Once the device
+is open, and then for the first sample that moves the puck from rest and every
+button change, a NOTIFY record is also written to stdout, which lets Krita wake
+its poll scheduler and dispatch buttons without polling. The process exits when
+stdin closes (Krita stopped the reader or exited).
+"""
+
+import argparse
+import errno
+import json
+import os
+import sys
+import threading
+from time import perf_counter_ns
+from .backends import backend_class
+from .device_reader import READER_INTERVAL, IDLE_BACKOFF_MAX, EVENT_WAIT
+from .recorder import buttons_to_mask
+from .sample_ring import is_deflected
+from .shared_ring import SharedRingWriter, NOTIFY, STATUS_RUNNING, STATUS_ERROR, STATUS_STOPPED
+
+def _watch_stdin(stop):
+    """Stop when the parent closes stdin or dies"""
+    try:
+        while sys.stdin.buffer.read(1):
+            pass
+    except (OSError, ValueError):
+        pass
+    stop.set()
+
+def run(ring, backend, stop, notify):
+    """Reader loop, as DeviceReader's, writing into the shared ring.
+
+    Errors other than would-block or interrupted reads end the process; Krita
+    reads them from the ring header and its supervisor decides whether to restart.
+    """
+    last_t = None
+    resting = True
+    last_mask = 0
+    delay = READER_INTERVAL
+    while not stop.is_set():
+        try:
+            ring.beat(perf_counter_ns())
+            state = backend.read()
+            if state is not None and state.t != last_t:
+                last_t = state.t
+                t = perf_counter_ns()
+                mask = buttons_to_mask(state.buttons)
+                ring.push(t, state.x, state.y, state.z, state.roll, state.pitch, state.yaw,
+                          mask, len(state.buttons))
+                moving = is_deflected(state)
+                if (moving and resting) or mask != last_mask:
+                    notify(NOTIFY.pack(t, state.x, state.y, state.z, state.roll, state.pitch, state.yaw,
+                                       mask, len(state.buttons)))
+                resting = not moving
+                last_mask = mask
+                delay = READER_INTERVAL
+            else:
+                delay = min(delay * 2, IDLE_BACKOFF_MAX)
+            if backend.event_driven:
+                backend.wait(EVENT_WAIT)
+                continue
+        except OSError as e:
+            if e.errno in (errno.EAGAIN, errno.EINTR):
+                stop.wait(READER_INTERVAL)
+                continue
+            raise
+        stop.wait(delay)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SpaceMouse device process")
+    parser.add_argument("ring_path")
+    parser.add_argument("backend")
+    parser.add_argument("--options", default="{}", help="backend constructor arguments as JSON")
+    parser.add_argument("--device-number", type=int, default=0)
+    parser.add_argument("--device-name")
+    args = parser.parse_args(argv)
+
+    ring = SharedRingWriter(args.ring_path)
+    ring.set_pid(os.getpid())
+    out = sys.stdout.buffer
+
+    def notify(record):
+        out.write(record)
+        out.flush()
+
+    backend = None
+    try:
+        backend = backend_class(args.backend)(**json.loads(args.options))
+        if not backend.open(args.device_number, args.device_name):
+            raise OSError(errno.ENODEV, f"No SpaceMouse device found: {args.device_name} (#{args.device_number})")
+        stop = threading.Event()
+        threading.Thread(target=_watch_stdin, args=(stop,), name="SpaceMouseParentWatch", daemon=True).start()
+        ring.beat(perf_counter_ns())
+        ring.set_status(STATUS_RUNNING)
+        # Readiness record: wakes Krita's poll tick, which now finds the ring running
+        notify(NOTIFY.pack(perf_counter_ns(), 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0, 0))
+        run(ring, backend, stop, notify)
+        ring.set_status(STATUS_STOPPED)
+        return 0
+    except BrokenPipeError:
+        ring.set_status(STATUS_STOPPED)  # Krita closed the notification pipe
+        return 0
+    except Exception as e:
+        ring.set_status(STATUS_ERROR, e)
+        return 1
+    finally:
+        if backend is not None:
+            backend.close()
+        ring.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
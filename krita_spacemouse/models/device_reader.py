@@ -0,0 +1,73 @@
+"""
+Background reader for one open SpaceMouse device.
+Each device the adapter opens gets its own DeviceReader thread; readers hand new
+states to the adapter, which merges them into the shared sample ring.
+"""
+
+import threading
+from time import perf_counter_ns
+
+# Reader thread sampling interval in seconds (~1 kHz)
+READER_INTERVAL = 0.001
+
+# While polled reads return nothing new (puck at rest) the interval doubles up to
+# this; it bounds how late motion from rest is seen
+IDLE_BACKOFF_MAX = 0.05
+
+# Longest an event-driven backend blocks waiting for data; bounds stop() latency
+EVENT_WAIT = 0.05
+
+# The pause after a failed read doubles up to this, so a dead device does not spin the thread
+ERROR_BACKOFF_MAX = 0.25
+
+class DeviceReader:
+    """One open backend and the thread that samples it"""
+    def __init__(self, slot, backend, handle, on_sample, on_error, axis_config=None):
+        self.slot = slot                  # Position among the adapter's devices (0 = primary)
+        self.backend = backend
+        self.handle = handle              # Truthy value returned by backend.open
+        self.axis_config = axis_config    # Optional AxisConfig applied before merging
+        self._on_sample = on_sample       # on_sample(reader, state, read_start_ns)
+        self._on_error = on_error
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name=f"SpaceMouseReader-{self.slot}", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the thread and wait for it to exit"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def close(self):
+        self.stop()
+        self.backend.close()
+
+    def _loop(self):
+        """Thread body - never touches Qt objects"""
+        last_t = None
+        delay = READER_INTERVAL
+        while not self._stop.is_set():
+            try:
+                read_start = perf_counter_ns()
+                state = self.backend.read()
+                # Backends update t on every HID report, so unchanged t means no new data
+                if state is not None and state.t != last_t:
+                    last_t = state.t
+                    self._on_sample(self, state, read_start)
+                    delay = READER_INTERVAL
+                else:
+                    delay = min(delay * 2, IDLE_BACKOFF_MAX)
+                if self.backend.event_driven:
+                    self.backend.wait(EVENT_WAIT)
+                    continue
+            except Exception as e:
+                self._on_error(e)
+                delay = min(delay * 2, ERROR_BACKOFF_MAX)
+            self._stop.wait(delay)
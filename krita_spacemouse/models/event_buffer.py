@@ -0,0 +1,147 @@
+"""
+Preallocated, array-backed buffer of SpaceMouse events.
+Events use libspnav's layout: a type code (MOTION_EVENT or BUTTON_EVENT) and a fixed
+row of integers - x, y, z, rx, ry, rz, period for motion, bnum, press for buttons.
+Filling and copying a buffer never creates per-event Python objects.
+"""
+
+from array import array
+
+# Event types (libspnav values)
+MOTION_EVENT = 1
+BUTTON_EVENT = 2
+
+# Integers stored per event row
+EVENT_FIELDS = 7
+
+# Column indices within a row
+FIELD_X, FIELD_Y, FIELD_Z, FIELD_RX, FIELD_RY, FIELD_RZ, FIELD_PERIOD = range(EVENT_FIELDS)
+FIELD_BNUM, FIELD_PRESS = 0, 1
+
+DEFAULT_CAPACITY = 512
+
+class SpaceMouseEventBuffer:
+    """Fixed-capacity queue of events in parallel typed arrays.
+
+    Queued events occupy rows first to first + count - 1. Taking an event from the
+    front only advances first; the rows are moved back to the start of the arrays
+    when an append reaches the end. Every copy is done row by row in the
+    preallocated arrays, so no operation allocates.
+    """
+    __slots__ = ('capacity', 'first', 'count', 'types', 'data', 'dropped')
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.first = 0
+        self.count = 0
+        self.types = array('B', bytes(capacity))
+        self.data = array('i', bytes(4 * capacity * EVENT_FIELDS))
+        self.dropped = 0   # Events discarded because the buffer was full
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.first = 0
+        self.count = 0
+
+    def _move_row(self, source, target):
+        self.types[target] = self.types[source]
+        data = self.data
+        source *= EVENT_FIELDS
+        target *= EVENT_FIELDS
+        for field in range(EVENT_FIELDS):
+            data[target + field] = data[source + field]
+
+    def _free_row(self):
+        """Row index for the next append, or -1 when every row holds an event"""
+        index = self.first + self.count
+        if index < self.capacity:
+            return index
+        if not self.first:
+            return -1
+        # Move the queue back to the start of the arrays
+        for offset in range(self.count):
+            self._move_row(self.first + offset, offset)
+        self.first = 0
+        return self.count
+
+    def append_motion(self, x, y, z, rx, ry, rz, period):
+        """Queue a motion event; when full, the newest queued motion event takes the new state"""
+        index = self._free_row()
+        if index < 0:
+            # Motion is absolute, so replacing the latest state loses nothing but its timing
+            index = self.first + self.count - 1
+            while index >= self.first and self.types[index] != MOTION_EVENT:
+                index -= 1
+            if index < self.first:
+                self.dropped += 1   # Only button events queued
+                return False
+            period += self.data[index * EVENT_FIELDS + FIELD_PERIOD]
+        else:
+            self.types[index] = MOTION_EVENT
+            self.count += 1
+        base = index * EVENT_FIELDS
+        data = self.data
+        data[base] = x
+        data[base + 1] = y
+        data[base + 2] = z
+        data[base + 3] = rx
+        data[base + 4] = ry
+        data[base + 5] = rz
+        data[base + 6] = period
+        return True
+
+    def append_button(self, bnum, press):
+        index = self._free_row()
+        if index < 0:
+            self.dropped += 1
+            return False
+        self.types[index] = BUTTON_EVENT
+        base = index * EVENT_FIELDS
+        self.data[base] = bnum
+        self.data[base + 1] = press
+        self.count += 1
+        return True
+
+    def copy_into(self, target):
+        """Append this buffer's events to target row by row; returns the number copied"""
+        copied = 0
+        types = self.types
+        data = self.data
+        target_types = target.types
+        target_data = target.data
+        for index in range(self.first, self.first + self.count):
+            row = target._free_row()
+            if row < 0:
+                target.dropped += self.count - copied
+                break
+            target_types[row] = types[index]
+            source = index * EVENT_FIELDS
+            row *= EVENT_FIELDS
+            for field in range(EVENT_FIELDS):
+                target_data[row + field] = data[source + field]
+            target.count += 1
+            copied += 1
+        return copied
+
+    def remove_type(self, event_type):
+        """Drop all events of a type, keeping the order of the rest; returns the number removed"""
+        first = self.first
+        kept = first
+        for index in range(first, first + self.count):
+            if self.types[index] == event_type:
+                continue
+            if kept != index:
+                self._move_row(index, kept)
+            kept += 1
+        removed = self.count - (kept - first)
+        self.count = kept - first
+        return removed
+
+    def pop_front(self):
+        """Remove the first event (used by the single-event compatibility API)"""
+        if not self.count:
+            return
+        self.count -= 1
+        self.first = self.first + 1 if self.count else 0
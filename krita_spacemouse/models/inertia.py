@@ -0,0 +1,86 @@
+"""
+Fixed-timestep inertial motion between the filtered input and the canvas.
+Input deflection sets a target velocity that the engine follows with a response
+time constant (inertia); on release the velocity decays at the damping rate until
+it drops below STOP_SPEED and the glide ends. Integration runs in PHYSICS_STEP
+increments of wall time, with the remainder carried to the next tick, so the glide
+looks the same at a 5 ms or a 50 ms poll interval.
+
+Displacements come out in "reference ticks": a full deflection held for
+REFERENCE_TICK seconds yields 1.0, which is what the direct path produces per poll
+tick at the default poll rate, so the existing pan/zoom/rotation scales still apply.
+"""
+
+import math
+
+# Integration step (240 Hz) and the poll interval that displacements are scaled to
+PHYSICS_STEP = 1.0 / 240.0
+REFERENCE_TICK = 0.030
+
+# Velocity (fraction of full deflection) below which a released axis stops
+STOP_SPEED = 0.005
+
+# Longest interval integrated in one tick, e.g. after the scheduler backed off
+MAX_ELAPSED = 0.1
+
+class InertialMotion:
+    """Velocity state for the pan x/y, zoom and rotation axes"""
+    __slots__ = ('follow', 'decay', 'velocity', '_last_t', '_carry')
+
+    def __init__(self, inertia=80, damping=3.0):
+        self.velocity = [0.0, 0.0, 0.0, 0.0]
+        self.configure(inertia, damping)
+        self.reset()
+
+    def configure(self, inertia, damping):
+        """inertia: response time constant in ms (0 follows input instantly); damping: decay rate per second"""
+        self.follow = 1.0 - math.exp(-PHYSICS_STEP * 1000.0 / inertia) if inertia > 0 else 1.0
+        self.decay = math.exp(-damping * PHYSICS_STEP)
+
+    def reset(self):
+        self.velocity[:] = (0.0, 0.0, 0.0, 0.0)
+        self._last_t = None
+        self._carry = 0.0
+
+    @property
+    def active(self):
+        """True while any axis is still moving"""
+        velocity = self.velocity
+        return velocity[0] != 0.0 or velocity[1] != 0.0 or velocity[2] != 0.0 or velocity[3] != 0.0
+
+    def update(self, inputs, now):
+        """Integrate from the previous call to now (perf_counter_ns) holding inputs constant.
+
+        inputs are the four filtered deflections; returns the displacement of each
+        axis in reference ticks, or None when at rest with no input.
+        """
+        if not self.active and not (inputs[0] or inputs[1] or inputs[2] or inputs[3]):
+            self._last_t = now
+            self._carry = 0.0
+            return None
+        elapsed = PHYSICS_STEP if self._last_t is None else (now - self._last_t) * 1e-9
+        self._last_t = now
+        self._carry += min(elapsed, MAX_ELAPSED)
+        steps = int(self._carry / PHYSICS_STEP)
+        self._carry -= steps * PHYSICS_STEP
+
+        follow = self.follow
+        decay = self.decay
+        velocity = self.velocity
+        moved = [0.0, 0.0, 0.0, 0.0]
+        for axis in range(4):
+            target = inputs[axis]
+            v = velocity[axis]
+            distance = 0.0
+            for _ in range(steps):
+                if target != 0.0:
+                    v += (target - v) * follow
+                else:
+                    v *= decay
+                    if -STOP_SPEED < v < STOP_SPEED:
+                        v = 0.0
+                        break
+                distance += v
+            velocity[axis] = v
+            moved[axis] = distance * PHYSICS_STEP / REFERENCE_TICK
+        return moved
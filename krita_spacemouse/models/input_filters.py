@@ -0,0 +1,153 @@
+"""
+Vectorized input filter pipeline for SpaceMouse samples.
+Each tick the samples buffered since the previous tick are stacked into an N x 6
+array (x, y, z, roll, pitch, yaw) and run through a chain of stages. Smoothing
+stages reduce the block to the filtered latest value with closed-form weights,
+so the Python-level work per tick does not grow with the number of samples. The
+last stage applies the response curves and the axis mapping (see axis_mapping).
+
+NumPy is optional: without it build_filter_chain() returns None and the poll loop
+falls back to AxisMapping.apply on the coalesced state.
+"""
+
+import math
+from .axis_mapping import LUT_RANGE, LUT_SCALE, LUT_SIZE, OUTPUT_NAMES
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# x, y, z, roll, pitch, yaw
+AXIS_COUNT = 6
+
+# Smoothing modes (index of the configuration combo box)
+SMOOTHING_OFF = 0
+SMOOTHING_EXPONENTIAL = 1
+SMOOTHING_ONE_EURO = 2
+
+# One-Euro speed coefficient and derivative cutoff (Hz)
+ONE_EURO_BETA = 0.5
+ONE_EURO_D_CUTOFF = 1.0
+
+# Lower bound on sample spacing, guards against duplicate timestamps
+MIN_DT = 1e-4
+
+def _ema_block(y0, values, alphas):
+    """Run y += alpha * (x - y) over all rows at once and return the final y.
+
+    alphas is N x 1 or N x 6. The result equals the sequential recurrence:
+    y_N = prod(1 - a) * y0 + sum_i a_i * prod_{j > i}(1 - a_j) * x_i
+    """
+    decay = 1.0 - alphas
+    # Product of the decays that follow each row (exclusive suffix product)
+    suffix = np.cumprod(decay[::-1], axis=0)[::-1]
+    following = np.ones_like(suffix)
+    following[:-1] = suffix[1:]
+    return suffix[0] * y0 + np.sum(alphas * following * values, axis=0)
+
+class AxisMappingStage:
+    """Per-axis response curves as one table lookup, then the mapping matrix as one multiply.
+
+    Runs last, so the block is usually the single smoothed row. Returns N x 4
+    outputs (pan x, pan y, zoom, rotation).
+    """
+    def __init__(self, mapping):
+        self.luts = np.array(mapping.luts, dtype=np.float64)
+        self.matrix_t = np.array(mapping.matrix, dtype=np.float64)[:len(OUTPUT_NAMES)].T.copy()
+        self._axes = np.arange(AXIS_COUNT)
+
+    def reset(self):
+        pass
+
+    def process(self, values, dts):
+        index = np.rint((values + LUT_RANGE) * LUT_SCALE).astype(np.intp)
+        np.clip(index, 0, LUT_SIZE - 1, out=index)
+        return self.luts[self._axes, index] @ self.matrix_t
+
+class ExponentialSmoothingStage:
+    """Time-constant low-pass filter; reduces the block to its smoothed latest value"""
+    def __init__(self, time_constant):
+        self.time_constant = time_constant
+        self.reset()
+
+    def reset(self):
+        self._y = None
+
+    def process(self, values, dts):
+        if self._y is None:
+            self._y = values[0].copy()
+        alphas = 1.0 - np.exp(-dts / self.time_constant)
+        self._y = _ema_block(self._y, values, alphas[:, None])
+        return self._y[None, :]
+
+class OneEuroStage:
+    """One-Euro filter (Casiez et al.) applied block-wise.
+
+    The speed-dependent cutoff is evaluated once per block from the filtered
+    derivative, then the per-axis low-pass runs over all samples in closed form.
+    Slow motion is smoothed heavily, fast motion passes with little lag.
+    """
+    def __init__(self, min_cutoff, beta=ONE_EURO_BETA, d_cutoff=ONE_EURO_D_CUTOFF):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def reset(self):
+        self._y = None
+        self._dy = np.zeros(AXIS_COUNT)
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        return 1.0 - np.exp(-2.0 * math.pi * cutoff * dt)
+
+    def process(self, values, dts):
+        if self._y is None:
+            self._y = values[0].copy()
+        block_dt = float(np.sum(dts))
+        raw_speed = (values[-1] - self._y) / block_dt
+        self._dy += self._alpha(self.d_cutoff, block_dt) * (raw_speed - self._dy)
+        cutoff = self.min_cutoff + self.beta * np.abs(self._dy)
+        alphas = self._alpha(cutoff[None, :], dts[:, None])
+        self._y = _ema_block(self._y, values, alphas)
+        return self._y[None, :]
+
+class FilterChain:
+    """Ordered list of stages applied to the samples of one tick"""
+    def __init__(self, stages):
+        self.stages = stages
+        self._last_t = None
+
+    def reset(self):
+        self._last_t = None
+        for stage in self.stages:
+            stage.reset()
+
+    def process(self, samples):
+        """Filter a list of DeviceSample and return the resulting (pan x, pan y, zoom, rotation)"""
+        values = np.array([sample[1:7] for sample in samples], dtype=np.float64)
+        # A non-finite reading would index the tables wrongly and stay in the smoothing state for good
+        np.nan_to_num(values, copy=False, nan=0.0, posinf=LUT_RANGE, neginf=-LUT_RANGE)
+        times = np.array([sample[0] for sample in samples], dtype=np.float64) * 1e-9
+        previous = times[0] - MIN_DT if self._last_t is None else self._last_t
+        dts = np.diff(times, prepend=previous)
+        np.maximum(dts, MIN_DT, out=dts)
+        self._last_t = times[-1]
+
+        for stage in self.stages:
+            values = stage.process(values, dts)
+        return values[-1].tolist()
+
+def build_filter_chain(config, mapping):
+    """Build the chain described by a MotionConfig and its AxisMapping, or None if NumPy is unavailable"""
+    if np is None:
+        return None
+    stages = []
+    time_constant = config.smoothing / 1000.0
+    if config.smoothing_mode == SMOOTHING_EXPONENTIAL and time_constant > 0:
+        stages.append(ExponentialSmoothingStage(time_constant))
+    elif config.smoothing_mode == SMOOTHING_ONE_EURO and time_constant > 0:
+        stages.append(OneEuroStage(1.0 / (2.0 * math.pi * time_constant)))
+    stages.append(AxisMappingStage(mapping))
+    return FilterChain(stages)
@@ -0,0 +1,88 @@
+"""
+Opt-in motion-to-photon latency tracer.
+Spans (HID read, poll tick, canvas commit, input-to-commit and input-to-paint) are
+kept in a bounded buffer and written as Chrome trace-event JSON on a worker thread,
+so a session can be loaded into chrome://tracing or Perfetto.
+"""
+
+import json
+import threading
+from collections import deque
+from time import perf_counter_ns
+from PyQt5 import QtCore
+
+DEFAULT_CAPACITY = 100000
+
+# Trace rows (tid in the trace file)
+TRACK_GUI = 1
+TRACK_READER = 2
+TRACK_LATENCY = 3
+TRACK_NAMES = {TRACK_GUI: "GUI thread", TRACK_READER: "HID reader", TRACK_LATENCY: "Motion to photon"}
+
+class LatencyTracer:
+    """Bounded, thread-safe span recorder with Chrome trace export"""
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.enabled = False
+        # deque.append is atomic, so the reader thread can record without a lock
+        self._events = deque(maxlen=capacity)
+        self._pending_paint = None  # (input_t, commit_end) awaiting the next paint
+
+    def span(self, name, start_ns, end_ns, track=TRACK_GUI, args=None):
+        """Record a completed span; no-op unless tracing is enabled"""
+        if self.enabled:
+            self._events.append((name, start_ns, end_ns - start_ns, track, args))
+
+    def commit(self, input_t, start_ns, end_ns):
+        """Record a canvas commit and the input-to-commit latency it completed"""
+        if not self.enabled:
+            return
+        self._events.append(("commit", start_ns, end_ns - start_ns, TRACK_GUI, None))
+        if input_t:
+            self._events.append(("input to commit", input_t, end_ns - input_t, TRACK_LATENCY, None))
+            self._pending_paint = (input_t, end_ns)
+
+    def paint(self, now_ns=None):
+        """Close the latency span of the last commit at the first paint after it"""
+        pending = self._pending_paint
+        if pending is None or not self.enabled:
+            return
+        self._pending_paint = None
+        if now_ns is None:
+            now_ns = perf_counter_ns()
+        input_t, commit_end = pending
+        self._events.append(("input to paint", input_t, now_ns - input_t, TRACK_LATENCY,
+                             {"commit_to_paint_us": (now_ns - commit_end) / 1000.0}))
+
+    def clear(self):
+        self._events.clear()
+        self._pending_paint = None
+
+    def __len__(self):
+        return len(self._events)
+
+    def flush(self, path):
+        """Write the buffered spans to path as Chrome trace JSON on a worker thread"""
+        events = list(self._events)
+        thread = threading.Thread(target=self._write, args=(path, events), name="SpaceMouseTraceWriter",
+                                  daemon=True)
+        thread.start()
+        return thread
+
+    @staticmethod
+    def _write(path, events):
+        trace_events = [
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": name}}
+            for tid, name in TRACK_NAMES.items()
+        ]
+        for name, start_ns, duration_ns, track, args in events:
+            event = {"name": name, "cat": "spacemouse", "ph": "X", "pid": 1, "tid": track,
+                     "ts": start_ns / 1000.0, "dur": duration_ns / 1000.0}
+            if args:
+                event["args"] = args
+            trace_events.append(event)
+        try:
+            with open(path, "w") as f:
+                json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f)
+            QtCore.qDebug(f"SpaceMouse trace with {len(events)} spans written to {path}")
+        except Exception as e:
+            QtCore.qWarning(f"Failed to write SpaceMouse trace: {e}")
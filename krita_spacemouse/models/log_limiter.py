@@ -0,0 +1,51 @@
+"""
+Rate-limited, aggregating log output.
+A failing device raises the same error on every poll tick; formatting and writing
+each one costs more than the tick itself. RateLimitedLog writes a message the
+first time it occurs and then at most once per interval, folding the repeats in
+between into a count.
+"""
+
+import time
+from PyQt5 import QtCore
+
+# Repeats of a message within this window are counted instead of logged
+LOG_INTERVAL = 10.0  # seconds
+
+# Distinct messages tracked at once; older counts are flushed when exceeded
+MAX_MESSAGES = 64
+
+class RateLimitedLog:
+    """Logs each distinct message at most once per interval, with a repeat count"""
+    def __init__(self, interval=LOG_INTERVAL, clock=time.monotonic):
+        self.interval = interval
+        self._clock = clock
+        self._entries = {}       # message -> [time last written, repeats since, level]
+        self.suppressed = 0      # Messages counted instead of written, for diagnostics
+
+    def log(self, message, level=QtCore.qWarning):
+        """Write message now, or count it if it was written within the interval; returns whether it was written"""
+        now = self._clock()
+        entry = self._entries.get(message)
+        if entry is None:
+            if len(self._entries) >= MAX_MESSAGES:
+                self.flush()
+            self._entries[message] = [now, 0, level]
+            level(message)
+            return True
+        if now - entry[0] < self.interval:
+            entry[1] += 1
+            self.suppressed += 1
+            return False
+        repeats = entry[1] + 1
+        entry[0] = now
+        entry[1] = 0
+        level(f"{message} (repeated {repeats} times in the last {self.interval:g} s)" if repeats > 1 else message)
+        return True
+
+    def flush(self):
+        """Write the outstanding repeat counts and forget every message"""
+        for message, (logged_t, repeats, level) in self._entries.items():
+            if repeats:
+                level(f"{message} (repeated {repeats} more times)")
+        self._entries.clear()
@@ -0,0 +1,51 @@
+"""
+Per-axis motion accumulator for the SpaceMouse poll loop.
+Poll ticks add fractional pan, log-space zoom and rotation; the frame pacer takes the
+whole-pixel part once per display frame and the fractional remainder carries over.
+"""
+
+class MotionAccumulator:
+    """Carries pan (pixels), zoom (natural log of the factor) and rotation (degrees) between ticks"""
+    __slots__ = ('pan_x', 'pan_y', 'zoom', 'rotation', 'input_t')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Drop all pending motion, including sub-pixel remainders"""
+        self.pan_x = 0.0
+        self.pan_y = 0.0
+        self.zoom = 0.0
+        self.rotation = 0.0
+        self.input_t = 0      # Timestamp of the oldest input not yet applied (0 = none)
+
+    def add(self, dx, dy, zoom, rotation, input_t=0):
+        """Accumulate one tick of motion read from the device at input_t (perf_counter_ns)"""
+        if not self.input_t:
+            self.input_t = input_t
+        self.pan_x += dx
+        self.pan_y += dy
+        self.zoom += zoom
+        self.rotation += rotation
+
+    def has_motion(self):
+        """True if taking now would move the canvas"""
+        return (self.pan_x >= 1.0 or self.pan_x <= -1.0 or self.pan_y >= 1.0 or self.pan_y <= -1.0
+                or self.zoom != 0.0 or self.rotation != 0.0)
+
+    def take(self):
+        """Return (dx, dy, zoom, rotation) to apply now.
+
+        Pan is returned as whole pixels and the fractional part stays accumulated,
+        so slow pans below one pixel per tick still progress instead of truncating to 0.
+        """
+        dx = int(self.pan_x)
+        dy = int(self.pan_y)
+        self.pan_x -= dx
+        self.pan_y -= dy
+        zoom = self.zoom
+        rotation = self.rotation
+        self.zoom = 0.0
+        self.rotation = 0.0
+        self.input_t = 0
+        return dx, dy, zoom, rotation
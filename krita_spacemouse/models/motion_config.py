@@ -0,0 +1,65 @@
+"""
+Immutable motion settings snapshot for the SpaceMouse poll loop.
+ConfigurationTab builds a new snapshot when a slider changes and publishes it to the
+extension, so the hot path reads a single attribute instead of querying widgets.
+"""
+
+from .axis_mapping import STANDARD_MATRIX
+
+class MotionConfig:
+    """Read-only set of motion parameters, already converted to working units"""
+    __slots__ = ('pan_scale', 'zoom_scale', 'rotation_speed', 'dead_zone', 'poll_rate',
+                 'idle_timeout', 'adaptive_polling', 'batch_transforms', 'smoothing_mode', 'smoothing',
+                 'expo', 'inertia_enabled', 'inertia', 'damping', 'axis_matrix', 'axis_dead_zones', 'axis_expo',
+                 'prediction_enabled', 'prediction_model', 'prediction')
+
+    def __init__(self, pan_scale=120, zoom_scale=0.1, rotation_speed=4.0, dead_zone=0.15, poll_rate=30,
+                 idle_timeout=5.0, adaptive_polling=True, batch_transforms=True, smoothing_mode=2,
+                 smoothing=20, expo=0.0, inertia_enabled=False, inertia=80, damping=3.0,
+                 axis_matrix=STANDARD_MATRIX, axis_dead_zones=(None,) * 6, axis_expo=(None,) * 6,
+                 prediction_enabled=False, prediction_model=0, prediction=1.0):
+        set_field = object.__setattr__
+        set_field(self, 'pan_scale', pan_scale)            # Pixels per unit movement
+        set_field(self, 'zoom_scale', zoom_scale)          # Zoom factor per unit movement
+        set_field(self, 'rotation_speed', rotation_speed)  # Degrees per unit movement
+        set_field(self, 'dead_zone', dead_zone)            # Fraction of full deflection
+        set_field(self, 'poll_rate', poll_rate)            # Timer interval in milliseconds
+        set_field(self, 'idle_timeout', idle_timeout)      # Seconds at rest before backing off
+        set_field(self, 'adaptive_polling', adaptive_polling)
+        set_field(self, 'batch_transforms', batch_transforms)  # One repaint per frame commit
+        set_field(self, 'smoothing_mode', smoothing_mode)  # Off / exponential / One-Euro
+        set_field(self, 'smoothing', smoothing)            # Smoothing time constant in milliseconds
+        set_field(self, 'expo', expo)                      # Response curve blend, 0 linear to 1 cubic
+        set_field(self, 'inertia_enabled', inertia_enabled)  # Fixed-timestep glide stage
+        set_field(self, 'inertia', inertia)                # Velocity response time constant in milliseconds
+        set_field(self, 'damping', damping)                # Glide velocity decay rate per second
+        set_field(self, 'axis_matrix', axis_matrix)        # 6 x 6 output-by-axis mapping (see axis_mapping)
+        set_field(self, 'axis_dead_zones', axis_dead_zones)  # Per-axis dead zone, None uses dead_zone
+        set_field(self, 'axis_expo', axis_expo)            # Per-axis expo, None uses expo
+        set_field(self, 'prediction_enabled', prediction_enabled)  # Extrapolate to the expected paint time
+        set_field(self, 'prediction_model', prediction_model)  # Constant velocity / velocity trend
+        set_field(self, 'prediction', prediction)          # Fraction of the measured latency compensated
+
+    def __setattr__(self, name, value):
+        raise AttributeError("MotionConfig is immutable, use replace() to derive a new one")
+
+    def replace(self, **changes):
+        """Return a copy with the given fields changed"""
+        values = {name: getattr(self, name) for name in self.__slots__}
+        values.update(changes)
+        return MotionConfig(**values)
+
+    def __eq__(self, other):
+        if not isinstance(other, MotionConfig):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, name) for name in self.__slots__))
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"MotionConfig({fields})"
+
+# Used until a ConfigurationTab publishes its own snapshot
+DEFAULT_MOTION_CONFIG = MotionConfig()
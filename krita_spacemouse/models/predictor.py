@@ -0,0 +1,149 @@
+"""
+Motion prediction between the filtered input and the canvas.
+The canvas shows input that is already old when it is painted: the age of the
+newest sample at the poll tick plus the tick-to-paint latency (frame pacing,
+canvas update, render). MotionPredictor estimates each output's rate and moves
+the canvas ahead by the distance it will cover over that horizon, so the picture
+matches where the puck is rather than where it was.
+
+The lead is not extra motion: each tick emits only the change in lead, so while
+the rate is steady the total travel is unchanged. When the rate drops the lead
+shrinks, and pulling the canvas back against its direction of travel would look
+like a bounce, so that remainder is written off instead. The overshoot left
+behind is bounded by the capped lead and counted in overshoot.
+
+Tick-to-paint latency is measured, not assumed: commit() marks the tick whose
+motion was committed and paint() (the transform batch's paint-event filter)
+closes the measurement; an exponential moving average feeds the horizon.
+"""
+
+from time import perf_counter_ns
+
+# Prediction models
+PREDICT_CONSTANT = 0    # Rate held constant over the horizon
+PREDICT_TREND = 1       # Rate plus its smoothed rate of change (alpha-beta / steady-state Kalman)
+PREDICTION_MODEL_NAMES = ("Constant Velocity", "Velocity Trend")
+
+# Longest horizon extrapolated, however high the measured latency
+MAX_HORIZON = 0.060  # seconds
+
+# Latency assumed before the first measurement (about one 60 Hz frame)
+DEFAULT_LATENCY = 0.016  # seconds
+# Weight of each new tick-to-paint measurement; measurements above the limit are ignored
+LATENCY_SMOOTHING = 0.1
+MAX_LATENCY_SAMPLE = 250_000_000  # ns
+
+# Weight of each new acceleration measurement in the trend model
+TREND_SMOOTHING = 0.3
+
+# A tick gap longer than this restarts the rate estimate (e.g. after an idle back-off)
+MAX_ELAPSED = 0.1  # seconds
+
+class MotionPredictor:
+    """Rate estimate and applied lead for the pan x/y, zoom and rotation outputs"""
+    __slots__ = ('model', 'amount', 'latency', 'lead', 'rate', 'trend', 'overshoot',
+                 '_last_t', '_tick_t', '_pending_tick')
+
+    def __init__(self, model=PREDICT_CONSTANT, amount=1.0):
+        self.latency = DEFAULT_LATENCY
+        self.lead = [0.0, 0.0, 0.0, 0.0]
+        self.rate = [0.0, 0.0, 0.0, 0.0]
+        self.trend = [0.0, 0.0, 0.0, 0.0]
+        self.overshoot = [0.0, 0.0, 0.0, 0.0]   # Lead written off on release, per output
+        self.configure(model, amount)
+        self.reset()
+
+    def configure(self, model, amount):
+        """model: PREDICT_*; amount: fraction of the measured latency to compensate (0 to 1)"""
+        self.model = model
+        self.amount = amount
+
+    def reset(self):
+        """Forget the motion state (on connect); the latency estimate is kept"""
+        self.lead[:] = (0.0, 0.0, 0.0, 0.0)
+        self.rate[:] = (0.0, 0.0, 0.0, 0.0)
+        self.trend[:] = (0.0, 0.0, 0.0, 0.0)
+        self._last_t = None
+        self._tick_t = 0
+        self._pending_tick = 0
+
+    def horizon(self, input_age):
+        """Seconds to extrapolate for a newest sample input_age seconds old at the tick"""
+        horizon = (input_age + self.latency) * self.amount
+        return MAX_HORIZON if horizon > MAX_HORIZON else horizon
+
+    def update(self, outputs, newest_t, now):
+        """Add the change in lead to one tick's outputs (pan x, pan y, zoom, rotation).
+
+        newest_t is the timestamp of the newest input sample and now the tick time
+        (both perf_counter_ns). Returns the adjusted outputs.
+        """
+        lead = self.lead
+        rate = self.rate
+        moving = outputs[0] or outputs[1] or outputs[2] or outputs[3]
+        if not moving and not (lead[0] or lead[1] or lead[2] or lead[3]):
+            self._last_t = now
+            rate[:] = (0.0, 0.0, 0.0, 0.0)
+            self.trend[:] = (0.0, 0.0, 0.0, 0.0)
+            return outputs
+        elapsed = None if self._last_t is None else (now - self._last_t) * 1e-9
+        self._last_t = now
+        if moving:
+            self._tick_t = now
+        if elapsed is None or elapsed <= 0.0 or elapsed > MAX_ELAPSED:
+            # No usable interval: no rate estimate, so no lead this tick
+            rate[:] = (0.0, 0.0, 0.0, 0.0)
+            self.trend[:] = (0.0, 0.0, 0.0, 0.0)
+            return outputs
+
+        horizon = self.horizon(max(0.0, (now - newest_t) * 1e-9) if newest_t else 0.0)
+        trend = self.trend
+        use_trend = self.model == PREDICT_TREND
+        overshoot = self.overshoot
+        adjusted = [0.0, 0.0, 0.0, 0.0]
+        for axis in range(4):
+            output = outputs[axis]
+            velocity = output / elapsed              # Output units per second
+            if use_trend:
+                acceleration = (velocity - rate[axis]) / elapsed
+                trend[axis] += (acceleration - trend[axis]) * TREND_SMOOTHING
+            rate[axis] = velocity
+
+            target = velocity * horizon
+            if use_trend and target:
+                target += 0.5 * trend[axis] * horizon * horizon
+                # The trend may shorten the lead (a release coming) but never reverse or more than double it
+                limit = 2.0 * velocity * horizon
+                if (target > 0.0) != (limit > 0.0):
+                    target = 0.0
+                elif abs(target) > abs(limit):
+                    target = limit
+
+            applied = lead[axis]
+            emitted = output + target - applied
+            if emitted * applied < 0.0 and output * applied >= 0.0:
+                # Shrinking lead would pull the canvas back against its travel: write it off
+                overshoot[axis] += abs(emitted)
+                emitted = 0.0
+            lead[axis] = target
+            adjusted[axis] = emitted
+        return adjusted
+
+    # Latency measurement
+
+    def commit(self):
+        """The motion of the latest moving tick was just committed to the canvas"""
+        if self._tick_t:
+            self._pending_tick = self._tick_t
+
+    def paint(self, now_ns=None):
+        """First canvas paint after a commit: fold the tick-to-paint time into the estimate"""
+        tick = self._pending_tick
+        if not tick:
+            return
+        self._pending_tick = 0
+        if now_ns is None:
+            now_ns = perf_counter_ns()
+        sample = now_ns - tick
+        if 0 <= sample <= MAX_LATENCY_SAMPLE:
+            self.latency += (sample * 1e-9 - self.latency) * LATENCY_SMOOTHING
@@ -0,0 +1,163 @@
+"""
+Krita side of the out-of-process device reader.
+Krita runs every Python plugin in one interpreter, so a plugin holding the GIL
+delays a reader thread. ProcessReader instead runs the backend in a separate
+Python process (models.device_process) that publishes into a SharedRingReader;
+the poll tick drains that ring directly. A monitor thread blocks on the process's
+stdout for wake-up records (the device opening, motion starting, button changes),
+releasing the GIL while it waits. Nothing waits for the process on the GUI thread:
+until it reports the device open, drain() returns no samples, and a process that
+fails to start is reported by drain() like any other device error.
+"""
+
+import errno
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from time import perf_counter_ns
+from .sample_ring import DeviceSample
+from .recorder import mask_to_buttons
+from .shared_ring import SharedRingReader, NOTIFY, STATUS_STARTING, STATUS_ERROR, STATUS_STOPPED
+
+# Environment variable naming the interpreter for the device process
+PYTHON_ENV = "SPACEMOUSE_PYTHON"
+
+# Longest the device process may take to open the device
+START_TIMEOUT = 3_000_000_000  # ns
+# Longest the device process may take to exit after stdin closes before it is killed
+STOP_TIMEOUT = 1.0   # seconds
+# A process whose heartbeat is older than this is considered hung
+HEARTBEAT_TIMEOUT = 1_000_000_000  # ns
+
+# The krita_spacemouse directory; the device process imports models from it
+PLUGIN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class ProcessReaderError(Exception):
+    """The device process cannot be used at all (no interpreter, spawn failure)"""
+
+def find_python():
+    """Interpreter for the device process; inside Krita sys.executable is Krita itself"""
+    candidates = [os.environ.get(PYTHON_ENV)]
+    for executable in (sys.executable, getattr(sys, "_base_executable", None)):
+        if executable and os.path.basename(executable).lower().startswith("python"):
+            candidates.append(executable)
+    candidates += [shutil.which("python3"), shutil.which("python")]
+    for candidate in candidates:
+        if candidate and os.path.isfile(candidate):
+            return candidate
+    return None
+
+class ProcessReader:
+    """One backend running in a device process, read through shared memory.
+
+    Only the parent-side backend's name and options() are used, to recreate it in
+    the process. drain() also checks the process's health: it raises the error
+    the process stopped with, ConnectionError if it exited, or TimeoutError if its
+    heartbeat stalled, so the poll tick hands the failure to the connection
+    supervisor like any other read error.
+    """
+    def __init__(self, backend, on_notify):
+        self.backend = backend
+        self._on_notify = on_notify   # on_notify(sample) from the monitor thread; None when the process died
+        self.ring = None
+        self.process = None
+        self._started = 0             # perf_counter_ns when the process was spawned
+        self._thread = None
+        self._stopping = False
+
+    @property
+    def dropped(self):
+        return self.ring.dropped if self.ring is not None else 0
+
+    def start(self, device_number=0, device_name=None):
+        """Spawn the process and return at once; the device is opened in the background"""
+        python = find_python()
+        if python is None:
+            raise ProcessReaderError(f"No Python interpreter found for the device process (set {PYTHON_ENV})")
+        self.ring = SharedRingReader()
+        command = [python, "-m", "models.device_process", self.ring.path, self.backend.name,
+                   "--options", json.dumps(self.backend.options()), "--device-number", str(device_number)]
+        if device_name is not None:
+            command += ["--device-name", device_name]
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join((PLUGIN_DIR, os.path.dirname(PLUGIN_DIR)))
+        env.pop("PYTHONHOME", None)  # Krita's bundled Python home would not match the interpreter
+        try:
+            self.process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=env,
+                                            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0)
+        except OSError as e:
+            self.ring.close()
+            self.ring = None
+            raise ProcessReaderError(f"Could not start the device process: {e}")
+        self._started = perf_counter_ns()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._monitor, name="SpaceMouseProcessMonitor", daemon=True)
+        self._thread.start()
+
+    def drain(self):
+        """Samples written since the last drain; raises if the process is unhealthy"""
+        ring = self.ring
+        samples = ring.drain()
+        if samples:
+            return samples
+        status, code = ring.status()
+        if status == STATUS_ERROR:
+            raise OSError(code or errno.EIO, ring.error_message())
+        if status == STATUS_STOPPED:
+            raise ConnectionError("SpaceMouse device process stopped")
+        if status == STATUS_STARTING:
+            # Still opening the device
+            if self.process.poll() is not None:
+                raise ConnectionError(f"SpaceMouse device process exited with code {self.process.returncode}")
+            if perf_counter_ns() - self._started > START_TIMEOUT:
+                raise ConnectionError("SpaceMouse device process did not open the device in time")
+            return samples
+        if perf_counter_ns() - ring.heartbeat() > HEARTBEAT_TIMEOUT:
+            if self.process.poll() is not None:
+                raise ConnectionError(f"SpaceMouse device process exited with code {self.process.returncode}")
+            raise TimeoutError("SpaceMouse device process is not responding")
+        return samples
+
+    def stop(self):
+        """Close stdin so the process exits, kill it if it hangs, and remove the ring file"""
+        self._stopping = True
+        process = self.process
+        self.process = None
+        if process is not None:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+            try:
+                process.wait(STOP_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        if self._thread is not None:
+            self._thread.join(timeout=STOP_TIMEOUT)
+            self._thread = None
+        if process is not None:
+            process.stdout.close()
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
+
+    def _monitor(self):
+        """Monitor thread body - blocks on the process's stdout, never touches Qt objects"""
+        stdout = self.process.stdout
+        size = NOTIFY.size
+        while True:
+            try:
+                record = stdout.read(size)
+            except (OSError, ValueError):
+                break
+            if len(record) < size:
+                break
+            t, x, y, z, roll, pitch, yaw, mask, count = NOTIFY.unpack(record)
+            self._on_notify(DeviceSample(t, x, y, z, roll, pitch, yaw, mask_to_buttons(mask, count)))
+        if not self._stopping:
+            # Wake the poll tick so drain() reports the dead process promptly
+            self._on_notify(None)
@@ -0,0 +1,82 @@
+"""
+Named navigation profiles held in memory.
+Each profile keeps its settings in slider units (as stored on disk) next to the
+MotionConfig compiled from them, so switching profiles hands the poll loop a
+ready-made snapshot. Profiles can be bound to a document (by file path) or to a
+Krita tool (by tool id); a tool binding wins over a document binding, and the
+selected profile applies when neither matches.
+"""
+
+from .settings_store import DEFAULT_PROFILE, DEFAULT_VALUES, motion_config_from_settings
+
+class ProfileSet:
+    """Profiles, their compiled configs and the document/tool bindings"""
+    def __init__(self):
+        self.default_values = dict(DEFAULT_VALUES)
+        self.values = {}
+        self.configs = {}
+        self.selected = DEFAULT_PROFILE
+        self.document_profiles = {}   # Document file path -> profile name
+        self.tool_profiles = {}       # Krita tool id -> profile name
+        self.set_values(DEFAULT_PROFILE, self.default_values)
+
+    def names(self):
+        """Profile names, the default profile first"""
+        return [DEFAULT_PROFILE] + sorted(name for name in self.values if name != DEFAULT_PROFILE)
+
+    def __contains__(self, name):
+        return name in self.values
+
+    def config(self, name):
+        """Compiled MotionConfig of a profile (the default profile if it does not exist)"""
+        return self.configs.get(name) or self.configs[DEFAULT_PROFILE]
+
+    def set_values(self, name, values):
+        """Store slider-unit values for a profile (creating it) and compile its MotionConfig"""
+        merged = dict(self.default_values)
+        merged.update(values)
+        self.values[name] = merged
+        self.configs[name] = motion_config_from_settings(merged)
+
+    def remove(self, name):
+        """Delete a profile and every binding to it; the default profile cannot be removed"""
+        if name == DEFAULT_PROFILE or name not in self.values:
+            return False
+        del self.values[name]
+        del self.configs[name]
+        if self.selected == name:
+            self.selected = DEFAULT_PROFILE
+        for rules in (self.document_profiles, self.tool_profiles):
+            for key in [key for key, profile in rules.items() if profile == name]:
+                del rules[key]
+        return True
+
+    def resolve(self, document=None, tool=None):
+        """Name of the profile that applies to a document path and tool id"""
+        name = self.tool_profiles.get(tool) if tool else None
+        if name is None and document:
+            name = self.document_profiles.get(document)
+        if name is None or name not in self.values:
+            name = self.selected if self.selected in self.values else DEFAULT_PROFILE
+        return name
+
+    def load(self, snapshot):
+        """Replace every profile and binding with a snapshot read from disk"""
+        self.values.clear()
+        self.configs.clear()
+        for name, values in snapshot["values"].items():
+            self.set_values(name, values)
+        if DEFAULT_PROFILE not in self.values:
+            self.set_values(DEFAULT_PROFILE, self.default_values)
+        self.selected = snapshot["selected"] if snapshot["selected"] in self.values else DEFAULT_PROFILE
+        self.document_profiles = dict(snapshot["document_profiles"])
+        self.tool_profiles = dict(snapshot["tool_profiles"])
+
+    def snapshot(self):
+        """Plain copy of everything persisted, safe to hand to the writer thread"""
+        return {
+            "values": {name: dict(values) for name, values in self.values.items()},
+            "selected": self.selected,
+            "document_profiles": dict(self.document_profiles),
+            "tool_profiles": dict(self.tool_profiles),
+        }
@@ -0,0 +1,134 @@
+"""
+Compact binary recording of SpaceMouse input streams.
+A recording is a small header (magic, version, device button count) followed by
+fixed-width little-endian records: perf_counter_ns timestamp (int64), six axes
+(float32) and a button bitmask (uint32).
+Recordings are read back through mmap without loading the whole file.
+"""
+
+import mmap
+import os
+import struct
+import threading
+from .sample_ring import DeviceSample
+
+RECORDING_MAGIC = b"SMREC"
+RECORDING_VERSION = 2
+RECORDING_EXTENSION = ".smrec"
+
+HEADER = struct.Struct("<5sBBx")          # magic, version, button count, padding
+OFFSET_BUTTON_COUNT = 6
+MAX_BUTTONS = 32                          # Bits in the button mask
+RECORD = struct.Struct("<q6fI")           # t, x, y, z, roll, pitch, yaw, buttons
+
+# Records buffered in memory before they are written out
+FLUSH_EVERY = 256
+
+def buttons_to_mask(buttons):
+    """Pack a sequence of button states into a bitmask"""
+    mask = 0
+    for index, pressed in enumerate(buttons):
+        if pressed:
+            mask |= 1 << index
+    return mask
+
+def mask_to_buttons(mask, count):
+    """Unpack a bitmask into a tuple of count 0/1 button states"""
+    return tuple((mask >> index) & 1 for index in range(count))
+
+class SampleRecorder:
+    """Appends DeviceSample records to a recording file (called from the reader thread)"""
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(RECORDING_MAGIC, RECORDING_VERSION, 0))
+        self._buffer = bytearray(RECORD.size * FLUSH_EVERY)
+        self._pending = 0
+        self._lock = threading.Lock()
+        self.count = 0
+        self.button_count = 0          # Most buttons any sample reported
+        self._header_buttons = 0       # Button count currently in the file header
+
+    def write(self, sample):
+        """Pack one sample into the in-memory buffer, flushing when it is full"""
+        with self._lock:
+            if self._file is None:
+                return
+            RECORD.pack_into(self._buffer, self._pending * RECORD.size, sample.t,
+                             sample.x, sample.y, sample.z, sample.roll, sample.pitch, sample.yaw,
+                             buttons_to_mask(sample.buttons))
+            if len(sample.buttons) > self.button_count:
+                self.button_count = min(len(sample.buttons), MAX_BUTTONS)
+            self._pending += 1
+            self.count += 1
+            if self._pending == FLUSH_EVERY:
+                self._flush()
+
+    def _flush(self):
+        if self._pending:
+            self._file.write(memoryview(self._buffer)[:self._pending * RECORD.size])
+            self._pending = 0
+        if self.button_count != self._header_buttons:
+            # Keep the header in step with the flushed records, so a recording cut short still replays every button
+            self._file.seek(OFFSET_BUTTON_COUNT)
+            self._file.write(bytes((self.button_count,)))
+            self._file.seek(0, os.SEEK_END)
+            self._header_buttons = self.button_count
+
+    def close(self):
+        with self._lock:
+            if self._file is None:
+                return
+            self._flush()
+            self._file.close()
+            self._file = None
+
+class Recording:
+    """Read-only, memory-mapped view of a recording file.
+
+    button_count overrides the count stored in the header.
+    """
+    def __init__(self, path, button_count=None):
+        self.path = path
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if size < HEADER.size:
+            self._file.close()
+            raise ValueError(f"Not a SpaceMouse recording: {path}")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, stored_buttons = HEADER.unpack_from(self._map, 0)
+        if magic != RECORDING_MAGIC or version != RECORDING_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported SpaceMouse recording: {path}")
+        if button_count is None:
+            button_count = stored_buttons
+        self.button_count = button_count
+        # A truncated trailing record (e.g. after a crash) is ignored
+        self._count = (size - HEADER.size) // RECORD.size
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("recording index out of range")
+        t, x, y, z, roll, pitch, yaw, mask = RECORD.unpack_from(self._map, HEADER.size + index * RECORD.size)
+        return DeviceSample(t, x, y, z, roll, pitch, yaw, mask_to_buttons(mask, self.button_count))
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+    def timestamp(self, index):
+        """Timestamp of a record without unpacking the rest of it"""
+        return struct.unpack_from("<q", self._map, HEADER.size + index * RECORD.size)[0]
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,68 @@
+"""
+Bounded ring buffer for SpaceMouse samples.
+The device reader thread pushes timestamped samples, the GUI-thread poll tick drains them.
+"""
+
+import threading
+from collections import namedtuple
+
+# Same field layout as spacenavigator's state tuple, with t as a perf_counter_ns timestamp
+DeviceSample = namedtuple('DeviceSample', ['t', 'x', 'y', 'z', 'roll', 'pitch', 'yaw', 'buttons'])
+
+DEFAULT_CAPACITY = 256
+
+# Deflection above which a new sample wakes an idle poll scheduler (below the minimum dead zone)
+WAKE_THRESHOLD = 0.05
+
+def is_deflected(sample):
+    """Any axis past WAKE_THRESHOLD; every axis counts, since the mapping matrix can use any of them"""
+    return (abs(sample.x) > WAKE_THRESHOLD or abs(sample.y) > WAKE_THRESHOLD or abs(sample.z) > WAKE_THRESHOLD or
+            abs(sample.roll) > WAKE_THRESHOLD or abs(sample.pitch) > WAKE_THRESHOLD or
+            abs(sample.yaw) > WAKE_THRESHOLD)
+
+class SampleRing:
+    """Fixed-capacity FIFO of DeviceSample; the oldest sample is overwritten when full"""
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self._capacity = capacity
+        self._slots = [None] * capacity
+        self._head = 0      # Index of the oldest sample
+        self._count = 0
+        self._lock = threading.Lock()
+        self.dropped = 0    # Samples overwritten before they were drained
+
+    def push(self, sample):
+        """Append a sample (reader thread)"""
+        with self._lock:
+            tail = (self._head + self._count) % self._capacity
+            self._slots[tail] = sample
+            if self._count == self._capacity:
+                self._head = (self._head + 1) % self._capacity
+                self.dropped += 1
+            else:
+                self._count += 1
+
+    def drain(self):
+        """Remove and return all buffered samples, oldest first (GUI thread)"""
+        with self._lock:
+            count = self._count
+            if not count:
+                return []
+            head = self._head
+            end = head + count
+            if end <= self._capacity:
+                samples = self._slots[head:end]
+            else:
+                samples = self._slots[head:] + self._slots[:end - self._capacity]
+            self._head = 0
+            self._count = 0
+            return samples
+
+    def clear(self):
+        """Discard all buffered samples"""
+        with self._lock:
+            self._head = 0
+            self._count = 0
+            self.dropped = 0
+
+    def __len__(self):
+        return self._count
@@ -0,0 +1,241 @@
+"""
+Settings file access for the SpaceMouse plugin.
+Values are stored in slider units in an INI file under Krita's resource directory.
+The extension reads the file on first connect, so neither Krita's startup nor the
+docker has to build the configuration tab to apply saved settings. Changes are
+written back by SettingsWriter on a worker thread, never from the GUI thread.
+"""
+
+import os
+import threading
+import time
+from PyQt5.QtCore import QSettings
+from PyQt5 import QtCore
+from .motion_config import MotionConfig
+from .axis_mapping import STANDARD_MATRIX, format_matrix, parse_matrix, parse_axis_values
+
+# Key, default (slider units), type
+SETTINGS_KEYS = (
+    ("pan_scale", 120, int),
+    ("zoom_scale", 100, int),
+    ("rotation_speed", 40, int),
+    ("dead_zone", 150, int),
+    ("poll_rate", 30, int),
+    ("idle_timeout", 5, int),
+    ("adaptive_polling", True, bool),
+    ("batch_transforms", True, bool),
+    ("smoothing_mode", 2, int),
+    ("smoothing", 20, int),
+    ("expo", 0, int),
+    ("inertia_enabled", False, bool),
+    ("inertia", 80, int),
+    ("damping", 30, int),
+    ("axis_matrix", format_matrix(STANDARD_MATRIX), str),
+    ("axis_dead_zones", ",,,,,", str),   # Per axis in slider units; blank uses dead_zone
+    ("axis_expo", ",,,,,", str),         # Per axis in slider units; blank uses expo
+    ("prediction_enabled", False, bool),
+    ("prediction_model", 0, int),
+    ("prediction", 100, int),
+)
+
+# Key -> default, for new profiles and "Reset to Defaults"
+DEFAULT_VALUES = {key: default for key, default, value_type in SETTINGS_KEYS}
+
+BUTTONS_GROUP = "buttons"
+PROFILES_GROUP = "profiles"                  # Non-default profiles, one sub-group each
+DOCUMENT_PROFILES_ARRAY = "document_profiles"  # Arrays: paths and tool ids contain "/"
+TOOL_PROFILES_ARRAY = "tool_profiles"
+SELECTED_PROFILE_KEY = "selected_profile"
+
+# The default profile's values are stored at the top level, as before profiles existed
+DEFAULT_PROFILE = "Default"
+
+# Idle time after the last change before the writer thread saves
+SAVE_DELAY = 1.0  # seconds
+
+_settings_path = None
+
+def settings_path():
+    """Get the path for storing plugin settings following Krita standards (resolved once)"""
+    global _settings_path
+    if _settings_path is not None:
+        return _settings_path
+    from krita import Krita
+    # Use Krita's resource directory for plugin settings
+    krita_config_path = Krita.instance().readSetting("", "ResourceDirectory", "")
+    if not krita_config_path:
+        # Fallback to user's application data
+        if os.name == 'nt':  # Windows
+            krita_config_path = os.path.expandvars('%APPDATA%/krita')
+        else:  # Linux/Mac
+            krita_config_path = os.path.expanduser('~/.local/share/krita')
+
+    plugin_config_dir = os.path.join(krita_config_path, 'spacemouse_settings')
+    os.makedirs(plugin_config_dir, exist_ok=True)
+    _settings_path = os.path.join(plugin_config_dir, 'spacemouse_config.ini')
+    return _settings_path
+
+def _read_values(settings):
+    return {key: settings.value(key, default, type=value_type) for key, default, value_type in SETTINGS_KEYS}
+
+def _read_array(settings, name, key):
+    rules = {}
+    for index in range(settings.beginReadArray(name)):
+        settings.setArrayIndex(index)
+        rules[settings.value(key, "", type=str)] = settings.value("profile", "", type=str)
+    settings.endArray()
+    return rules
+
+def _write_array(settings, name, key, rules):
+    settings.remove(name)
+    settings.beginWriteArray(name, len(rules))
+    for index, (target, profile) in enumerate(rules.items()):
+        settings.setArrayIndex(index)
+        settings.setValue(key, target)
+        settings.setValue("profile", profile)
+    settings.endArray()
+
+def read_settings(path=None):
+    """Return (profile snapshot, button bindings) from the settings file, or None if there is none.
+
+    The snapshot has the layout of ProfileSet.snapshot().
+    """
+    path = path or settings_path()
+    if not os.path.exists(path):
+        return None
+    settings = QSettings(path, QSettings.IniFormat)
+    values = {DEFAULT_PROFILE: _read_values(settings)}
+    settings.beginGroup(PROFILES_GROUP)
+    for name in settings.childGroups():
+        settings.beginGroup(name)
+        values[name] = _read_values(settings)
+        settings.endGroup()
+    settings.endGroup()
+    snapshot = {
+        "values": values,
+        "selected": settings.value(SELECTED_PROFILE_KEY, DEFAULT_PROFILE, type=str),
+        "document_profiles": _read_array(settings, DOCUMENT_PROFILES_ARRAY, "document"),
+        "tool_profiles": _read_array(settings, TOOL_PROFILES_ARRAY, "tool"),
+    }
+    settings.beginGroup(BUTTONS_GROUP)
+    bindings = {trigger: settings.value(trigger, "", type=str) for trigger in settings.childKeys()}
+    settings.endGroup()
+    return snapshot, bindings
+
+def write_settings(snapshot, bindings, path=None):
+    """Write a profile snapshot and button bindings, replacing the file's previous contents"""
+    path = path or settings_path()
+    settings = QSettings(path, QSettings.IniFormat)
+    settings.clear()
+    for key, value in snapshot["values"][DEFAULT_PROFILE].items():
+        settings.setValue(key, value)
+    settings.setValue(SELECTED_PROFILE_KEY, snapshot["selected"])
+    settings.beginGroup(PROFILES_GROUP)
+    for name, values in snapshot["values"].items():
+        if name == DEFAULT_PROFILE:
+            continue
+        settings.beginGroup(name)
+        for key, value in values.items():
+            settings.setValue(key, value)
+        settings.endGroup()
+    settings.endGroup()
+    _write_array(settings, DOCUMENT_PROFILES_ARRAY, "document", snapshot["document_profiles"])
+    _write_array(settings, TOOL_PROFILES_ARRAY, "tool", snapshot["tool_profiles"])
+    settings.beginGroup(BUTTONS_GROUP)
+    for trigger, action_name in bindings.items():
+        settings.setValue(trigger, action_name)
+    settings.endGroup()
+    settings.sync()
+    return settings.status() == QSettings.NoError
+
+class SettingsWriter:
+    """Saves settings on a worker thread, coalescing changes made within SAVE_DELAY.
+
+    schedule() only swaps in the latest (snapshot, bindings) and returns; the
+    worker writes once the changes have been quiet for SAVE_DELAY. flush() writes
+    anything pending synchronously (used when the plugin stops).
+    """
+    def __init__(self, path_getter=settings_path, delay=SAVE_DELAY):
+        self._path_getter = path_getter
+        self.delay = delay
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()   # One write at a time; flush() waits for the worker's
+        self._pending = None          # Latest (snapshot, bindings) not yet written
+        self._deadline = 0.0
+        self._thread = None
+        self.writes = 0
+        self.last_error = None
+
+    def schedule(self, snapshot, bindings, delay=None):
+        with self._condition:
+            self._pending = (snapshot, bindings)
+            self._deadline = time.monotonic() + (self.delay if delay is None else delay)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="SpaceMouseSettingsWriter", daemon=True)
+                self._thread.start()
+            else:
+                self._condition.notify()
+
+    def flush(self):
+        with self._condition:
+            pending, self._pending = self._pending, None
+        if pending is not None:
+            self._write(pending)
+        else:
+            with self._write_lock:
+                pass
+
+    def _write(self, pending):
+        with self._write_lock:
+            try:
+                if not write_settings(*pending, path=self._path_getter()):
+                    raise OSError("settings file could not be written")
+                self.writes += 1
+                self.last_error = None
+            except Exception as e:
+                self.last_error = e
+                QtCore.qWarning(f"Failed to save SpaceMouse settings: {e}")
+
+    def _run(self):
+        """Worker thread body - waits for changes to go quiet, then writes the latest"""
+        with self._condition:
+            while True:
+                if self._pending is None:
+                    self._thread = None
+                    return
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                pending, self._pending = self._pending, None
+                self._condition.release()
+                try:
+                    self._write(pending)
+                finally:
+                    self._condition.acquire()
+
+def motion_config_from_settings(values):
+    """Convert slider-unit values (as ConfigurationTab's getters do) into a MotionConfig"""
+    return MotionConfig(
+        pan_scale=values["pan_scale"],
+        zoom_scale=values["zoom_scale"] / 1000.0,
+        rotation_speed=values["rotation_speed"] / 10.0,
+        dead_zone=values["dead_zone"] / 1000.0,
+        poll_rate=values["poll_rate"],
+        idle_timeout=float(values["idle_timeout"]),
+        adaptive_polling=values["adaptive_polling"],
+        batch_transforms=values["batch_transforms"],
+        smoothing_mode=values["smoothing_mode"],
+        smoothing=values["smoothing"],
+        expo=values["expo"] / 100.0,
+        inertia_enabled=values["inertia_enabled"],
+        inertia=values["inertia"],
+        damping=values["damping"] / 10.0,
+        axis_matrix=parse_matrix(values["axis_matrix"]),
+        axis_dead_zones=tuple(None if value is None else value / 1000.0
+                              for value in parse_axis_values(values["axis_dead_zones"])),
+        axis_expo=tuple(None if value is None else value / 100.0 for value in parse_axis_values(values["axis_expo"])),
+        prediction_enabled=values["prediction_enabled"],
+        prediction_model=values["prediction_model"],
+        prediction=values["prediction"] / 100.0,
+    )
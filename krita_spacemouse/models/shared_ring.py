@@ -0,0 +1,163 @@
+"""
+Sample ring in a shared memory-mapped file, written by the device process and read
+by Krita. The file lives in /dev/shm where that exists (RAM-backed), else in the
+temporary directory; plain mmap keeps multiprocessing's resource tracker, and the
+interpreter it would start, out of Krita. The layout is a fixed header followed by
+capacity fixed-width slots. The single writer fills a slot, stamps it with its
+sequence number at both ends and then advances the header's write counter; the
+reader walks from its own cursor up to that counter and unpacks each slot straight
+from the shared buffer. Neither side takes a lock. A slot whose two stamps
+disagree with the expected sequence was overwritten while being read (the reader
+fell more than capacity samples behind) and is counted as dropped.
+
+The writer also keeps a heartbeat timestamp and a status word in the header, so
+the reader can tell a quiet device from a hung or crashed process.
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from .sample_ring import DeviceSample, DEFAULT_CAPACITY
+from .recorder import mask_to_buttons
+
+RING_MAGIC = b"SMSR"
+
+# Header fields and their byte offsets
+MAGIC_CAPACITY = struct.Struct("<4sI")   # 0: magic, slot count
+STATUS = struct.Struct("<Ii")            # 8: STATUS_*, errno of the error that stopped the process
+U64 = struct.Struct("<Q")                # 16: write counter (samples written)
+I64 = struct.Struct("<q")                # 24: heartbeat (perf_counter_ns), 32: process id
+OFFSET_STATUS = 8
+OFFSET_WRITE_SEQ = 16
+OFFSET_HEARTBEAT = 24
+OFFSET_PID = 32
+OFFSET_MESSAGE = 40                      # Error message, UTF-8, NUL padded
+MESSAGE_SIZE = 216
+HEADER_SIZE = OFFSET_MESSAGE + MESSAGE_SIZE
+
+# Slot: stamp, t, x, y, z, roll, pitch, yaw, button mask, button count, stamp
+SLOT = struct.Struct("<Qq6dIIQ")
+
+# Wake-up record the device process writes to its stdout: t, axes, button mask, button count
+NOTIFY = struct.Struct("<q6dII")
+
+STATUS_STARTING = 0
+STATUS_RUNNING = 1
+STATUS_ERROR = 2
+STATUS_STOPPED = 3
+
+def ring_size(capacity):
+    return HEADER_SIZE + capacity * SLOT.size
+
+def ring_directory():
+    return "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+class SharedRingWriter:
+    """Producer side, used by the device process"""
+    def __init__(self, path):
+        with open(path, "r+b") as f:
+            self._buffer = mmap.mmap(f.fileno(), 0)
+        magic, self.capacity = MAGIC_CAPACITY.unpack_from(self._buffer, 0)
+        if magic != RING_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a SpaceMouse sample ring")
+        self._seq = U64.unpack_from(self._buffer, OFFSET_WRITE_SEQ)[0]
+
+    def push(self, t, x, y, z, roll, pitch, yaw, mask, button_count):
+        seq = self._seq
+        stamp = seq + 1   # Zeroed memory never matches a stamp
+        SLOT.pack_into(self._buffer, HEADER_SIZE + (seq % self.capacity) * SLOT.size,
+                       stamp, t, x, y, z, roll, pitch, yaw, mask, button_count, stamp)
+        self._seq = stamp
+        U64.pack_into(self._buffer, OFFSET_WRITE_SEQ, stamp)
+
+    def beat(self, now_ns):
+        I64.pack_into(self._buffer, OFFSET_HEARTBEAT, now_ns)
+
+    def set_status(self, status, error=None):
+        code = getattr(error, "errno", None) or 0
+        if error is not None:
+            # The reader raises OSError(code, message) itself, so store only the message part
+            message = (getattr(error, "strerror", None) or str(error)).encode("utf-8", "replace")[:MESSAGE_SIZE]
+            self._buffer[OFFSET_MESSAGE:OFFSET_MESSAGE + MESSAGE_SIZE] = message.ljust(MESSAGE_SIZE, b"\0")
+        STATUS.pack_into(self._buffer, OFFSET_STATUS, status, code)
+
+    def set_pid(self, pid):
+        I64.pack_into(self._buffer, OFFSET_PID, pid)
+
+    def close(self):
+        buffer = self._buffer
+        self._buffer = None
+        buffer.close()
+
+class SharedRingReader:
+    """Consumer side in Krita; creates and owns the ring file"""
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        handle, self.path = tempfile.mkstemp(prefix="spacemouse-", suffix=".ring", dir=ring_directory())
+        try:
+            os.ftruncate(handle, ring_size(capacity))  # Zero-filled
+            self._buffer = mmap.mmap(handle, ring_size(capacity))
+        except OSError:
+            os.close(handle)
+            os.unlink(self.path)
+            raise
+        os.close(handle)
+        MAGIC_CAPACITY.pack_into(self._buffer, 0, RING_MAGIC, capacity)
+        self._next = 0              # Sequence of the next sample to read
+        self._buttons = {}          # (mask, count) -> buttons tuple, so drains do not rebuild them
+        self.dropped = 0            # Samples overwritten before they were read
+
+    def drain(self):
+        """Every sample written since the last drain, oldest first"""
+        buffer = self._buffer
+        head = U64.unpack_from(buffer, OFFSET_WRITE_SEQ)[0]
+        seq = self._next
+        if head == seq:
+            return []
+        if head - seq > self.capacity:
+            self.dropped += head - seq - self.capacity
+            seq = head - self.capacity
+        self._next = head
+        capacity = self.capacity
+        unpack = SLOT.unpack_from
+        buttons_cache = self._buttons
+        samples = []
+        append = samples.append
+        while seq < head:
+            stamp, t, x, y, z, roll, pitch, yaw, mask, count, end_stamp = unpack(
+                buffer, HEADER_SIZE + (seq % capacity) * SLOT.size)
+            seq += 1
+            if stamp != seq or end_stamp != seq:
+                self.dropped += 1
+                continue
+            buttons = buttons_cache.get((mask, count))
+            if buttons is None:
+                buttons = buttons_cache[(mask, count)] = mask_to_buttons(mask, count)
+            append(DeviceSample(t, x, y, z, roll, pitch, yaw, buttons))
+        return samples
+
+    def status(self):
+        """(STATUS_*, errno) as last set by the writer"""
+        return STATUS.unpack_from(self._buffer, OFFSET_STATUS)
+
+    def error_message(self):
+        message = bytes(self._buffer[OFFSET_MESSAGE:OFFSET_MESSAGE + MESSAGE_SIZE]).rstrip(b"\0")
+        return message.decode("utf-8", "replace")
+
+    def heartbeat(self):
+        return I64.unpack_from(self._buffer, OFFSET_HEARTBEAT)[0]
+
+    def pid(self):
+        return I64.unpack_from(self._buffer, OFFSET_PID)[0]
+
+    def close(self):
+        """Unmap and remove the ring file"""
+        buffer = self._buffer
+        self._buffer = None
+        buffer.close()
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass  # Already gone
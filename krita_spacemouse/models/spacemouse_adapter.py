@@ -1,14 +1,21 @@
 """
 SpaceMouse device adapter for Krita SpaceMouse plugin.
-Provides interface between spacenavigator library and the plugin.
+Provides interface between the device backends and the plugin.
 """
 
-import spacenavigator
+import threading
+import time
 from PyQt5 import QtCore
+from .sample_ring import SampleRing, DeviceSample, is_deflected
+from .device_reader import DeviceReader
+from .device_merge import InputMerger
+from .recorder import SampleRecorder, buttons_to_mask
+from .latency_tracer import TRACK_READER
+from .event_buffer import SpaceMouseEventBuffer, MOTION_EVENT, BUTTON_EVENT, EVENT_FIELDS
+from .backends import create_default_backend, default_backend_class
 
-# Constants for event types
-MOTION_EVENT = 1
-BUTTON_EVENT = 2
+# Scale from [-1, 1] range to integer range similar to libspnav
+EVENT_SCALE = 350
 
 class SpaceMouseMotionEvent:
     """Motion event data structure"""
@@ -44,15 +51,58 @@ class SpaceMouseAdapter:
     def __init__(self):
         # Global variables for device state
         self._spacemouse_device = None
-        self._last_state = None
-        self._button_states = {}
+        self._backend = create_default_backend()
+        # Events derived from reader samples, waiting for poll_device_event(s)
+        self._events = SpaceMouseEventBuffer()
+        self._event_lock = threading.Lock()
+        self._event_axes = [0] * 6    # Last queued motion, libspnav units
+        self._event_motion_t = 0      # Timestamp of the last queued motion (for period)
+        self._button_mask = 0         # Current button states, bit n = button n
+        self._event_mask = MOTION_EVENT | BUTTON_EVENT  # Event types queued (spnav_evmask)
+        self._button_callback = None
+        # Background reader threads (one per open device) feeding the sample ring
+        self._ring = SampleRing()
+        self._readers = ()     # DeviceReader per open device; slot 0 is the primary device
+        self._merger = InputMerger()
+        # Optional device process publishing into shared memory, replacing the reader threads
+        self.process_mode = False
+        self._process = None
+        self._reader_error = None
+        self._last_sample = None
+        self._motion_callback = None
+        self._recorder = None
+        self.tracer = None  # Optional LatencyTracer for HID read spans
+
+    def set_backend(self, backend):
+        """Swap the device backend (e.g. a ReplayBackend); closes any open device first"""
+        self.close_device()
+        self._backend = backend
+
+    def get_backend(self):
+        return self._backend
+
+    def restore_default_backend(self):
+        """Return to the platform's hardware backend after a replay"""
+        if not isinstance(self._backend, default_backend_class()):
+            self.set_backend(create_default_backend())
+
+    def set_process_mode(self, enabled):
+        """Read the device in a separate process from the next open_device() on"""
+        self.process_mode = enabled
 
     def open_device(self, device_number=0, device_name=None):
-        """Open connection to SpaceMouse device"""
+        """Open connection to SpaceMouse device (the primary device; closes any others)"""
         try:
-            self._spacemouse_device = spacenavigator.open(DeviceNumber=device_number, device=device_name)
+            self._close_readers()
+            if self.process_mode:
+                result = self._open_process(device_number, device_name)
+                if result is not None:
+                    return result
+            self._spacemouse_device = self._backend.open(device_number, device_name)
             if self._spacemouse_device:
                 QtCore.qDebug("Connected to SpaceMouse device")
+                self._readers = (self._make_reader(0, self._backend, self._spacemouse_device),)
+                self._start_reader()
                 return 0  # Success
             else:
                 QtCore.qWarning("No SpaceMouse device found")
@@ -61,86 +111,315 @@ class SpaceMouseAdapter:
             QtCore.qCritical(f"Error opening SpaceMouse: {e}")
             return -1
 
+    def _open_process(self, device_number, device_name):
+        """Open the device in a device process; None if it cannot run (falls back to a reader thread)"""
+        from .process_reader import ProcessReader, ProcessReaderError
+        process = ProcessReader(self._backend, self._on_process_notify)
+        try:
+            process.start(device_number, device_name)
+        except ProcessReaderError as e:
+            QtCore.qWarning(f"{e}; reading the SpaceMouse in-process")
+            return None
+        # The device opens in the background; a failure surfaces from the next read
+        self._process = process
+        self._spacemouse_device = process
+        self._start_reader()
+        QtCore.qDebug(f"Opening SpaceMouse device in process {process.process.pid}")
+        return 0
+
+    def add_device(self, device_number=0, device_name=None, backend=None, axis_config=None):
+        """Open an additional device merged into the same stream; returns its slot or -1"""
+        if not self._spacemouse_device:
+            QtCore.qWarning("Connect a primary SpaceMouse before adding another device")
+            return -1
+        if self._process is not None:
+            QtCore.qWarning("Additional devices are not supported with the out-of-process reader")
+            return -1
+        backend = backend if backend is not None else create_default_backend()
+        try:
+            handle = backend.open(device_number, device_name)
+            if not handle:
+                QtCore.qWarning(f"No SpaceMouse device found: {device_name} (#{device_number})")
+                return -1
+        except Exception as e:
+            QtCore.qCritical(f"Error opening SpaceMouse: {e}")
+            return -1
+        reader = self._make_reader(len(self._readers), backend, handle, axis_config)
+        # Readers iterate a snapshot, so replacing the tuple is safe while threads run
+        self._readers = self._readers + (reader,)
+        reader.start()
+        QtCore.qDebug(f"Added SpaceMouse device {device_name} (#{device_number}) as slot {reader.slot}")
+        return reader.slot
+
+    def device_count(self):
+        return 1 if self._process is not None else len(self._readers)
+
+    def set_axis_config(self, slot, axis_config):
+        """Per-device AxisConfig (gain/invert per axis), or None for identity"""
+        self._readers[slot].axis_config = axis_config
+
+    def set_combine_rule(self, rule, owners=None):
+        """How several devices are merged: COMBINE_SUM, COMBINE_PRIORITY or COMBINE_OWNERSHIP"""
+        self._merger.configure(rule, owners)
+
     def close_device(self):
-        """Close connection to SpaceMouse device"""
+        """Close connection to every open SpaceMouse device"""
         try:
-            if self._spacemouse_device:
-                spacenavigator.close()
-                self._spacemouse_device = None
+            self.stop_recording()
+            had_device = bool(self._spacemouse_device)
+            self._close_readers()
+            if had_device:
                 QtCore.qDebug("SpaceMouse connection closed")
             return 0
         except Exception as e:
             QtCore.qCritical(f"Error closing SpaceMouse: {e}")
             return -1
 
+    def _make_reader(self, slot, backend, handle, axis_config=None):
+        return DeviceReader(slot, backend, handle, self._on_reader_sample, self._on_reader_error, axis_config)
+
+    def _close_readers(self):
+        """Stop every reader thread and close its backend"""
+        self._stop_reader()
+        readers = self._readers
+        self._readers = ()
+        for reader in readers:
+            reader.backend.close()
+        process = self._process
+        self._process = None
+        if process is not None:
+            process.stop()
+        self._merger.clear()
+        self._spacemouse_device = None
+
     def poll_device_event(self, event_wrapper):
-        """Poll for events from SpaceMouse device"""
+        """Poll for events from SpaceMouse device, one at a time (libspnav spnav_poll_event style)"""
         if not self._spacemouse_device:
             return 0  # No events
-        
-        try:
-            # Get current state
-            current_state = spacenavigator.read()
-            if not current_state:
+
+        with self._event_lock:
+            events = self._events
+            if not events.count:
                 return 0  # No events
-            
-            # Check for motion events (if state changed)
-            if self._last_state is None or (
-                current_state.x != self._last_state.x or 
-                current_state.y != self._last_state.y or 
-                current_state.z != self._last_state.z or
-                current_state.roll != self._last_state.roll or 
-                current_state.pitch != self._last_state.pitch or 
-                current_state.yaw != self._last_state.yaw
-            ):
-                # Scale from [-1, 1] range to integer range similar to libspnav
-                scale_factor = 350
-                event_wrapper.type = MOTION_EVENT
-                event_wrapper.event.motion.x = int(current_state.x * scale_factor)
-                event_wrapper.event.motion.y = int(current_state.y * scale_factor)
-                event_wrapper.event.motion.z = int(current_state.z * scale_factor)
-                event_wrapper.event.motion.rx = int(current_state.roll * scale_factor)
-                event_wrapper.event.motion.ry = int(current_state.pitch * scale_factor)
-                event_wrapper.event.motion.rz = int(current_state.yaw * scale_factor)
-                event_wrapper.event.motion.period = 0
-                
-                self._last_state = current_state
-                return 1  # Event available
-            
-            # Check for button events
-            for i, button_state in enumerate(current_state.buttons):
-                last_button_state = self._button_states.get(i, 0)
-                if button_state != last_button_state:
-                    event_wrapper.type = BUTTON_EVENT
-                    event_wrapper.event.button.bnum = i
-                    event_wrapper.event.button.press = button_state
-                    self._button_states[i] = button_state
-                    return 1  # Event available
-            
-            self._last_state = current_state
-            return 0  # No events
-            
-        except Exception as e:
-            QtCore.qCritical(f"Error polling SpaceMouse: {e}")
+            data = events.data
+            first = events.first
+            base = first * EVENT_FIELDS
+            event_wrapper.type = events.types[first]
+            if event_wrapper.type == MOTION_EVENT:
+                motion = event_wrapper.event.motion
+                motion.x, motion.y, motion.z = data[base], data[base + 1], data[base + 2]
+                motion.rx, motion.ry, motion.rz = data[base + 3], data[base + 4], data[base + 5]
+                motion.period = data[base + 6]
+            else:
+                event_wrapper.event.button.bnum = data[base]
+                event_wrapper.event.button.press = data[base + 1]
+            events.pop_front()
+            return 1  # Event available
+
+    def poll_device_events(self, buffer):
+        """Fill a caller-owned SpaceMouseEventBuffer with every event since the last call.
+
+        Returns the number of events. The buffer is cleared first and reused between
+        calls, so polling allocates nothing per event.
+        """
+        buffer.clear()
+        if not self._spacemouse_device:
             return 0
+        with self._event_lock:
+            self._events.copy_into(buffer)
+            self._events.clear()
+        return buffer.count
 
     def remove_events(self, event_type):
         """Remove events of specified type from queue"""
-        # The spacenavigator library doesn't queue events, so we just return 0
-        return 0
+        with self._event_lock:
+            return self._events.remove_type(event_type)
 
     def list_devices(self):
         """List all available SpaceMouse devices"""
         try:
-            devices = spacenavigator.list_devices()
-            return devices if devices else []
+            return self._backend.list_devices()
         except Exception as e:
             QtCore.qWarning(f"Error listing devices: {e}")
             return []
 
+    def set_motion_callback(self, callback):
+        """Register a thread-safe callable the reader invokes when a moving sample arrives"""
+        self._motion_callback = callback
+
+    def set_button_callback(self, callback):
+        """Register a thread-safe callable the reader invokes after queueing button events"""
+        self._button_callback = callback
+
+    def set_event_mask(self, mask):
+        """Select the event types queued for poll_device_event(s), e.g. BUTTON_EVENT only"""
+        with self._event_lock:
+            self._event_mask = mask
+            if not mask & MOTION_EVENT:
+                self._events.remove_type(MOTION_EVENT)
+
+    def start_recording(self, path):
+        """Record every sample the reader thread produces to a binary file"""
+        self.stop_recording()
+        self._recorder = SampleRecorder(path)
+        QtCore.qDebug(f"Recording SpaceMouse input to {path}")
+
+    def stop_recording(self):
+        """Stop recording; returns the number of samples written"""
+        recorder = self._recorder
+        if recorder is None:
+            return 0
+        self._recorder = None
+        recorder.close()
+        QtCore.qDebug(f"Recorded {recorder.count} SpaceMouse samples to {recorder.path}")
+        return recorder.count
+
+    def is_recording(self):
+        return self._recorder is not None
+
+    def _start_reader(self):
+        """Start the background threads that sample the devices into the ring buffer"""
+        self._stop_reader()
+        self._ring.clear()
+        self._reader_error = None
+        self._last_sample = None
+        with self._event_lock:
+            self._events.clear()
+            self._event_axes = [0] * 6
+            self._event_motion_t = 0
+            self._button_mask = 0
+        for reader in self._readers:
+            reader.start()
+
+    def _stop_reader(self):
+        """Stop the background reader threads and wait for them to exit"""
+        for reader in self._readers:
+            reader.stop()
+        self._last_sample = None
+
+    def _on_reader_error(self, error):
+        self._reader_error = error
+
+    def _on_reader_sample(self, reader, state, read_start):
+        """Reader thread callback - never touches Qt objects, only the ring buffer"""
+        read_end = time.perf_counter_ns()
+        if len(self._readers) == 1 and reader.axis_config is None:
+            # Single device: no merge step
+            sample = DeviceSample(read_end, state.x, state.y, state.z,
+                                  state.roll, state.pitch, state.yaw, tuple(state.buttons))
+        else:
+            sample = self._merger.update(reader.slot, state, reader.axis_config, read_end)
+        tracer = self.tracer
+        if tracer is not None:
+            tracer.span("hid read", read_start, read_end, TRACK_READER)
+        self._ring.push(sample)
+        recorder = self._recorder
+        if recorder is not None:
+            recorder.write(sample)
+        self._dispatch(sample)
+
+    def _on_process_notify(self, sample):
+        """Device process monitor callback: motion started or buttons changed (None: the process died)"""
+        if sample is None:
+            callback = self._motion_callback
+            if callback is not None:
+                callback()
+            return
+        self._dispatch(sample)
+
+    def _dispatch(self, sample):
+        """Queue events and run the wake-up callbacks for a new sample (reader or monitor thread)"""
+        if self._queue_events(sample):
+            button_callback = self._button_callback
+            if button_callback is not None:
+                button_callback()
+        callback = self._motion_callback
+        if callback is not None and is_deflected(sample):
+            callback()
+
+    def _queue_events(self, sample):
+        """Turn a reader sample into motion and button events (reader thread); True if a button changed"""
+        x = int(sample.x * EVENT_SCALE)
+        y = int(sample.y * EVENT_SCALE)
+        z = int(sample.z * EVENT_SCALE)
+        rx = int(sample.roll * EVENT_SCALE)
+        ry = int(sample.pitch * EVENT_SCALE)
+        rz = int(sample.yaw * EVENT_SCALE)
+        mask = buttons_to_mask(sample.buttons)
+        with self._event_lock:
+            events = self._events
+            axes = self._event_axes
+            moved = (x != axes[0] or y != axes[1] or z != axes[2] or
+                     rx != axes[3] or ry != axes[4] or rz != axes[5])
+            if moved and self._event_mask & MOTION_EVENT:
+                # Milliseconds since the previous motion event, as libspnav reports it
+                period = (sample.t - self._event_motion_t) // 1000000 if self._event_motion_t else 0
+                # A full queue folds the new state into its newest motion event
+                events.append_motion(x, y, z, rx, ry, rz, period)
+                axes[0], axes[1], axes[2], axes[3], axes[4], axes[5] = x, y, z, rx, ry, rz
+                self._event_motion_t = sample.t
+
+            changed = mask ^ self._button_mask
+            self._button_mask = mask
+            if not self._event_mask & BUTTON_EVENT:
+                return False
+            pending = changed
+            while pending:
+                bit = pending & -pending
+                events.append_button(bit.bit_length() - 1, 1 if mask & bit else 0)
+                pending ^= bit
+            return changed != 0
+
+    def read_device_samples(self):
+        """Drain all samples buffered by the reader thread, oldest first.
+
+        Never blocks on the device. A held puck produces no new reports, so when
+        nothing arrived since the last call the previous sample is repeated with the
+        current time.
+        """
+        error = self._reader_error
+        if error is not None:
+            self._reader_error = None
+            raise error
+
+        process = self._process
+        if process is None:
+            samples = self._ring.drain()
+        else:
+            # Read straight from shared memory; raises if the device process is unhealthy
+            samples = process.drain()
+            recorder = self._recorder
+            if recorder is not None:
+                for sample in samples:
+                    recorder.write(sample)
+        if samples:
+            self._last_sample = samples[-1]
+            return samples
+        if self._last_sample is None:
+            return samples
+        return [self._last_sample._replace(t=time.perf_counter_ns())]
+
     def read_device_state(self):
-        """Read current state from connected SpaceMouse device"""
-        return spacenavigator.read()
+        """Drain buffered samples and coalesce them into one state by averaging the axes"""
+        samples = self.read_device_samples()
+        if not samples:
+            return None
+
+        count = len(samples)
+        if count == 1:
+            return samples[0]
+        # Average the axes over the tick, keep the newest timestamp and buttons
+        latest = samples[-1]
+        return DeviceSample(
+            latest.t,
+            sum(s.x for s in samples) / count,
+            sum(s.y for s in samples) / count,
+            sum(s.z for s in samples) / count,
+            sum(s.roll for s in samples) / count,
+            sum(s.pitch for s in samples) / count,
+            sum(s.yaw for s in samples) / count,
+            latest.buttons,
+        )
 
 # Create the adapter instance
 adapter = SpaceMouseAdapter()
@@ -0,0 +1,137 @@
+"""
+Low-overhead timing histograms for the SpaceMouse hot path.
+Durations from perf_counter_ns go into fixed log-linear buckets (four per power of
+two), so recording is a couple of integer operations and never allocates per sample.
+"""
+
+from array import array
+
+# Buckets cover 1 ns to ~2^40 ns (18 minutes); four sub-buckets per octave
+SUB_BUCKET_BITS = 2
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+MAX_BIT_LENGTH = 40
+BUCKET_COUNT = (MAX_BIT_LENGTH + 1) * SUB_BUCKETS
+
+# Hot-path stages, in display order
+STAGE_TICK = 0        # Whole poll_spacenav call
+STAGE_TARGETS = 1     # Docker/view/scrollbar resolution
+STAGE_READ = 2        # Draining the reader ring
+STAGE_FILTER = 3      # Filter chain / dead zone
+STAGE_COMMIT = 4      # Frame commit (all canvas writes)
+STAGE_PAN = 5         # Scrollbar setValue
+STAGE_ZOOM = 6        # setZoomLevel
+STAGE_ROTATE = 7      # setRotation
+STAGE_DRIFT = 8       # |actual - expected| tick interval
+STAGE_NAMES = ("tick", "targets", "read", "filter", "commit", "pan", "zoom", "rotate", "timer drift")
+
+def bucket_index(ns):
+    """Log-linear bucket for a non-negative duration in nanoseconds"""
+    bits = ns.bit_length()
+    if bits <= SUB_BUCKET_BITS:
+        return ns
+    if bits > MAX_BIT_LENGTH:
+        return BUCKET_COUNT - 1
+    return (bits - SUB_BUCKET_BITS) * SUB_BUCKETS + ((ns >> (bits - SUB_BUCKET_BITS - 1)) & (SUB_BUCKETS - 1))
+
+def bucket_upper_bound(index):
+    """Largest duration (ns) that falls into a bucket"""
+    octave, sub = divmod(index, SUB_BUCKETS)
+    if octave == 0:
+        return sub
+    shift = octave + SUB_BUCKET_BITS - 1
+    base = 1 << shift
+    return base + (sub + 1) * (base >> SUB_BUCKET_BITS) - 1
+
+class StageHistogram:
+    """Fixed-bucket duration histogram"""
+    __slots__ = ('counts', 'total', 'maximum')
+
+    def __init__(self):
+        self.counts = array('Q', bytes(8 * BUCKET_COUNT))
+        self.total = 0
+        self.maximum = 0
+
+    def record(self, ns):
+        if ns < 0:
+            ns = 0
+        self.counts[bucket_index(ns)] += 1
+        self.total += 1
+        if ns > self.maximum:
+            self.maximum = ns
+
+    def percentile(self, fraction):
+        """Upper bound (ns) of the bucket holding the given fraction of samples"""
+        if not self.total:
+            return 0
+        target = max(1, int(self.total * fraction + 0.5))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(bucket_upper_bound(index), self.maximum)
+        return self.maximum
+
+    def reset(self):
+        for index in range(BUCKET_COUNT):
+            self.counts[index] = 0
+        self.total = 0
+        self.maximum = 0
+
+class HotPathStats:
+    """Per-stage histograms plus tick drift, skipped tick and error counters"""
+    def __init__(self):
+        self.histograms = [StageHistogram() for _ in STAGE_NAMES]
+        self.skipped_ticks = 0
+        self.errors = 0
+        self._last_tick_start = 0
+        self._last_expected = 0
+
+    def record(self, stage, ns):
+        self.histograms[stage].record(ns)
+
+    def record_tick_start(self, now_ns, expected_ms):
+        """Track timer drift and count ticks the timer failed to deliver"""
+        last = self._last_tick_start
+        self._last_tick_start = now_ns
+        previous_expected = self._last_expected
+        self._last_expected = expected_ms
+        # Skip the first tick and ticks straddling an interval change (e.g. idle back-off)
+        if not last or expected_ms <= 0 or expected_ms != previous_expected:
+            return
+        expected_ns = expected_ms * 1_000_000
+        actual_ns = now_ns - last
+        self.histograms[STAGE_DRIFT].record(abs(actual_ns - expected_ns))
+        # A gap of two or more intervals means ticks were lost (GUI thread busy)
+        missed = actual_ns // expected_ns - 1
+        if missed > 0:
+            self.skipped_ticks += missed
+
+    def record_error(self):
+        self.errors += 1
+
+    def break_tick_sequence(self):
+        """Forget the previous tick, e.g. after the interval changed or polling restarted"""
+        self._last_tick_start = 0
+
+    def reset(self):
+        for histogram in self.histograms:
+            histogram.reset()
+        self.skipped_ticks = 0
+        self.errors = 0
+        self._last_tick_start = 0
+
+    def rows(self):
+        """(stage, count, p50, p95, p99, max) per stage, durations in nanoseconds"""
+        return [
+            (name, h.total, h.percentile(0.50), h.percentile(0.95), h.percentile(0.99), h.maximum)
+            for name, h in zip(STAGE_NAMES, self.histograms)
+        ]
+
+    def to_csv(self):
+        """Render the statistics as CSV text (microseconds)"""
+        lines = ["stage,count,p50_us,p95_us,p99_us,max_us"]
+        for name, count, p50, p95, p99, maximum in self.rows():
+            lines.append(f"{name},{count},{p50 / 1000:.1f},{p95 / 1000:.1f},{p99 / 1000:.1f},{maximum / 1000:.1f}")
+        lines.append(f"skipped_ticks,{self.skipped_ticks},,,,")
+        lines.append(f"errors,{self.errors},,,,")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,58 @@
+"""
+Locally held canvas zoom for the SpaceMouse plugin.
+Zoom is integrated in log space: each tick adds z * zoom_scale to the natural log of
+the zoom, so zooming in and back out by the same deflection returns exactly to the
+starting level. Krita is only read when a zoom gesture starts or the view changes;
+during a gesture each tick is a single setZoomLevel call.
+"""
+
+import math
+
+# Krita's baseline DPI for zoom calculations
+BASELINE_DPI = 72.0
+
+# Zoom limits as fractions (5% to 3200%)
+MIN_LOG_ZOOM = math.log(0.05)
+MAX_LOG_ZOOM = math.log(32.0)
+
+# A pause longer than this ends a zoom gesture; the next tick resynchronises with
+# Krita so zoom changes made with the mouse or keyboard are picked up
+GESTURE_GAP_NS = 250000000
+
+class ZoomState:
+    """Zoom level and DPI factor for the current view"""
+    __slots__ = ('view', 'resolution', 'dpi_factor', 'log_zoom', 'last_write_t')
+
+    def __init__(self):
+        self.invalidate()
+
+    def invalidate(self):
+        """Forget the held zoom; the next tick reads it back from Krita"""
+        self.view = None
+        self.resolution = None
+        self.dpi_factor = 1.0
+        self.log_zoom = 0.0
+        self.last_write_t = 0
+
+    def sync(self, view, now_ns):
+        """Read zoom and resolution from Krita if the view (and so the document) changed or a new gesture starts"""
+        if view is self.view and now_ns - self.last_write_t < GESTURE_GAP_NS:
+            return
+        resolution = view.document().resolution()
+        if resolution != self.resolution:
+            self.resolution = resolution
+            self.dpi_factor = resolution / BASELINE_DPI
+        # zoomLevel() includes the DPI factor (Krita reading bug); setZoomLevel does not
+        self.log_zoom = math.log(max(view.canvas().zoomLevel() / self.dpi_factor, 1e-6))
+        self.view = view
+
+    def step(self, log_delta, now_ns):
+        """Add a log-space zoom delta; returns the new zoom fraction for setZoomLevel"""
+        log_zoom = self.log_zoom + log_delta
+        if log_zoom < MIN_LOG_ZOOM:
+            log_zoom = MIN_LOG_ZOOM
+        elif log_zoom > MAX_LOG_ZOOM:
+            log_zoom = MAX_LOG_ZOOM
+        self.log_zoom = log_zoom
+        self.last_write_t = now_ns
+        return math.exp(log_zoom)
@@ -0,0 +1,158 @@
+# navigation_targets.py - Cache of resolved navigation targets for the poll loop
+from krita import Krita
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication, QMdiArea, QScrollBar, QWidget
+from .models.log_limiter import RateLimitedLog
+
+DOCKER_OBJECT_NAME = "spacenavDocker"
+
+# Qt class names of Krita's canvas widgets (OpenGL and QPainter backends)
+CANVAS_WIDGET_CLASSES = ("KisOpenGLCanvas2", "KisQPainterCanvas")
+
+class NavigationTargets:
+    """Everything a poll tick needs to move the active view"""
+    __slots__ = ('window', 'view', 'canvas', 'subwindow', 'hscroll', 'vscroll', 'canvas_widget')
+
+    def __init__(self, window, view, canvas, subwindow, hscroll, vscroll, canvas_widget=None):
+        self.window = window
+        self.view = view
+        self.canvas = canvas
+        self.subwindow = subwindow
+        self.hscroll = hscroll
+        self.vscroll = vscroll
+        self.canvas_widget = canvas_widget  # Widget that actually paints the image, if found
+
+class NavigationTargetCache:
+    """Resolves the docker, view, MDI subwindow and scrollbars once and reuses them.
+
+    Per-window MDI areas and per-subwindow scrollbars are kept keyed by their Qt
+    objects. The current targets are dropped whenever Krita reports a view, subwindow
+    or window change, so a steady-state tick does no object-tree lookups.
+    """
+    def __init__(self):
+        self._current = None
+        self._docker = None
+        self._windows = {}        # QMainWindow -> (Window wrapper, QMdiArea)
+        self._scrollbars = {}     # QMdiSubWindow -> (hscroll, vscroll, canvas widget)
+        self._global_signals_connected = False
+        # Unresolved targets are retried every tick; log each problem once per interval
+        self._log = RateLimitedLog()
+
+    def invalidate(self, *args):
+        """Drop the current targets; the next tick resolves them again"""
+        self._current = None
+
+    def clear(self):
+        """Forget everything, including per-window and per-subwindow entries"""
+        self._current = None
+        self._docker = None
+        self._windows.clear()
+        self._scrollbars.clear()
+
+    def docker(self):
+        """Return the SpaceMouse docker, scanning Krita's dockers only on a cache miss"""
+        docker = self._docker
+        if docker is not None:
+            return docker
+        for d in Krita.instance().dockers():
+            if d.objectName() == DOCKER_OBJECT_NAME:
+                self.set_docker(d)
+                return d
+        return None
+
+    def set_docker(self, docker):
+        """Register the docker directly, e.g. from the docker factory"""
+        self._docker = docker
+        docker.destroyed.connect(self._docker_destroyed)
+
+    def resolve(self):
+        """Return the NavigationTargets for the active view, or None if there is no view"""
+        targets = self._current
+        if targets is not None:
+            return targets
+        return self._resolve()
+
+    def _resolve(self):
+        self._connect_global_signals()
+
+        window = Krita.instance().activeWindow()
+        if not window:
+            return None
+        view = window.activeView()
+        if not view:
+            return None
+        canvas = view.canvas()
+        if not canvas:
+            return None
+
+        qwin = window.qwindow()
+        entry = self._windows.get(qwin)
+        if entry is None:
+            mdi_area = qwin.findChild(QMdiArea)
+            if not mdi_area:
+                return None
+            # Keep the Window wrapper alive so its signal connection survives
+            entry = (window, mdi_area)
+            self._windows[qwin] = entry
+            window.activeViewChanged.connect(self.invalidate)
+            window.windowClosed.connect(self.clear)
+            mdi_area.subWindowActivated.connect(self.invalidate)
+            qwin.destroyed.connect(self.clear)
+        mdi_area = entry[1]
+
+        subwindow = mdi_area.currentSubWindow()
+        if not subwindow:
+            self._log.log("No subwindow found for panning")
+            return None
+
+        scrollbars = self._scrollbars.get(subwindow)
+        if scrollbars is None:
+            hscroll = vscroll = None
+            for sb in subwindow.findChildren(QScrollBar):
+                if sb.orientation() == Qt.Horizontal:
+                    hscroll = sb
+                elif sb.orientation() == Qt.Vertical:
+                    vscroll = sb
+            if not (hscroll and vscroll):
+                # Zoom and rotation still work; don't cache so panning is retried next tick
+                self._log.log("Scrollbars not found")
+                return NavigationTargets(window, view, canvas, subwindow, None, None)
+            canvas_widget = None
+            for widget in subwindow.findChildren(QWidget):
+                if widget.metaObject().className() in CANVAS_WIDGET_CLASSES:
+                    canvas_widget = widget
+                    break
+            scrollbars = (hscroll, vscroll, canvas_widget)
+            self._scrollbars[subwindow] = scrollbars
+            subwindow.destroyed.connect(self._subwindow_destroyed)
+            hscroll.destroyed.connect(self._subwindow_destroyed)
+            vscroll.destroyed.connect(self._subwindow_destroyed)
+            if canvas_widget is not None:
+                canvas_widget.destroyed.connect(self._subwindow_destroyed)
+
+        self._log.flush()
+        self._current = NavigationTargets(window, view, canvas, subwindow, *scrollbars)
+        return self._current
+
+    def _connect_global_signals(self):
+        """Invalidate on application-wide view and window changes"""
+        if self._global_signals_connected:
+            return
+        notifier = Krita.instance().notifier()
+        notifier.setActive(True)
+        notifier.viewCreated.connect(self.invalidate)
+        notifier.viewClosed.connect(self.invalidate)
+        notifier.imageClosed.connect(self.invalidate)
+        notifier.windowCreated.connect(self.invalidate)
+        app = QApplication.instance()
+        if app is not None:
+            app.focusWindowChanged.connect(self.invalidate)
+        self._global_signals_connected = True
+
+    def _subwindow_destroyed(self, *args):
+        # The sender is already half-destroyed, so drop all scrollbar entries
+        self._scrollbars.clear()
+        self._current = None
+
+    def _docker_destroyed(self, *args):
+        self._docker = None
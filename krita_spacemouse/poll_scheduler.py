@@ -0,0 +1,111 @@
+# poll_scheduler.py - Adaptive poll timer with idle back-off and reader-driven wake-up
+import time
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+# Interval used once the puck has rested in the dead zone for the idle timeout
+IDLE_POLL_RATE = 250  # 4 Hz
+
+# How often wake-up and CPU statistics are published
+STATS_PERIOD = 1.0
+
+class PollScheduler(QObject):
+    """Drives the poll tick from a QTimer and backs off while the puck is at rest.
+
+    In adaptive mode the timer drops to IDLE_POLL_RATE after idle_timeout seconds
+    without motion. The device reader thread calls notify_motion() on the first
+    non-zero sample, which wakes the scheduler through a queued signal and returns
+    it to the active rate immediately instead of waiting for the next idle tick.
+    """
+    # Emitted from the reader thread; delivered on the GUI thread via a queued connection
+    wake_requested = pyqtSignal()
+    # Wake-ups per second, tick CPU time in ms per second, idle flag
+    stats_updated = pyqtSignal(float, float, bool)
+
+    def __init__(self, tick_callback, parent=None):
+        super().__init__(parent)
+        self._tick_callback = tick_callback
+        self.timer = QTimer()
+        self.timer.timeout.connect(self._on_timeout)
+        self.wake_requested.connect(self.wake)
+
+        self._active_interval = 30
+        self._idle_timeout = 5.0
+        self.adaptive = True
+        self.idle = False
+        self._last_motion = time.perf_counter()
+
+        # Statistics window
+        self._stats_start = time.perf_counter()
+        self._stats_wakeups = 0
+        self._stats_cpu = 0.0
+
+    def start(self, interval):
+        """Start ticking at the active interval (milliseconds)"""
+        self._active_interval = interval
+        self.idle = False
+        self._last_motion = time.perf_counter()
+        self._reset_stats()
+        self.timer.start(interval)
+
+    def stop(self):
+        if self.timer.isActive():
+            self.timer.stop()
+        self.idle = False
+
+    def isActive(self):
+        return self.timer.isActive()
+
+    def configure(self, active_interval, idle_timeout, adaptive):
+        """Apply poll settings; takes effect on the running timer without restarting it"""
+        self._active_interval = active_interval
+        self._idle_timeout = idle_timeout
+        self.adaptive = adaptive
+        if not adaptive and self.idle:
+            self.idle = False
+            self._last_motion = time.perf_counter()
+        if not self.idle:
+            self.timer.setInterval(active_interval)
+
+    def report_activity(self, moving):
+        """Called by the poll tick with whether this tick produced any motion"""
+        now = time.perf_counter()
+        if moving:
+            self._last_motion = now
+            if self.idle:
+                self._leave_idle()
+        elif self.adaptive and not self.idle and now - self._last_motion >= self._idle_timeout:
+            self.idle = True
+            self.timer.setInterval(IDLE_POLL_RATE)
+
+    def notify_motion(self):
+        """Thread-safe: called by the device reader when a non-zero sample arrives"""
+        if self.idle:
+            self.wake_requested.emit()
+
+    def wake(self):
+        """Return to the active rate and tick immediately (GUI thread)"""
+        if not self.idle or not self.timer.isActive():
+            return
+        self._last_motion = time.perf_counter()
+        self._leave_idle()
+        self._on_timeout()
+
+    def _leave_idle(self):
+        self.idle = False
+        self.timer.setInterval(self._active_interval)
+
+    def _on_timeout(self):
+        cpu_start = time.thread_time()
+        self._tick_callback()
+        self._stats_cpu += time.thread_time() - cpu_start
+        self._stats_wakeups += 1
+
+        elapsed = time.perf_counter() - self._stats_start
+        if elapsed >= STATS_PERIOD:
+            self.stats_updated.emit(self._stats_wakeups / elapsed, self._stats_cpu * 1000.0 / elapsed, self.idle)
+            self._reset_stats()
+
+    def _reset_stats(self):
+        self._stats_start = time.perf_counter()
+        self._stats_wakeups = 0
+        self._stats_cpu = 0.0
@@ -0,0 +1,153 @@
+# profile_manager.py - Named motion profiles switched by document and tool
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtWidgets import QDockWidget, QToolButton
+from PyQt5 import QtCore
+from .models.profiles import ProfileSet, DEFAULT_PROFILE
+from .models.settings_store import SettingsWriter, read_settings
+
+class ProfileManager(QObject):
+    """Owns the in-memory profiles and follows the active document and tool.
+
+    Switching is event driven: the docker reports canvas changes and the toolbox
+    buttons report tool changes, and only then is the applicable profile resolved.
+    active_config is the compiled MotionConfig of the active profile, so the
+    extension publishes it with a single attribute write. Edits are persisted by a
+    SettingsWriter, coalesced and off the GUI thread.
+    """
+    # Name of the profile that now applies
+    profile_changed = pyqtSignal(str)
+    # Profiles were added, removed, loaded or rebound
+    profiles_changed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.profiles = ProfileSet()
+        self.writer = SettingsWriter()
+        self.bindings = {}            # Button bindings, persisted in the same file
+        self.active = DEFAULT_PROFILE
+        self.document = None          # File path of the active document
+        self.tool = None              # Id of the active Krita tool
+        self._toolbox = None
+
+    @property
+    def active_config(self):
+        return self.profiles.config(self.active)
+
+    def load(self):
+        """Read the settings file; returns the button bindings it holds (None without a file)"""
+        saved = read_settings()
+        if saved is None:
+            return None
+        snapshot, bindings = saved
+        self.profiles.load(snapshot)
+        self.bindings = bindings
+        self.profiles_changed.emit()
+        self._update_active(force=True)
+        return bindings
+
+    def save(self, delay=None):
+        """Queue the current state for the writer thread"""
+        self.writer.schedule(self.profiles.snapshot(), dict(self.bindings), delay)
+
+    def flush(self):
+        self.writer.flush()
+
+    # Editing (from the configuration tab)
+
+    def set_values(self, name, values):
+        """Replace a profile's slider values; republishes if it is the active profile"""
+        created = name not in self.profiles
+        self.profiles.set_values(name, values)
+        self.save()
+        if created:
+            self.profiles_changed.emit()
+        if name == self.active:
+            self.profile_changed.emit(name)
+
+    def set_bindings(self, bindings):
+        self.bindings = dict(bindings)
+        self.save()
+
+    def select(self, name):
+        """Switch to name now and use it wherever no document or tool binding applies"""
+        if name not in self.profiles:
+            return
+        self.profiles.selected = name
+        self.save()
+        # A manual switch holds until the document or tool changes
+        if name != self.active:
+            self.active = name
+            self.profile_changed.emit(name)
+
+    def remove(self, name):
+        if self.profiles.remove(name):
+            self.save()
+            self.profiles_changed.emit()
+            self._update_active()
+
+    def bind_document(self, name):
+        """Bind the active document to a profile (None removes the binding)"""
+        self._bind(self.profiles.document_profiles, self.document, name)
+
+    def bind_tool(self, name):
+        """Bind the active tool to a profile (None removes the binding)"""
+        self._bind(self.profiles.tool_profiles, self.tool, name)
+
+    def _bind(self, rules, key, name):
+        if not key:
+            return
+        if name is None:
+            rules.pop(key, None)
+        else:
+            rules[key] = name
+        self.save()
+        self.profiles_changed.emit()
+        self._update_active()
+
+    # Context tracking
+
+    def set_canvas(self, canvas):
+        """Docker canvas observer hook: follow the document shown in the active canvas"""
+        document = None
+        try:
+            view = canvas.view() if canvas is not None else None
+            document = view.document().fileName() if view is not None and view.document() else None
+        except Exception as e:
+            QtCore.qWarning(f"Error reading SpaceMouse canvas document: {e}")
+        self._watch_toolbox()
+        document = document or None  # Unsaved documents have no file name
+        if document != self.document:
+            self.document = document
+            self._update_active()
+
+    def _watch_toolbox(self):
+        """Connect to the toolbox buttons once, so tool changes arrive as signals"""
+        if self._toolbox is not None:
+            return
+        try:
+            from krita import Krita
+            window = Krita.instance().activeWindow()
+            toolbox = window.qwindow().findChild(QDockWidget, "ToolBox") if window else None
+        except Exception:
+            toolbox = None
+        if toolbox is None:
+            return
+        self._toolbox = toolbox
+        for button in toolbox.findChildren(QToolButton):
+            tool = button.objectName()
+            if not tool:
+                continue
+            button.toggled.connect(lambda checked, tool=tool: checked and self.set_tool(tool))
+            if button.isChecked():
+                self.tool = tool
+
+    def set_tool(self, tool):
+        if tool != self.tool:
+            self.tool = tool
+            self._update_active()
+
+    def _update_active(self, force=False):
+        name = self.profiles.resolve(self.document, self.tool)
+        if name != self.active or force:
+            self.active = name
+            self.profile_changed.emit(name)
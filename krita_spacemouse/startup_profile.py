@@ -0,0 +1,14 @@
+# startup_profile.py - Records what the plugin adds to Krita's launch
+import time
+
+# Stage name -> milliseconds, in the order recorded
+STARTUP_TIMES = {}
+
+def record(name, start):
+    """Record the time since start (a perf_counter value) under name; returns the milliseconds"""
+    elapsed = (time.perf_counter() - start) * 1000.0
+    STARTUP_TIMES[name] = elapsed
+    return elapsed
+
+def summary():
+    return ", ".join(f"{name} {ms:.1f} ms" for name, ms in STARTUP_TIMES.items())
@@ -0,0 +1,74 @@
+# transform_batch.py - Groups pan, zoom and rotation into a single canvas update
+import time
+from PyQt5.QtCore import QObject, QEvent, pyqtSignal
+
+# How often repaint statistics are published
+STATS_PERIOD = 1.0
+
+class TransformBatch(QObject):
+    """Suppresses canvas repaints while a frame's transform is applied.
+
+    Scrollbar moves, setZoomLevel and setRotation each schedule their own canvas
+    update. Between begin() and end() updates are disabled on the canvas widget, so
+    re-enabling them produces one repaint for the combined pan/zoom/rotation delta.
+    Paint events on the canvas widget are counted to report repaints per commit,
+    which can be compared with batching switched off.
+    """
+    # Repaints per commit over the last period, whether batching was enabled
+    stats_updated = pyqtSignal(float, bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.enabled = True
+        self.tracer = None  # LatencyTracer notified of the first paint after a commit
+        self.latency_probe = None  # MotionPredictor measuring tick-to-paint latency
+        self._watched = None
+        self._suppressed = None
+        self._paints = 0
+        self._commits = 0
+        self._stats_start = time.perf_counter()
+
+    def begin(self, targets):
+        """Start a batch for the given NavigationTargets"""
+        widget = targets.canvas_widget or targets.subwindow
+        self._watch(widget)
+        if self.enabled and widget is not None and widget.updatesEnabled():
+            widget.setUpdatesEnabled(False)
+            self._suppressed = widget
+
+    def end(self):
+        """Finish the batch; re-enabling updates schedules exactly one repaint"""
+        widget = self._suppressed
+        if widget is not None:
+            self._suppressed = None
+            widget.setUpdatesEnabled(True)
+        self._commits += 1
+
+        elapsed = time.perf_counter() - self._stats_start
+        if elapsed >= STATS_PERIOD:
+            self.stats_updated.emit(self._paints / self._commits, self.enabled)
+            self._paints = 0
+            self._commits = 0
+            self._stats_start = time.perf_counter()
+
+    def _watch(self, widget):
+        """Move the paint-event filter to the current canvas widget"""
+        if widget is self._watched:
+            return
+        if self._watched is not None:
+            try:
+                self._watched.removeEventFilter(self)
+            except RuntimeError:
+                pass  # Widget already deleted
+        self._watched = widget
+        if widget is not None:
+            widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            self._paints += 1
+            if self.tracer is not None:
+                self.tracer.paint()
+            if self.latency_probe is not None:
+                self.latency_probe.paint()
+        return False
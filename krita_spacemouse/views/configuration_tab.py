@@ -1,14 +1,45 @@
 # tabs/configuration_tab.py - Configuration controls for SpaceMouse
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QSlider, QPushButton, QHBoxLayout
-from PyQt5.QtCore import Qt, QSettings
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QSlider, QPushButton, QHBoxLayout, QCheckBox, QComboBox,
+                             QTableWidget, QTableWidgetItem, QHeaderView, QInputDialog)
+from PyQt5.QtCore import Qt
 from PyQt5 import QtCore
-import os
+from ..models.button_map import DEFAULT_BUTTON_BINDINGS, parse_trigger
+from ..models.settings_store import settings_path, motion_config_from_settings, DEFAULT_PROFILE, DEFAULT_VALUES
+from ..models.axis_mapping import (AXIS_NAMES, OUTPUT_NAMES, MAPPING_PRESETS, STANDARD_MATRIX, format_matrix,
+                                   parse_matrix, format_axis_values, parse_axis_values, clamp_curve)
+from ..models.predictor import PREDICTION_MODEL_NAMES
 
 class ConfigurationTab(QWidget):
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
         self.layout = QVBoxLayout()
+        self._loading = False  # Widgets are being filled from a profile; do not publish
+
+        # Named profiles; the controls below edit the active one
+        profile_layout = QHBoxLayout()
+        self.profile_combo = QComboBox()
+        self.profile_combo.activated.connect(self.select_profile)
+        profile_layout.addWidget(self.profile_combo, 1)
+
+        self.new_profile_button = QPushButton("New")
+        self.new_profile_button.clicked.connect(self.new_profile)
+        profile_layout.addWidget(self.new_profile_button)
+
+        self.delete_profile_button = QPushButton("Delete")
+        self.delete_profile_button.clicked.connect(self.delete_profile)
+        profile_layout.addWidget(self.delete_profile_button)
+        self.layout.addLayout(profile_layout)
+
+        profile_binding_layout = QHBoxLayout()
+        self.document_profile_checkbox = QCheckBox("Use for this document")
+        self.document_profile_checkbox.clicked.connect(self.bind_document)
+        profile_binding_layout.addWidget(self.document_profile_checkbox)
+
+        self.tool_profile_checkbox = QCheckBox("Use for current tool")
+        self.tool_profile_checkbox.clicked.connect(self.bind_tool)
+        profile_binding_layout.addWidget(self.tool_profile_checkbox)
+        self.layout.addLayout(profile_binding_layout)
 
         # Pan scale control (pixels per unit movement)
         self.pan_scale_slider = QSlider(Qt.Horizontal)
@@ -50,6 +81,92 @@ class ConfigurationTab(QWidget):
         self.layout.addWidget(self.dead_zone_label)
         self.layout.addWidget(self.dead_zone_slider)
 
+        # Input smoothing filter (requires NumPy)
+        self.smoothing_mode_combo = QComboBox()
+        self.smoothing_mode_combo.addItems(["Smoothing: Off", "Smoothing: Exponential", "Smoothing: One-Euro"])
+        self.smoothing_mode_combo.setCurrentIndex(2)
+        self.layout.addWidget(self.smoothing_mode_combo)
+
+        self.smoothing_slider = QSlider(Qt.Horizontal)
+        self.smoothing_slider.setMinimum(1)      # 1ms time constant
+        self.smoothing_slider.setMaximum(100)    # 100ms time constant
+        self.smoothing_slider.setValue(20)       # 20ms default
+        self.smoothing_slider.valueChanged.connect(self.update_smoothing)
+        self.smoothing_label = QLabel(f"Smoothing: {self.smoothing_slider.value()}ms")
+        self.layout.addWidget(self.smoothing_label)
+        self.layout.addWidget(self.smoothing_slider)
+
+        # Expo response curve (0% linear, 100% cubic)
+        self.expo_slider = QSlider(Qt.Horizontal)
+        self.expo_slider.setMinimum(0)       # Linear
+        self.expo_slider.setMaximum(100)     # Fully cubic
+        self.expo_slider.setValue(0)         # Linear default
+        self.expo_slider.valueChanged.connect(self.update_expo)
+        self.expo_label = QLabel(f"Expo Curve: {self.expo_slider.value()}%")
+        self.layout.addWidget(self.expo_label)
+        self.layout.addWidget(self.expo_slider)
+
+        # Inertial glide: motion keeps going after release and decays at the damping rate
+        self.inertia_checkbox = QCheckBox("Inertial Glide")
+        self.inertia_checkbox.setChecked(False)
+        self.inertia_checkbox.toggled.connect(self.update_inertia_enabled)
+        self.layout.addWidget(self.inertia_checkbox)
+
+        self.inertia_slider = QSlider(Qt.Horizontal)
+        self.inertia_slider.setMinimum(0)       # Follows input instantly
+        self.inertia_slider.setMaximum(300)     # 300ms response time
+        self.inertia_slider.setValue(80)        # 80ms default
+        self.inertia_slider.valueChanged.connect(self.update_inertia)
+        self.inertia_label = QLabel(f"Inertia: {self.inertia_slider.value()}ms")
+        self.layout.addWidget(self.inertia_label)
+        self.layout.addWidget(self.inertia_slider)
+
+        self.damping_slider = QSlider(Qt.Horizontal)
+        self.damping_slider.setMinimum(5)       # 0.5/s, long glide
+        self.damping_slider.setMaximum(100)     # 10.0/s, short glide
+        self.damping_slider.setValue(30)        # 3.0/s default
+        self.damping_slider.valueChanged.connect(self.update_damping)
+        self.damping_label = QLabel(f"Damping: {self.damping_slider.value() / 10.0:.1f}/s")
+        self.layout.addWidget(self.damping_label)
+        self.layout.addWidget(self.damping_slider)
+        self.update_inertia_enabled(False)
+
+        # Motion prediction: lead the canvas by the measured tick-to-paint latency
+        self.prediction_checkbox = QCheckBox("Motion Prediction")
+        self.prediction_checkbox.setChecked(False)
+        self.prediction_checkbox.toggled.connect(self.update_prediction_enabled)
+        self.layout.addWidget(self.prediction_checkbox)
+
+        self.prediction_model_combo = QComboBox()
+        self.prediction_model_combo.addItems([f"Prediction: {name}" for name in PREDICTION_MODEL_NAMES])
+        self.prediction_model_combo.setCurrentIndex(0)
+        self.layout.addWidget(self.prediction_model_combo)
+
+        self.prediction_slider = QSlider(Qt.Horizontal)
+        self.prediction_slider.setMinimum(0)       # No lead
+        self.prediction_slider.setMaximum(100)     # The full measured latency
+        self.prediction_slider.setValue(100)       # 100% default
+        self.prediction_slider.valueChanged.connect(self.update_prediction)
+        self.prediction_label = QLabel(f"Latency Compensation: {self.prediction_slider.value()}%")
+        self.layout.addWidget(self.prediction_label)
+        self.layout.addWidget(self.prediction_slider)
+        self.update_prediction_enabled(False)
+
+        # Axis mapping: per-axis dead zone/expo (blank uses the sliders above) and the axis-to-action matrix
+        self.layout.addWidget(QLabel("Axis Mapping (blank dead zone/expo uses the global value):"))
+        self.mapping_preset_combo = QComboBox()
+        self.mapping_preset_combo.addItems(["Custom"] + [name for name, matrix in MAPPING_PRESETS])
+        self.mapping_preset_combo.activated.connect(self.apply_mapping_preset)
+        self.layout.addWidget(self.mapping_preset_combo)
+
+        self.axis_table = QTableWidget(len(AXIS_NAMES), 2 + len(OUTPUT_NAMES))
+        self.axis_table.setHorizontalHeaderLabels(["Dead Zone %", "Expo %"] + list(OUTPUT_NAMES))
+        self.axis_table.setVerticalHeaderLabels(list(AXIS_NAMES))
+        self.axis_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.layout.addWidget(self.axis_table)
+        self._axis_matrix = STANDARD_MATRIX  # Keeps the rows of outputs without a column
+        self.set_axis_mapping(format_matrix(STANDARD_MATRIX), ",,,,,", ",,,,,")
+
         # Poll rate control
         self.poll_rate_slider = QSlider(Qt.Horizontal)
         self.poll_rate_slider.setMinimum(5)    # 5ms = 200Hz
@@ -60,6 +177,47 @@ class ConfigurationTab(QWidget):
         self.layout.addWidget(self.poll_rate_label)
         self.layout.addWidget(self.poll_rate_slider)
 
+        # Adaptive polling: back off to a low rate while the puck is at rest
+        self.adaptive_polling_checkbox = QCheckBox("Adaptive Polling (idle back-off)")
+        self.adaptive_polling_checkbox.setChecked(True)
+        self.adaptive_polling_checkbox.toggled.connect(self.update_adaptive_polling)
+        self.layout.addWidget(self.adaptive_polling_checkbox)
+
+        self.idle_timeout_slider = QSlider(Qt.Horizontal)
+        self.idle_timeout_slider.setMinimum(1)     # 1 second
+        self.idle_timeout_slider.setMaximum(60)    # 60 seconds
+        self.idle_timeout_slider.setValue(5)       # 5 seconds default
+        self.idle_timeout_slider.valueChanged.connect(self.update_idle_timeout)
+        self.idle_timeout_label = QLabel(f"Idle After: {self.idle_timeout_slider.value()}s at rest")
+        self.layout.addWidget(self.idle_timeout_label)
+        self.layout.addWidget(self.idle_timeout_slider)
+
+        # Batch pan/zoom/rotation into a single canvas repaint per frame
+        self.batch_transforms_checkbox = QCheckBox("Batch Canvas Updates")
+        self.batch_transforms_checkbox.setChecked(True)
+        self.layout.addWidget(self.batch_transforms_checkbox)
+
+        # Button bindings: trigger ("1", "1+2", "2 hold") -> Krita action name
+        self.layout.addWidget(QLabel("Button Actions (e.g. 1, 1+2, 2 hold):"))
+        self.button_table = QTableWidget(0, 2)
+        self.button_table.setHorizontalHeaderLabels(["Trigger", "Krita Action"])
+        self.button_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.button_table.verticalHeader().setVisible(False)
+        self.layout.addWidget(self.button_table)
+
+        binding_layout = QHBoxLayout()
+
+        self.add_binding_button = QPushButton("Add")
+        self.add_binding_button.clicked.connect(self.add_binding)
+        binding_layout.addWidget(self.add_binding_button)
+
+        self.remove_binding_button = QPushButton("Remove")
+        self.remove_binding_button.clicked.connect(self.remove_binding)
+        binding_layout.addWidget(self.remove_binding_button)
+
+        self.layout.addLayout(binding_layout)
+        self.set_button_bindings(DEFAULT_BUTTON_BINDINGS)
+
         # Settings buttons
         button_layout = QHBoxLayout()
         
@@ -75,6 +233,29 @@ class ConfigurationTab(QWidget):
 
         self.layout.addStretch()
         self.setLayout(self.layout)
+
+        # Rebuild the motion settings snapshot only when a slider actually changes
+        self.motion_config = None
+        for slider in (self.pan_scale_slider, self.zoom_scale_slider, self.rotation_speed_slider,
+                       self.dead_zone_slider, self.poll_rate_slider, self.idle_timeout_slider,
+                       self.smoothing_slider, self.expo_slider, self.inertia_slider, self.damping_slider,
+                       self.prediction_slider):
+            slider.valueChanged.connect(self.publish_motion_config)
+        self.smoothing_mode_combo.currentIndexChanged.connect(self.publish_motion_config)
+        self.adaptive_polling_checkbox.toggled.connect(self.publish_motion_config)
+        self.batch_transforms_checkbox.toggled.connect(self.publish_motion_config)
+        self.inertia_checkbox.toggled.connect(self.publish_motion_config)
+        self.prediction_checkbox.toggled.connect(self.publish_motion_config)
+        self.prediction_model_combo.currentIndexChanged.connect(self.publish_motion_config)
+        self.axis_table.itemChanged.connect(self.publish_motion_config)
+        self.axis_table.itemChanged.connect(self.update_mapping_preset)
+        self.button_table.itemChanged.connect(self.publish_button_bindings)
+
+        # Follow profile switches made by document/tool changes
+        profiles = self.get_profiles()
+        if profiles is not None:
+            profiles.profile_changed.connect(self.show_profile)
+            profiles.profiles_changed.connect(self.update_profile_list)
         
         # Load settings on initialization
         self.load_settings()
@@ -91,11 +272,272 @@ class ConfigurationTab(QWidget):
     def update_dead_zone(self, value):
         self.dead_zone_label.setText(f"Dead Zone: {value / 10.0}%")
 
+    def update_smoothing(self, value):
+        self.smoothing_label.setText(f"Smoothing: {value}ms")
+
+    def update_expo(self, value):
+        self.expo_label.setText(f"Expo Curve: {value}%")
+
+    def update_inertia_enabled(self, checked):
+        self.inertia_slider.setEnabled(checked)
+        self.damping_slider.setEnabled(checked)
+
+    def update_inertia(self, value):
+        self.inertia_label.setText(f"Inertia: {value}ms")
+
+    def update_damping(self, value):
+        self.damping_label.setText(f"Damping: {value / 10.0:.1f}/s")
+
+    def update_prediction_enabled(self, checked):
+        self.prediction_model_combo.setEnabled(checked)
+        self.prediction_slider.setEnabled(checked)
+
+    def update_prediction(self, value):
+        self.prediction_label.setText(f"Latency Compensation: {value}%")
+
     def update_poll_rate(self, value):
+        # The running timer picks up the new interval through publish_motion_config
         self.poll_rate_label.setText(f"Poll Rate: {value}ms")
-        # Update the extension's timer if it exists
-        if hasattr(self.parent, 'extension') and self.parent.extension and hasattr(self.parent.extension, 'timer'):
-            self.parent.extension.timer.setInterval(value)
+
+    def update_idle_timeout(self, value):
+        self.idle_timeout_label.setText(f"Idle After: {value}s at rest")
+
+    def update_adaptive_polling(self, checked):
+        self.idle_timeout_slider.setEnabled(checked)
+
+    def build_motion_config(self):
+        """Build an immutable snapshot of the current control values"""
+        return motion_config_from_settings(self.get_values())
+
+    def publish_motion_config(self, *args):
+        """Rebuild the snapshot and store it in the active profile, which republishes it to the extension"""
+        if self._loading:
+            return
+        self.motion_config = self.build_motion_config()
+        profiles = self.get_profiles()
+        if profiles is not None:
+            profiles.set_values(profiles.active, self.get_values())
+
+    def get_values(self):
+        """Current control values in slider units, keyed as in the settings file"""
+        return {
+            "pan_scale": self.pan_scale_slider.value(),
+            "zoom_scale": self.zoom_scale_slider.value(),
+            "rotation_speed": self.rotation_speed_slider.value(),
+            "dead_zone": self.dead_zone_slider.value(),
+            "poll_rate": self.poll_rate_slider.value(),
+            "idle_timeout": self.idle_timeout_slider.value(),
+            "adaptive_polling": self.adaptive_polling_checkbox.isChecked(),
+            "batch_transforms": self.batch_transforms_checkbox.isChecked(),
+            "smoothing_mode": self.smoothing_mode_combo.currentIndex(),
+            "smoothing": self.smoothing_slider.value(),
+            "expo": self.expo_slider.value(),
+            "inertia_enabled": self.inertia_checkbox.isChecked(),
+            "inertia": self.inertia_slider.value(),
+            "damping": self.damping_slider.value(),
+            "prediction_enabled": self.prediction_checkbox.isChecked(),
+            "prediction_model": self.prediction_model_combo.currentIndex(),
+            "prediction": self.prediction_slider.value(),
+            **self.get_axis_mapping(),
+        }
+
+    def set_values(self, values):
+        """Show slider-unit values without publishing each control change"""
+        self._loading = True
+        try:
+            self.pan_scale_slider.setValue(values["pan_scale"])
+            self.zoom_scale_slider.setValue(values["zoom_scale"])
+            self.rotation_speed_slider.setValue(values["rotation_speed"])
+            self.dead_zone_slider.setValue(values["dead_zone"])
+            self.poll_rate_slider.setValue(values["poll_rate"])
+            self.idle_timeout_slider.setValue(values["idle_timeout"])
+            self.adaptive_polling_checkbox.setChecked(values["adaptive_polling"])
+            self.batch_transforms_checkbox.setChecked(values["batch_transforms"])
+            self.smoothing_mode_combo.setCurrentIndex(values["smoothing_mode"])
+            self.smoothing_slider.setValue(values["smoothing"])
+            self.expo_slider.setValue(values["expo"])
+            self.inertia_checkbox.setChecked(values["inertia_enabled"])
+            self.inertia_slider.setValue(values["inertia"])
+            self.damping_slider.setValue(values["damping"])
+            self.prediction_checkbox.setChecked(values["prediction_enabled"])
+            self.prediction_model_combo.setCurrentIndex(values["prediction_model"])
+            self.prediction_slider.setValue(values["prediction"])
+            self.set_axis_mapping(values["axis_matrix"], values["axis_dead_zones"], values["axis_expo"])
+        finally:
+            self._loading = False
+        self.motion_config = self.build_motion_config()
+
+    def get_axis_mapping(self):
+        """Axis table contents in settings-file form (matrix, per-axis dead zones, per-axis expo)"""
+        def cell(row, column):
+            item = self.axis_table.item(row, column)
+            try:
+                return float(item.text()) if item and item.text().strip() else None
+            except ValueError:
+                return None
+        # Out-of-range cells are clamped: dead zone (percent) to [0, 95], expo (percent) to [0, 100]
+        dead_zones = []
+        expos = []
+        for row in range(len(AXIS_NAMES)):
+            dead_zone, expo = cell(row, 0), cell(row, 1)
+            clamped = clamp_curve(0.0 if dead_zone is None else dead_zone / 100.0,
+                                  0.0 if expo is None else expo / 100.0)
+            dead_zones.append(None if dead_zone is None else clamped[0] * 100.0)
+            expos.append(None if expo is None else clamped[1] * 100.0)
+        matrix = [list(row) for row in self._axis_matrix]
+        for output in range(len(OUTPUT_NAMES)):
+            for axis in range(len(AXIS_NAMES)):
+                matrix[output][axis] = cell(axis, 2 + output) or 0.0
+        return {
+            "axis_matrix": format_matrix(matrix),
+            # Dead zones are shown in percent and stored in slider units (tenths of a percent)
+            "axis_dead_zones": format_axis_values(None if value is None else value * 10.0 for value in dead_zones),
+            "axis_expo": format_axis_values(expos),
+        }
+
+    def set_axis_mapping(self, matrix_text, dead_zones_text, expo_text):
+        """Fill the axis table from settings-file values without publishing each cell"""
+        self._axis_matrix = parse_matrix(matrix_text)
+        dead_zones = parse_axis_values(dead_zones_text)
+        expos = parse_axis_values(expo_text)
+        self.axis_table.blockSignals(True)
+        for axis in range(len(AXIS_NAMES)):
+            dead_zone = dead_zones[axis]
+            self.axis_table.setItem(axis, 0, QTableWidgetItem("" if dead_zone is None else f"{dead_zone / 10.0:g}"))
+            self.axis_table.setItem(axis, 1, QTableWidgetItem("" if expos[axis] is None else f"{expos[axis]:g}"))
+            for output in range(len(OUTPUT_NAMES)):
+                self.axis_table.setItem(axis, 2 + output, QTableWidgetItem(f"{self._axis_matrix[output][axis]:g}"))
+        self.axis_table.blockSignals(False)
+        self.update_mapping_preset()
+
+    def update_mapping_preset(self, *args):
+        """Show the preset the matrix matches, or Custom"""
+        matrix = parse_matrix(self.get_axis_mapping()["axis_matrix"])
+        presets = [preset for name, preset in MAPPING_PRESETS]
+        self.mapping_preset_combo.setCurrentIndex(presets.index(matrix) + 1 if matrix in presets else 0)
+
+    def apply_mapping_preset(self, index):
+        """Replace the matrix with a preset, keeping the per-axis curves"""
+        if index <= 0:
+            return
+        values = self.get_axis_mapping()
+        self.set_axis_mapping(format_matrix(MAPPING_PRESETS[index - 1][1]), values["axis_dead_zones"],
+                              values["axis_expo"])
+        self.publish_motion_config()
+
+    def get_profiles(self):
+        """The extension's ProfileManager, or None without an extension"""
+        if hasattr(self.parent, 'extension') and self.parent.extension:
+            return self.parent.extension.profiles
+        return None
+
+    def update_profile_list(self):
+        """Refill the profile combo and show the active profile"""
+        profiles = self.get_profiles()
+        if profiles is None:
+            return
+        self.profile_combo.blockSignals(True)
+        self.profile_combo.clear()
+        self.profile_combo.addItems(profiles.profiles.names())
+        self.profile_combo.blockSignals(False)
+        self.show_profile(profiles.active)
+
+    def show_profile(self, name):
+        """Reflect the active profile in the combo, the controls and the binding checkboxes"""
+        profiles = self.get_profiles()
+        if profiles is None:
+            return
+        self.profile_combo.setCurrentIndex(self.profile_combo.findText(name))
+        self.delete_profile_button.setEnabled(name != DEFAULT_PROFILE)
+        values = profiles.profiles.values.get(name)
+        if values is not None and values != self.get_values():
+            self.set_values(values)
+        document_profiles = profiles.profiles.document_profiles
+        tool_profiles = profiles.profiles.tool_profiles
+        self.document_profile_checkbox.setEnabled(profiles.document is not None)
+        self.document_profile_checkbox.setChecked(document_profiles.get(profiles.document) == name)
+        self.tool_profile_checkbox.setEnabled(profiles.tool is not None)
+        self.tool_profile_checkbox.setChecked(tool_profiles.get(profiles.tool) == name)
+
+    def select_profile(self, index):
+        profiles = self.get_profiles()
+        if profiles is not None and index >= 0:
+            profiles.select(self.profile_combo.itemText(index))
+
+    def new_profile(self):
+        """Create a profile from the current control values and switch to it"""
+        profiles = self.get_profiles()
+        if profiles is None:
+            return
+        name, accepted = QInputDialog.getText(self, "New Profile", "Profile name:")
+        # "/" would nest groups in the settings file
+        name = name.strip().replace("/", "-")
+        if not accepted or not name:
+            return
+        if name in profiles.profiles:
+            self.parent.status_label.setText(f"Profile {name} already exists")
+            return
+        profiles.set_values(name, self.get_values())
+        profiles.select(name)
+
+    def delete_profile(self):
+        profiles = self.get_profiles()
+        if profiles is not None:
+            profiles.remove(profiles.active)
+
+    def bind_document(self, checked):
+        """Use the active profile whenever the current document is active (or stop doing so)"""
+        profiles = self.get_profiles()
+        if profiles is not None:
+            profiles.bind_document(profiles.active if checked else None)
+
+    def bind_tool(self, checked):
+        """Use the active profile whenever the current tool is active (or stop doing so)"""
+        profiles = self.get_profiles()
+        if profiles is not None:
+            profiles.bind_tool(profiles.active if checked else None)
+
+    def get_button_bindings(self):
+        """Get trigger -> action name bindings from the table, skipping malformed triggers"""
+        bindings = {}
+        for row in range(self.button_table.rowCount()):
+            trigger_item = self.button_table.item(row, 0)
+            action_item = self.button_table.item(row, 1)
+            trigger = trigger_item.text().strip() if trigger_item else ""
+            action_name = action_item.text().strip() if action_item else ""
+            if not trigger or not action_name:
+                continue
+            try:
+                parse_trigger(trigger)
+            except ValueError:
+                continue
+            bindings[trigger] = action_name
+        return bindings
+
+    def set_button_bindings(self, bindings):
+        """Fill the table without publishing each cell"""
+        self.button_table.blockSignals(True)
+        self.button_table.setRowCount(0)
+        for trigger, action_name in bindings.items():
+            row = self.button_table.rowCount()
+            self.button_table.insertRow(row)
+            self.button_table.setItem(row, 0, QTableWidgetItem(trigger))
+            self.button_table.setItem(row, 1, QTableWidgetItem(action_name))
+        self.button_table.blockSignals(False)
+
+    def add_binding(self):
+        self.button_table.insertRow(self.button_table.rowCount())
+
+    def remove_binding(self):
+        row = self.button_table.currentRow()
+        if row >= 0:
+            self.button_table.removeRow(row)
+            self.publish_button_bindings()
+
+    def publish_button_bindings(self, *args):
+        """Recompile the extension's dispatch table from the table contents"""
+        if hasattr(self.parent, 'extension') and self.parent.extension:
+            self.parent.extension.set_button_bindings(self.get_button_bindings())
 
     def get_pan_scale(self):
         """Get pan scale in pixels per unit movement"""
@@ -117,6 +559,18 @@ class ConfigurationTab(QWidget):
         """Get poll rate in milliseconds"""
         return self.poll_rate_slider.value()
 
+    def get_expo(self):
+        """Get expo curve blend as decimal (0.0 linear to 1.0 cubic)"""
+        return self.expo_slider.value() / 100.0
+
+    def get_damping(self):
+        """Get glide velocity decay rate per second"""
+        return self.damping_slider.value() / 10.0
+
+    def get_idle_timeout(self):
+        """Get seconds at rest before adaptive polling backs off"""
+        return float(self.idle_timeout_slider.value())
+
     # Backwards compatibility methods
     def get_pan_sensitivity(self):
         """Backwards compatibility - returns pan scale / 120 (base scale)"""
@@ -136,40 +590,21 @@ class ConfigurationTab(QWidget):
 
     def get_settings_path(self):
         """Get the path for storing plugin settings following Krita standards"""
-        from krita import Krita
-        # Use Krita's resource directory for plugin settings
-        krita_config_path = Krita.instance().readSetting("", "ResourceDirectory", "")
-        if not krita_config_path:
-            # Fallback to user's application data
-            import os
-            if os.name == 'nt':  # Windows
-                krita_config_path = os.path.expandvars('%APPDATA%/krita')
-            else:  # Linux/Mac
-                krita_config_path = os.path.expanduser('~/.local/share/krita')
-        
-        plugin_config_dir = os.path.join(krita_config_path, 'spacemouse_settings')
-        os.makedirs(plugin_config_dir, exist_ok=True)
-        return os.path.join(plugin_config_dir, 'spacemouse_config.ini')
+        return settings_path()
 
     def save_settings(self):
-        """Save current settings to configuration file"""
+        """Write all profiles and button bindings now (on the settings writer thread)"""
         try:
-            settings_path = self.get_settings_path()
-            settings = QSettings(settings_path, QSettings.IniFormat)
-            
-            # Save all slider values
-            settings.setValue("pan_scale", self.pan_scale_slider.value())
-            settings.setValue("zoom_scale", self.zoom_scale_slider.value())
-            settings.setValue("rotation_speed", self.rotation_speed_slider.value())
-            settings.setValue("dead_zone", self.dead_zone_slider.value())
-            settings.setValue("poll_rate", self.poll_rate_slider.value())
-            
-            settings.sync()
-            QtCore.qDebug(f"SpaceMouse settings saved to {settings_path}")
+            profiles = self.get_profiles()
+            if profiles is None:
+                return
+            # Edits are already saved after a short pause; this skips the wait
+            profiles.save(delay=0)
+            QtCore.qDebug(f"SpaceMouse settings queued for saving to {self.get_settings_path()}")
             
             # Update status if available
             if hasattr(self.parent, 'status_label'):
-                self.parent.status_label.setText("Settings saved successfully")
+                self.parent.status_label.setText("Settings saved")
                 
         except Exception as e:
             QtCore.qWarning(f"Failed to save SpaceMouse settings: {e}")
@@ -177,34 +612,19 @@ class ConfigurationTab(QWidget):
                 self.parent.status_label.setText(f"Save failed: {e}")
 
     def load_settings(self):
-        """Load settings from configuration file"""
+        """Show the profiles held by the extension (read from the settings file once)"""
         try:
-            settings_path = self.get_settings_path()
-            if not os.path.exists(settings_path):
-                QtCore.qDebug("No SpaceMouse settings file found, using defaults")
+            profiles = self.get_profiles()
+            if profiles is None:
                 return
-                
-            settings = QSettings(settings_path, QSettings.IniFormat)
-            
-            # Load values with defaults if not found
-            pan_scale = settings.value("pan_scale", 120, type=int)
-            zoom_scale = settings.value("zoom_scale", 100, type=int)
-            rotation_speed = settings.value("rotation_speed", 40, type=int)
-            dead_zone = settings.value("dead_zone", 150, type=int)
-            poll_rate = settings.value("poll_rate", 30, type=int)
-            
-            # Apply loaded values to sliders
-            self.pan_scale_slider.setValue(pan_scale)
-            self.zoom_scale_slider.setValue(zoom_scale)
-            self.rotation_speed_slider.setValue(rotation_speed)
-            self.dead_zone_slider.setValue(dead_zone)
-            self.poll_rate_slider.setValue(poll_rate)
-            
-            QtCore.qDebug(f"SpaceMouse settings loaded from {settings_path}")
+            self.parent.extension.load_saved_settings()
+            self.update_profile_list()
+            if profiles.bindings:
+                self.set_button_bindings(profiles.bindings)
             
             # Update status if available
             if hasattr(self.parent, 'status_label'):
-                self.parent.status_label.setText("Settings loaded successfully")
+                self.parent.status_label.setText(f"Profile: {profiles.active}")
                 
         except Exception as e:
             QtCore.qWarning(f"Failed to load SpaceMouse settings: {e}")
@@ -212,14 +632,13 @@ class ConfigurationTab(QWidget):
                 self.parent.status_label.setText(f"Load failed: {e}")
 
     def reset_to_defaults(self):
-        """Reset all settings to default values"""
+        """Reset the active profile and the button bindings to default values"""
         try:
-            # Set default values
-            self.pan_scale_slider.setValue(120)      # 120 pixels default
-            self.zoom_scale_slider.setValue(32)      # 3.2% default
-            self.rotation_speed_slider.setValue(25)  # 2.5 degrees default
-            self.dead_zone_slider.setValue(150)      # 15.0% default
-            self.poll_rate_slider.setValue(30)       # 30ms default
+            # Same defaults as a new profile, published to the profile once
+            self.set_values(DEFAULT_VALUES)
+            self.publish_motion_config()
+            self.set_button_bindings(DEFAULT_BUTTON_BINDINGS)
+            self.publish_button_bindings()
             
             QtCore.qDebug("SpaceMouse settings reset to defaults")
             
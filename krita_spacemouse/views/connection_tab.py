@@ -1,7 +1,8 @@
 # tabs/connection_tab.py - Connection controls for SpaceMouse
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QSpinBox, QComboBox, QHBoxLayout
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QSpinBox, QComboBox, QHBoxLayout, QCheckBox, QFileDialog
 from PyQt5.QtCore import Qt
 from PyQt5 import QtCore
+from ..models.device_merge import COMBINE_NAMES, COMBINE_SUM
 
 class ConnectionTab(QWidget):
     def __init__(self, parent):
@@ -33,26 +34,96 @@ class ConnectionTab(QWidget):
         self.disconnect_button.setEnabled(False)  # Initially disabled
         self.layout.addWidget(self.disconnect_button)
 
+        # Additional devices merged into the same navigation stream
+        multi_layout = QHBoxLayout()
+        self.add_device_button = QPushButton("Add Device")
+        self.add_device_button.clicked.connect(self.add_spacemouse)
+        self.add_device_button.setEnabled(False)  # Needs a connected primary device
+        multi_layout.addWidget(self.add_device_button)
+        self.combine_combo = QComboBox()
+        self.combine_combo.addItems([f"Combine: {name}" for name in COMBINE_NAMES])
+        self.combine_combo.setCurrentIndex(COMBINE_SUM)
+        self.combine_combo.currentIndexChanged.connect(self.update_combine_rule)
+        multi_layout.addWidget(self.combine_combo)
+        self.layout.addLayout(multi_layout)
+
+        # Device backend in a child process, out of reach of other plugins holding the GIL
+        self.process_checkbox = QCheckBox("Read device in separate process (on next connect)")
+        self.process_checkbox.toggled.connect(self.update_process_mode)
+        self.layout.addWidget(self.process_checkbox)
+
+        # Input recording and replay
+        record_layout = QHBoxLayout()
+        self.record_button = QPushButton("Record Input")
+        self.record_button.setCheckable(True)
+        self.record_button.toggled.connect(self.toggle_recording)
+        record_layout.addWidget(self.record_button)
+        self.replay_button = QPushButton("Replay...")
+        self.replay_button.clicked.connect(self.replay_recording)
+        record_layout.addWidget(self.replay_button)
+        self.replay_realtime_checkbox = QCheckBox("Real-time")
+        self.replay_realtime_checkbox.setChecked(True)
+        record_layout.addWidget(self.replay_realtime_checkbox)
+        self.layout.addLayout(record_layout)
+
+        # Poll scheduler statistics (wake-ups and tick CPU time)
+        self.scheduler_label = QLabel("Polling: stopped")
+        self.layout.addWidget(self.scheduler_label)
+
+        # Canvas repaints per committed frame (compare with batching on and off)
+        self.repaint_label = QLabel("Repaints per commit: -")
+        self.layout.addWidget(self.repaint_label)
+
+        # Connection supervisor state (read errors, reconnect back-off)
+        self.link_label = QLabel("Device: disconnected")
+        self.layout.addWidget(self.link_label)
+
         self.layout.addStretch()
         self.setLayout(self.layout)
         
-        # Initialize device list
-        self.refresh_devices()
+        # Device list arrives from the extension's background enumerator
+        if hasattr(self.parent, 'extension') and self.parent.extension:
+            monitor = self.parent.extension.devices
+            monitor.devices_changed.connect(self.populate_devices)
+            if monitor.devices is not None:
+                self.populate_devices(monitor.devices)
+            else:
+                self.show_searching()
+            # One-shot enumeration; hotplug watching starts with a connection
+            monitor.refresh()
+            supervisor = self.parent.extension.supervisor
+            supervisor.state_changed.connect(self.update_connection_status)
+            self.link_label.setText(f"Device: {supervisor.message}")
+        else:
+            self.populate_devices(None)
+
+    def show_searching(self):
+        self.device_combo.clear()
+        self.device_combo.addItem("Searching for devices...")
+        self.device_combo.setEnabled(False)
+        self.connect_button.setEnabled(False)
 
     def refresh_devices(self):
-        """Refresh the list of available devices via controller"""
+        """Re-enumerate devices on a worker thread; the combo box updates when the result arrives"""
+        if hasattr(self.parent, 'extension') and self.parent.extension:
+            if self.parent.extension.devices.devices is None:
+                self.show_searching()
+            self.parent.extension.devices.refresh(force=True)
+
+    def populate_devices(self, raw_devices):
+        """Fill the combo box from an enumeration result (None when no extension is available)"""
         try:
-            # Clear existing items
+            # Keep the user's selection across hotplug updates
+            previous = self.device_combo.currentText()
             self.device_combo.clear()
             
-            # Get available devices through the controller
-            if hasattr(self.parent, 'extension') and self.parent.extension:
-                raw_devices = self.parent.extension.get_available_devices()
-                
+            if raw_devices is not None:
                 if raw_devices:
                     # Format devices for display (UI concern)
                     formatted_devices = self.format_devices_for_display(raw_devices)
                     self.device_combo.addItems(formatted_devices)
+                    if previous in formatted_devices:
+                        self.device_combo.setCurrentText(previous)
                     self.device_combo.setEnabled(True)
                     self.connect_button.setEnabled(True)
                 else:
@@ -71,6 +142,12 @@ class ConnectionTab(QWidget):
             self.device_combo.setEnabled(False)
             self.connect_button.setEnabled(False)
 
+    def update_connection_status(self, state, message):
+        """Show read errors, lost devices and reconnect attempts reported by the supervisor"""
+        self.link_label.setText(f"Device: {message}")
+        if hasattr(self.parent, 'status_label'):
+            self.parent.status_label.setText(message)
+
     def format_devices_for_display(self, raw_devices):
         """Format raw device list for UI display with device numbers when needed"""
         if not raw_devices:
@@ -119,6 +196,7 @@ class ConnectionTab(QWidget):
                 
                 self.connect_button.setText("Reconnect")
                 self.disconnect_button.setEnabled(True)
+                self.add_device_button.setEnabled(True)
                 self.update_disconnect_button_text(device_selection)
                 if hasattr(self.parent, 'status_label'):
                     self.parent.status_label.setText(f"Connected to {device_selection}")
@@ -134,6 +212,26 @@ class ConnectionTab(QWidget):
         else:
             QtCore.qCritical("Extension not available")
 
+    def add_spacemouse(self):
+        """Connect the selected device in addition to the ones already connected"""
+        if not (hasattr(self.parent, 'extension') and self.parent.extension):
+            return
+        device_selection = self.device_combo.currentText()
+        device_name, device_number = self.parse_device_selection(device_selection)
+        slot = self.parent.extension.add_device(device_name, device_number)
+        if slot != -1:
+            self.disconnect_button.setText("Disconnect All")
+            if hasattr(self.parent, 'status_label'):
+                self.parent.status_label.setText(f"Added {device_selection} as device {slot + 1}")
+
+    def update_process_mode(self, checked):
+        if hasattr(self.parent, 'extension') and self.parent.extension:
+            self.parent.extension.set_out_of_process(checked)
+
+    def update_combine_rule(self, index):
+        if hasattr(self.parent, 'extension') and self.parent.extension:
+            self.parent.extension.set_combine_rule(index)
+
     def parse_device_selection(self, device_selection):
         """Parse device selection string into device name and number"""
         if not device_selection:
@@ -160,6 +258,59 @@ class ConnectionTab(QWidget):
         else:
             self.disconnect_button.setText("Disconnect")
 
+    def toggle_recording(self, checked):
+        """Start or stop recording the device input stream"""
+        if not (hasattr(self.parent, 'extension') and self.parent.extension):
+            return
+        try:
+            if checked:
+                path, _ = QFileDialog.getSaveFileName(self, "Record SpaceMouse Input", "spacemouse.smrec",
+                                                      "SpaceMouse recordings (*.smrec)")
+                if not path:
+                    self.record_button.setChecked(False)
+                    return
+                self.parent.extension.start_recording(path)
+                self.record_button.setText("Stop Recording")
+                if hasattr(self.parent, 'status_label'):
+                    self.parent.status_label.setText(f"Recording to {path}")
+            else:
+                count = self.parent.extension.stop_recording()
+                self.record_button.setText("Record Input")
+                if hasattr(self.parent, 'status_label'):
+                    self.parent.status_label.setText(f"Recorded {count} samples")
+        except Exception as e:
+            self.record_button.setText("Record Input")
+            if hasattr(self.parent, 'status_label'):
+                self.parent.status_label.setText(f"Recording Error: {e}")
+            QtCore.qWarning(f"Recording error: {e}")
+
+    def replay_recording(self):
+        """Replay a recorded input file through the navigation pipeline"""
+        if not (hasattr(self.parent, 'extension') and self.parent.extension):
+            return
+        path, _ = QFileDialog.getOpenFileName(self, "Replay SpaceMouse Input", "",
+                                              "SpaceMouse recordings (*.smrec)")
+        if not path:
+            return
+        if self.parent.extension.connect_replay(path, self.replay_realtime_checkbox.isChecked()):
+            self.connect_button.setText("Reconnect")
+            self.disconnect_button.setEnabled(True)
+            self.disconnect_button.setText("Stop Replay")
+            if hasattr(self.parent, 'status_label'):
+                self.parent.status_label.setText(f"Replaying {path}")
+
+    def update_scheduler_stats(self, wakeups_per_second, cpu_ms_per_second, idle):
+        """Show poll scheduler statistics published once per second"""
+        mode = "idle" if idle else "active"
+        self.scheduler_label.setText(
+            f"Polling ({mode}): {wakeups_per_second:.1f} wake-ups/s, CPU {cpu_ms_per_second:.1f} ms/s"
+        )
+
+    def update_repaint_stats(self, repaints_per_commit, batched):
+        """Show canvas repaints per frame commit published once per second"""
+        mode = "batched" if batched else "unbatched"
+        self.repaint_label.setText(f"Repaints per commit ({mode}): {repaints_per_commit:.2f}")
+
     def disconnect_spacemouse(self):
         """Disconnect from SpaceMouse device"""
         if hasattr(self.parent, 'extension') and self.parent.extension:
@@ -172,6 +323,8 @@ class ConnectionTab(QWidget):
                 self.connect_button.setText("Connect")
                 self.disconnect_button.setText("Disconnect")
                 self.disconnect_button.setEnabled(False)
+                self.add_device_button.setEnabled(False)
+                self.scheduler_label.setText("Polling: stopped")
                 if hasattr(self.parent, 'status_label'):
                     self.parent.status_label.setText("Disconnected")
                     
@@ -0,0 +1,138 @@
+# tabs/diagnostics_tab.py - Hot-path timing statistics for SpaceMouse navigation
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayout, QTableWidget,
+                             QTableWidgetItem, QHeaderView, QFileDialog, QCheckBox)
+from PyQt5.QtCore import QTimer
+from PyQt5 import QtCore
+from ..startup_profile import summary
+
+# Table refresh interval while the tab is visible
+REFRESH_INTERVAL = 1000  # ms
+
+class DiagnosticsTab(QWidget):
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.parent = parent
+        self.layout = QVBoxLayout()
+
+        # Per-stage latency percentiles
+        self.stats_table = QTableWidget(0, 5)
+        self.stats_table.setHorizontalHeaderLabels(["Stage", "Count", "p50 µs", "p95 µs", "p99 µs"])
+        self.stats_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.stats_table.verticalHeader().setVisible(False)
+        self.stats_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.layout.addWidget(self.stats_table)
+
+        # Counters
+        self.counters_label = QLabel("Skipped ticks: 0   Errors: 0")
+        self.layout.addWidget(self.counters_label)
+
+        # What the plugin added to Krita's launch (import, registration, docker, tabs)
+        self.startup_label = QLabel()
+        self.startup_label.setWordWrap(True)
+        self.layout.addWidget(self.startup_label)
+
+        # Reset and export buttons
+        button_layout = QHBoxLayout()
+
+        self.reset_button = QPushButton("Reset")
+        self.reset_button.clicked.connect(self.reset_stats)
+        button_layout.addWidget(self.reset_button)
+
+        self.export_button = QPushButton("Export CSV...")
+        self.export_button.clicked.connect(self.export_csv)
+        button_layout.addWidget(self.export_button)
+
+        self.layout.addLayout(button_layout)
+
+        # Motion-to-photon latency tracing (Chrome trace-event JSON)
+        trace_layout = QHBoxLayout()
+
+        self.trace_checkbox = QCheckBox("Trace Latency")
+        self.trace_checkbox.toggled.connect(self.toggle_tracing)
+        trace_layout.addWidget(self.trace_checkbox)
+
+        self.save_trace_button = QPushButton("Save Trace...")
+        self.save_trace_button.clicked.connect(self.save_trace)
+        trace_layout.addWidget(self.save_trace_button)
+
+        self.layout.addLayout(trace_layout)
+        self.setLayout(self.layout)
+
+        # Only refresh while the tab is on screen
+        self.refresh_timer = QTimer()
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def get_stats(self):
+        if hasattr(self.parent, 'extension') and self.parent.extension:
+            return self.parent.extension.stats
+        return None
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.refresh_timer.start(REFRESH_INTERVAL)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.refresh_timer.stop()
+
+    def refresh(self):
+        """Update the table from the extension's histograms"""
+        stats = self.get_stats()
+        if stats is None:
+            return
+        rows = stats.rows()
+        self.stats_table.setRowCount(len(rows))
+        for row, (name, count, p50, p95, p99, maximum) in enumerate(rows):
+            values = (name, str(count), f"{p50 / 1000:.1f}", f"{p95 / 1000:.1f}", f"{p99 / 1000:.1f}")
+            for column, value in enumerate(values):
+                self.stats_table.setItem(row, column, QTableWidgetItem(value))
+        self.counters_label.setText(f"Skipped ticks: {stats.skipped_ticks}   Errors: {stats.errors}")
+        self.startup_label.setText(f"Startup: {summary()}")
+
+    def toggle_tracing(self, checked):
+        """Enable or disable span recording"""
+        if hasattr(self.parent, 'extension') and self.parent.extension:
+            self.parent.extension.tracer.enabled = checked
+
+    def save_trace(self):
+        """Write buffered spans as Chrome trace JSON; the file is written off the GUI thread"""
+        if not (hasattr(self.parent, 'extension') and self.parent.extension):
+            return
+        tracer = self.parent.extension.tracer
+        path, _ = QFileDialog.getSaveFileName(self, "Save SpaceMouse Trace", "spacemouse_trace.json",
+                                              "Chrome trace (*.json)")
+        if not path:
+            return
+        tracer.flush(path)
+        if hasattr(self.parent, 'status_label'):
+            self.parent.status_label.setText(f"Writing {len(tracer)} trace spans to {path}")
+
+    def reset_stats(self):
+        """Clear all histograms and counters"""
+        stats = self.get_stats()
+        if stats is None:
+            return
+        stats.reset()
+        self.refresh()
+        if hasattr(self.parent, 'status_label'):
+            self.parent.status_label.setText("Diagnostics reset")
+
+    def export_csv(self):
+        """Write the current statistics to a CSV file"""
+        stats = self.get_stats()
+        if stats is None:
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Export SpaceMouse Diagnostics", "spacemouse_diagnostics.csv",
+                                              "CSV files (*.csv)")
+        if not path:
+            return
+        try:
+            with open(path, "w", newline="") as f:
+                f.write(stats.to_csv())
+            if hasattr(self.parent, 'status_label'):
+                self.parent.status_label.setText(f"Diagnostics exported to {path}")
+        except Exception as e:
+            QtCore.qWarning(f"Failed to export SpaceMouse diagnostics: {e}")
+            if hasattr(self.parent, 'status_label'):
+                self.parent.status_label.setText(f"Export failed: {e}")
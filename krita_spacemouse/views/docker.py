@@ -1,19 +1,30 @@
 # docker.py - SpaceMouse Docker with tabbed interface
+import time
 from PyQt5.QtWidgets import QDockWidget, QWidget, QVBoxLayout, QLabel, QTabWidget
 from PyQt5.QtCore import Qt
 from krita import DockWidget
+from ..startup_profile import record
 from .connection_tab import ConnectionTab
 from .configuration_tab import ConfigurationTab
+from .diagnostics_tab import DiagnosticsTab
 
 class SpacenavDocker(DockWidget):
+    # (attribute, tab title, class); each tab is built the first time it is shown
+    TABS = (
+        ("connection_tab", "Connection", ConnectionTab),
+        ("configuration_tab", "Configuration", ConfigurationTab),
+        ("diagnostics_tab", "Diagnostics", DiagnosticsTab),
+    )
+
     def __init__(self, extension=None):
+        start = time.perf_counter()
         super().__init__()
         self.setObjectName("spacenavDocker")
         self.setWindowTitle("SpaceMouse")
-        
+
         # Store extension reference directly from constructor
         self.extension = extension
-        
+
         # Main widget
         self.widget = QWidget()
         self.setWidget(self.widget)
@@ -22,31 +33,61 @@ class SpacenavDocker(DockWidget):
 
         # Title
         self.layout.addWidget(QLabel("SpaceMouse Controls"))
-        
-        # Create tab widget
+
+        # Create tab widget with empty pages; content is built on first show
         self.tab_widget = QTabWidget()
-        
-        # Create tabs
-        self.connection_tab = ConnectionTab(self)
-        self.configuration_tab = ConfigurationTab(self)
-        
-        # Add tabs to tab widget
-        self.tab_widget.addTab(self.connection_tab, "Connection")
-        self.tab_widget.addTab(self.configuration_tab, "Configuration")
-        
+        self._pages = []
+        for attribute, title, tab_class in self.TABS:
+            setattr(self, attribute, None)
+            page = QWidget()
+            page.setLayout(QVBoxLayout())
+            page.layout().setContentsMargins(0, 0, 0, 0)
+            self._pages.append(page)
+            self.tab_widget.addTab(page, title)
+        self.tab_widget.currentChanged.connect(self.ensure_tab)
+
         self.layout.addWidget(self.tab_widget)
-        
+
         # Status
         self.status_label = QLabel("Ready" if not self.extension else "Extension Connected")
         self.layout.addWidget(self.status_label)
-        
-        # For backwards compatibility, create advanced_tab reference
-        self.advanced_tab = self.configuration_tab
-    
+        record("docker", start)
+
+    @property
+    def advanced_tab(self):
+        # For backwards compatibility
+        return self.configuration_tab
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.ensure_tab(self.tab_widget.currentIndex())
+
+    def ensure_tab(self, index):
+        """Build the tab at index if it has not been built yet"""
+        if index < 0:
+            return None
+        attribute, title, tab_class = self.TABS[index]
+        tab = getattr(self, attribute)
+        if tab is not None:
+            return tab
+        start = time.perf_counter()
+        tab = tab_class(self)
+        setattr(self, attribute, tab)
+        self._pages[index].layout().addWidget(tab)
+
+        # Scheduler and repaint statistics for the connection tab
+        if attribute == "connection_tab" and self.extension and hasattr(self.extension, 'scheduler'):
+            self.extension.scheduler.stats_updated.connect(tab.update_scheduler_stats)
+            self.extension.transform_batch.stats_updated.connect(tab.update_repaint_stats)
+        record(f"{title} tab", start)
+        return tab
+
     def canvasChanged(self, canvas):
         """Required method for canvas observer - called when canvas changes"""
-        pass  # We don't need to do anything when canvas changes
-        
+        # Profiles bound to a document or tool follow the active canvas
+        if self.extension and hasattr(self.extension, 'profiles'):
+            self.extension.profiles.set_canvas(canvas)
+
     def setCanvas(self, canvas):
         """Required method for canvas observer - called when canvas is set"""
         pass  # We don't need to do anything when canvas is set
@@ -0,0 +1,8 @@
+# conftest.py - Run the tests against the stand-in krita and PyQt5 modules used by the benchmarks
+import os
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(TESTS_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "benchmarks", "standins"))
+sys.path.insert(1, ROOT_DIR)
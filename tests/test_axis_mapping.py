@@ -0,0 +1,115 @@
+# test_axis_mapping.py - Response curve tables and the axis mapping matrix
+import math
+import pytest
+from krita_spacemouse.models.axis_mapping import (
+    LUT_CENTER, LUT_RANGE, LUT_SCALE, LUT_SIZE, MAX_DEAD_ZONE, STANDARD_MATRIX, TILT_PAN_MATRIX,
+    AxisMapping, build_curve_lut, clamp_curve, parse_axis_values, parse_matrix)
+from krita_spacemouse.models.sample_ring import DeviceSample
+
+def lut_index(value):
+    return int((value + LUT_RANGE) * LUT_SCALE + 0.5)
+
+@pytest.mark.parametrize("dead_zone, expo", [(0.0, 0.0), (0.15, 0.0), (0.15, 1.0), (0.3, 0.5), (MAX_DEAD_ZONE, 0.0)])
+def test_centre_is_zero(dead_zone, expo):
+    assert build_curve_lut(dead_zone, expo)[LUT_CENTER] == 0.0
+
+def test_dead_zone_edges():
+    table = build_curve_lut(0.2, 0.0)
+    # Inside the dead zone everything is zero, just outside it the output starts from zero
+    assert table[lut_index(0.19)] == 0.0
+    assert table[lut_index(-0.19)] == 0.0
+    assert 0.0 < table[lut_index(0.21)] < 0.02
+    assert -0.02 < table[lut_index(-0.21)] < 0.0
+    # Full deflection maps to full output
+    assert table[lut_index(1.0)] == pytest.approx(1.0, abs=1e-3)
+    assert table[lut_index(-1.0)] == pytest.approx(-1.0, abs=1e-3)
+
+def test_curve_is_odd_and_monotonic():
+    table = build_curve_lut(0.1, 0.6)
+    for offset in range(LUT_CENTER + 1):
+        assert table[LUT_CENTER + offset] == -table[LUT_CENTER - offset]
+    assert all(a <= b for a, b in zip(table, table[1:]))
+
+def test_expo_blend():
+    linear = build_curve_lut(0.0, 0.0)
+    cubic = build_curve_lut(0.0, 1.0)
+    assert linear[lut_index(0.5)] == pytest.approx(0.5, abs=1e-3)
+    assert cubic[lut_index(0.5)] == pytest.approx(0.125, abs=1e-3)
+
+@pytest.mark.parametrize("dead_zone, expo, expected", [
+    (-0.1, 0.0, (0.0, 0.0)),
+    (1.0, 0.0, (MAX_DEAD_ZONE, 0.0)),
+    (5.0, 0.0, (MAX_DEAD_ZONE, 0.0)),
+    (0.1, -2.0, (0.1, 0.0)),
+    (0.1, 3.0, (0.1, 1.0)),
+    (math.nan, math.nan, (0.0, 0.0)),
+])
+def test_out_of_range_curve_settings_are_clamped(dead_zone, expo, expected):
+    assert clamp_curve(dead_zone, expo) == expected
+    assert build_curve_lut(dead_zone, expo) == build_curve_lut(*expected)
+
+def test_full_dead_zone_does_not_divide_by_zero():
+    table = build_curve_lut(1.0, 0.0)
+    assert len(table) == LUT_SIZE
+    assert table[LUT_CENTER] == 0.0
+
+def test_negative_dead_zone_does_not_drift():
+    assert build_curve_lut(-0.1, 0.0)[LUT_CENTER] == 0.0
+
+def test_malformed_settings_fall_back():
+    assert parse_matrix("1,2;3") == STANDARD_MATRIX
+    assert parse_matrix(None) == STANDARD_MATRIX
+    assert parse_axis_values("1,2,x,,,") == (None,) * 6
+    assert parse_axis_values("1,,,,,") == (1.0, None, None, None, None, None)
+
+def test_standard_mapping():
+    mapping = AxisMapping(STANDARD_MATRIX, (0.0,) * 6, (0.0,) * 6)
+    pan_x, pan_y, zoom, rotation = mapping.apply((0.5, 0.25, -0.5, 0.3, 0.3, 0.75))
+    assert pan_x == pytest.approx(0.5, abs=1e-3)
+    assert pan_y == pytest.approx(-0.25, abs=1e-3)   # y is inverted
+    assert zoom == pytest.approx(-0.5, abs=1e-3)
+    assert rotation == pytest.approx(0.75, abs=1e-3)
+    # Roll and pitch are not read by the standard matrix
+    assert mapping.used_axes == (0, 1, 2, 5)
+
+def test_rest_maps_to_zero():
+    mapping = AxisMapping(TILT_PAN_MATRIX, (0.15,) * 6, (0.5,) * 6)
+    assert mapping.apply((0.0,) * 6) == [0.0, 0.0, 0.0, 0.0]
+    assert mapping.apply((0.1, -0.1, 0.1, -0.1, 0.1, -0.1)) == [0.0, 0.0, 0.0, 0.0]
+    assert mapping.apply((math.nan,) * 6) == [0.0, 0.0, 0.0, 0.0]
+
+def test_out_of_range_axes_saturate():
+    mapping = AxisMapping(STANDARD_MATRIX, (0.15,) * 6, (0.0,) * 6)
+    edge = mapping.apply((LUT_RANGE, -LUT_RANGE, 0.0, 0.0, 0.0, 0.0))
+    assert mapping.apply((100.0, -100.0, 0.0, 0.0, 0.0, 0.0)) == edge
+    assert mapping.apply((math.inf, -math.inf, 0.0, 0.0, 0.0, 0.0)) == edge
+
+def test_numpy_stage_matches_pure_python():
+    np = pytest.importorskip("numpy")
+    from krita_spacemouse.models.input_filters import AxisMappingStage, FilterChain
+    mapping = AxisMapping(TILT_PAN_MATRIX, (0.1, 0.15, 0.2, 0.05, 0.3, 0.15), (0.0, 0.5, 1.0, 0.2, 0.0, 0.8))
+    stage = AxisMappingStage(mapping)
+    rows = [(0.0,) * 6, (0.42, -0.3, 0.1, 0.05, -0.02, 0.2), (-1.0, 1.0, -0.6, 0.9, -0.9, 0.35),
+            (1.4, -1.4, 2.0, -2.0, 0.16, -0.16)]
+    outputs = stage.process(np.array(rows), np.full(len(rows), 0.001))
+    for row, output in zip(rows, outputs):
+        assert output.tolist() == pytest.approx(mapping.apply(row), abs=1e-12)
+
+    # Non-finite readings go through the chain, which sanitizes them before the lookup
+    chain = FilterChain([AxisMappingStage(mapping)])
+    rows += [(math.inf, -math.inf, 0.5, math.nan, 0.3, -0.3), (math.nan,) * 6,
+             (-math.inf, math.nan, math.inf, 0.2, -math.inf, math.nan)]
+    for t, row in enumerate(rows):
+        output = chain.process([DeviceSample(t * 1_000_000, *row, ())])
+        assert output == pytest.approx(mapping.apply(row), abs=1e-12)
+
+def test_nan_does_not_stick_in_smoothing():
+    pytest.importorskip("numpy")
+    from krita_spacemouse.models.input_filters import OneEuroStage, AxisMappingStage, FilterChain
+    mapping = AxisMapping(STANDARD_MATRIX, (0.0,) * 6, (0.0,) * 6)
+    chain = FilterChain([OneEuroStage(5.0), AxisMappingStage(mapping)])
+    chain.process([DeviceSample(0, math.nan, 0.0, 0.0, 0.0, 0.0, 0.0, ())])
+    output = chain.process([DeviceSample(t * 1_000_000, 0.5, 0.0, 0.0, 0.0, 0.0, 0.0, ())
+                            for t in range(1, 200)])
+    assert all(math.isfinite(value) for value in output)
+    assert output[0] > 0.4
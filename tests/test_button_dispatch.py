@@ -0,0 +1,76 @@
+# test_button_dispatch.py - Chord deferral, long presses and the action debounce
+import time
+import pytest
+from krita import Krita
+from krita_spacemouse.button_handler import DEBOUNCE_NS, ButtonDispatcher
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable perf_counter_ns for the debounce window"""
+    now = [10 * DEBOUNCE_NS]
+    monkeypatch.setattr(time, "perf_counter_ns", lambda: now[0])
+    return now
+
+def dispatcher_for(bindings):
+    dispatcher = ButtonDispatcher()
+    dispatcher.set_bindings(bindings)
+    return dispatcher
+
+def triggered(name):
+    return Krita.instance().action(name).triggered_count
+
+def click(dispatcher, *buttons):
+    """Press the buttons in order, then release them in reverse"""
+    for button in buttons:
+        dispatcher.process_button_event(button, 1)
+    for button in reversed(buttons):
+        dispatcher.process_button_event(button, 0)
+
+def test_unambiguous_press_fires_immediately(clock):
+    dispatcher = dispatcher_for({"2": "test_press_2"})
+    before = triggered("test_press_2")
+    dispatcher.process_button_event(1, 1)
+    assert triggered("test_press_2") == before + 1
+    dispatcher.process_button_event(1, 0)
+    assert triggered("test_press_2") == before + 1
+
+def test_chord_defers_its_single_buttons(clock):
+    dispatcher = dispatcher_for({"1": "test_single", "1+2": "test_chord"})
+    single, chord = triggered("test_single"), triggered("test_chord")
+    # Button 1 may still grow into the chord, so it waits
+    dispatcher.process_button_event(0, 1)
+    assert triggered("test_single") == single
+    dispatcher.process_button_event(1, 1)
+    assert triggered("test_chord") == chord + 1
+    dispatcher.process_button_event(1, 0)
+    dispatcher.process_button_event(0, 0)
+    assert (triggered("test_single"), triggered("test_chord")) == (single, chord + 1)
+
+    # Alone, button 1 fires on release
+    clock[0] += DEBOUNCE_NS
+    click(dispatcher, 0)
+    assert (triggered("test_single"), triggered("test_chord")) == (single + 1, chord + 1)
+
+def test_long_press(clock):
+    dispatcher = dispatcher_for({"1": "test_tap", "1 hold": "test_hold"})
+    tap, hold = triggered("test_tap"), triggered("test_hold")
+    dispatcher.process_button_event(0, 1)
+    assert dispatcher._hold_timer.isActive()
+    dispatcher._hold_timer.fire()
+    dispatcher.process_button_event(0, 0)
+    assert (triggered("test_tap"), triggered("test_hold")) == (tap, hold + 1)
+
+    click(dispatcher, 0)
+    assert (triggered("test_tap"), triggered("test_hold")) == (tap + 1, hold + 1)
+
+def test_debounce(clock):
+    dispatcher = dispatcher_for({"1": "test_chatter"})
+    before = triggered("test_chatter")
+    click(dispatcher, 0)
+    # Switch chatter within the window is dropped
+    clock[0] += DEBOUNCE_NS - 1
+    click(dispatcher, 0)
+    assert triggered("test_chatter") == before + 1
+    clock[0] += 1
+    click(dispatcher, 0)
+    assert triggered("test_chatter") == before + 2
@@ -0,0 +1,55 @@
+# test_device_merge.py - Combining the latest state of two devices
+import pytest
+from krita_spacemouse.models.device_merge import (
+    COMBINE_OWNERSHIP, COMBINE_PRIORITY, COMBINE_SUM, PRIORITY_THRESHOLD, AxisConfig, InputMerger)
+from krita_spacemouse.models.sample_ring import DeviceSample
+
+def state(x=0.0, y=0.0, z=0.0, roll=0.0, pitch=0.0, yaw=0.0, buttons=(0, 0)):
+    return DeviceSample(0, x, y, z, roll, pitch, yaw, buttons)
+
+def axes(sample):
+    return (sample.x, sample.y, sample.z, sample.roll, sample.pitch, sample.yaw)
+
+def test_sum_adds_and_clamps():
+    merger = InputMerger(COMBINE_SUM)
+    merger.update(0, state(x=0.5, y=-0.75, yaw=0.25), None, 1)
+    merged = merger.update(1, state(x=0.25, y=-0.75, roll=0.5), None, 2)
+    assert merged.t == 2
+    assert axes(merged) == pytest.approx((0.75, -1.0, 0.0, 0.5, 0.0, 0.25))
+
+def test_priority_follows_the_first_deflected_device():
+    merger = InputMerger(COMBINE_PRIORITY)
+    merger.update(0, state(x=PRIORITY_THRESHOLD / 2), None, 1)
+    merged = merger.update(1, state(y=0.5, yaw=-0.25), None, 2)
+    assert axes(merged) == pytest.approx((0.0, 0.5, 0.0, 0.0, 0.0, -0.25))
+    # The primary device takes over as soon as it is deflected
+    merged = merger.update(0, state(x=0.5), None, 3)
+    assert axes(merged) == pytest.approx((0.5, 0.0, 0.0, 0.0, 0.0, 0.0))
+    # While every device rests the small deflections are summed
+    merger.update(0, state(x=0.01), None, 4)
+    merged = merger.update(1, state(x=0.02), None, 5)
+    assert merged.x == pytest.approx(0.03)
+
+def test_ownership_reads_each_axis_from_its_owner():
+    merger = InputMerger(COMBINE_OWNERSHIP, owners=(0, 0, 0, 1, 1, 1))
+    merger.update(0, state(x=0.1, y=0.2, z=0.3, roll=0.9, pitch=0.9, yaw=0.9), None, 1)
+    merged = merger.update(1, state(x=0.9, y=0.9, z=0.9, roll=0.4, pitch=0.5, yaw=0.6), None, 2)
+    assert axes(merged) == pytest.approx((0.1, 0.2, 0.3, 0.4, 0.5, 0.6))
+    # A missing owner leaves its axes at rest
+    merger.remove(1)
+    merged = merger.update(0, state(x=0.1, roll=0.9), None, 3)
+    assert axes(merged) == pytest.approx((0.1, 0.0, 0.0, 0.0, 0.0, 0.0))
+
+def test_axis_config_gains():
+    merger = InputMerger(COMBINE_SUM)
+    config = AxisConfig((-1.0, 0.0, 2.0, 1.0, 1.0, 0.5))
+    merged = merger.update(0, state(x=0.5, y=0.5, z=0.25, yaw=0.5), config, 1)
+    assert axes(merged) == pytest.approx((-0.5, 0.0, 0.5, 0.0, 0.0, 0.25))
+
+def test_buttons_follow_slot_order():
+    merger = InputMerger(COMBINE_SUM)
+    merger.update(1, state(buttons=(0, 1)), None, 1)
+    merged = merger.update(0, state(buttons=(1, 0)), None, 2)
+    assert merged.buttons == (1, 0, 0, 1)
+    merger.remove(1)
+    assert merger.update(0, state(buttons=(1, 1)), None, 3).buttons == (1, 1)
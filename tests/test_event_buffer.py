@@ -0,0 +1,93 @@
+# test_event_buffer.py - Queue order, compaction and overflow of the preallocated event buffer
+from krita_spacemouse.models.event_buffer import (
+    BUTTON_EVENT, EVENT_FIELDS, FIELD_PERIOD, MOTION_EVENT, SpaceMouseEventBuffer)
+
+def rows(buffer):
+    """Queued events as (type, fields) in order; button rows only use bnum and press"""
+    result = []
+    for index in range(buffer.first, buffer.first + buffer.count):
+        event_type = buffer.types[index]
+        width = EVENT_FIELDS if event_type == MOTION_EVENT else 2
+        result.append((event_type, tuple(buffer.data[index * EVENT_FIELDS:index * EVENT_FIELDS + width])))
+    return result
+
+def motion(value, period=1):
+    return (MOTION_EVENT, (value, -value, 0, 0, 0, value, period))
+
+def button(bnum, press):
+    return (BUTTON_EVENT, (bnum, press))
+
+def test_append_and_pop_keep_order():
+    buffer = SpaceMouseEventBuffer(4)
+    buffer.append_motion(1, -1, 0, 0, 0, 1, 1)
+    buffer.append_button(0, 1)
+    buffer.append_motion(2, -2, 0, 0, 0, 2, 1)
+    assert len(buffer) == 3
+    assert rows(buffer) == [motion(1), button(0, 1), motion(2)]
+    buffer.pop_front()
+    assert buffer.first == 1
+    assert rows(buffer) == [button(0, 1), motion(2)]
+
+def test_append_at_the_end_moves_the_queue_back():
+    buffer = SpaceMouseEventBuffer(3)
+    for value in range(3):
+        buffer.append_motion(value, -value, 0, 0, 0, value, 1)
+    buffer.pop_front()
+    buffer.pop_front()
+    assert buffer.append_button(1, 0)
+    assert buffer.first == 0
+    assert rows(buffer) == [motion(2), button(1, 0)]
+
+def test_pop_last_event_resets_first():
+    buffer = SpaceMouseEventBuffer(2)
+    buffer.append_button(0, 1)
+    buffer.pop_front()
+    assert (buffer.first, buffer.count) == (0, 0)
+    buffer.pop_front()
+    assert (buffer.first, buffer.count) == (0, 0)
+
+def test_full_buffer_coalesces_motion():
+    buffer = SpaceMouseEventBuffer(3)
+    buffer.append_motion(1, -1, 0, 0, 0, 1, 2)
+    buffer.append_motion(2, -2, 0, 0, 0, 2, 3)
+    buffer.append_button(0, 1)
+    # The newest motion row takes the new state and accumulates the period
+    assert buffer.append_motion(5, -5, 0, 0, 0, 5, 4)
+    assert rows(buffer) == [motion(1, 2), motion(5, 7), button(0, 1)]
+    assert buffer.data[1 * EVENT_FIELDS + FIELD_PERIOD] == 7
+    assert buffer.dropped == 0
+    # Buttons are never coalesced
+    assert not buffer.append_button(0, 0)
+    assert buffer.dropped == 1
+
+def test_full_of_buttons_drops_motion():
+    buffer = SpaceMouseEventBuffer(2)
+    buffer.append_button(0, 1)
+    buffer.append_button(0, 0)
+    assert not buffer.append_motion(1, -1, 0, 0, 0, 1, 1)
+    assert buffer.dropped == 1
+    assert rows(buffer) == [button(0, 1), button(0, 0)]
+
+def test_remove_type_keeps_the_rest_in_order():
+    buffer = SpaceMouseEventBuffer(8)
+    buffer.append_button(9, 9)
+    buffer.pop_front()
+    buffer.append_motion(1, -1, 0, 0, 0, 1, 1)
+    buffer.append_button(0, 1)
+    buffer.append_motion(2, -2, 0, 0, 0, 2, 1)
+    buffer.append_button(0, 0)
+    assert buffer.remove_type(MOTION_EVENT) == 2
+    assert rows(buffer) == [button(0, 1), button(0, 0)]
+
+def test_copy_into_appends_and_counts_overflow():
+    source = SpaceMouseEventBuffer(4)
+    source.append_motion(1, -1, 0, 0, 0, 1, 1)
+    source.append_button(2, 1)
+    source.append_motion(3, -3, 0, 0, 0, 3, 1)
+    target = SpaceMouseEventBuffer(3)
+    target.append_button(0, 0)
+    assert source.copy_into(target) == 2
+    assert rows(target) == [button(0, 0), motion(1), button(2, 1)]
+    assert target.dropped == 1
+    # The source is left as it was
+    assert len(source) == 3
@@ -0,0 +1,104 @@
+# test_linux_hid_backend.py - evdev events and hidraw reports fed through a FIFO
+import os
+import struct
+import pytest
+from krita_spacemouse.models.backends.linux_hid_backend import (
+    AXIS_SCALE, BTN_0, EV_KEY, EV_REL, EV_SYN, INPUT_EVENT, PROTOCOL_EVDEV, PROTOCOL_HIDRAW, SYN_REPORT,
+    LinuxHidBackend)
+
+WAIT = 0.5
+
+@pytest.fixture
+def fifo(tmp_path):
+    """Yields (path, open_writer); the backend must open the read end first"""
+    path = str(tmp_path / "device")
+    os.mkfifo(path)
+    writers = []
+
+    def open_writer():
+        writers.append(os.open(path, os.O_WRONLY))
+        return writers[-1]
+
+    yield path, open_writer
+    for fd in writers:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+def event(event_type, code, value):
+    return INPUT_EVENT.pack(0, 0, event_type, code, value)
+
+def test_evdev_events(fifo):
+    path, open_writer = fifo
+    backend = LinuxHidBackend(path, protocol=PROTOCOL_EVDEV)
+    assert backend.event_driven
+    assert backend.open() == path
+    writer = open_writer()
+    try:
+        assert not backend.wait(0.01)
+        report = (event(EV_REL, 0, 175) + event(EV_REL, 1, 35) + event(EV_REL, 5, -350)
+                  + event(EV_KEY, BTN_0 + 1, 1) + event(EV_SYN, SYN_REPORT, 0))
+        # An event split across writes is carried over to the next read
+        os.write(writer, report[:-5])
+        assert backend.wait(WAIT)
+        partial = backend.read()
+        assert partial.x == 0.0 and partial.buttons == (0, 0)
+        os.write(writer, report[-5:])
+        assert backend.wait(WAIT)
+        sample = backend.read()
+        assert sample.x == pytest.approx(0.5)
+        assert sample.y == pytest.approx(-35 / AXIS_SCALE)
+        assert sample.yaw == pytest.approx(-1.0)
+        assert sample.buttons == (0, 1)
+        # Nothing new: the same state comes back
+        assert backend.read() is sample
+    finally:
+        backend.close()
+
+def test_hidraw_reports(fifo):
+    path, open_writer = fifo
+    backend = LinuxHidBackend(path, protocol=PROTOCOL_HIDRAW)
+    backend.open()
+    writer = open_writer()
+    try:
+        os.write(writer, bytes((1,)) + struct.pack("<3h", 350, 70, -35)
+                 + bytes((2,)) + struct.pack("<3h", 35, -70, 175)
+                 + bytes((3,)) + (0b101).to_bytes(2, "little"))
+        assert backend.wait(WAIT)
+        sample = backend.read()
+        assert (sample.x, sample.y, sample.z) == pytest.approx((1.0, -0.2, 0.1))
+        assert (sample.roll, sample.pitch, sample.yaw) == pytest.approx((0.2, -0.1, 0.5))
+        assert sample.buttons == (1, 0, 1)
+    finally:
+        backend.close()
+
+def test_hidraw_six_axis_report(fifo):
+    path, open_writer = fifo
+    backend = LinuxHidBackend(path, protocol=PROTOCOL_HIDRAW, six_axis=True)
+    backend.open()
+    writer = open_writer()
+    try:
+        os.write(writer, bytes((1,)) + struct.pack("<6h", -350, 0, 0, 0, 0, 35))
+        assert backend.wait(WAIT)
+        sample = backend.read()
+        assert sample.x == pytest.approx(-1.0)
+        assert sample.yaw == pytest.approx(0.1)
+        assert sample.buttons == (0, 0)
+    finally:
+        backend.close()
+
+def test_wait_after_writer_closes(fifo):
+    path, open_writer = fifo
+    backend = LinuxHidBackend(path, protocol=PROTOCOL_HIDRAW)
+    backend.open()
+    writer = open_writer()
+    try:
+        os.write(writer, bytes((3,)) + (1).to_bytes(2, "little"))
+        os.close(writer)
+        assert backend.wait(WAIT)
+        assert backend.read().buttons == (1, 0)
+        # The FIFO stays readable at end of input; wait() must not report it as data
+        assert not backend.wait(0.01)
+    finally:
+        backend.close()
@@ -0,0 +1,56 @@
+# test_settings_store.py - Profile save/load round trip through SettingsWriter
+import time
+import pytest
+from krita_spacemouse.models.profiles import ProfileSet
+from krita_spacemouse.models.settings_store import DEFAULT_PROFILE, SettingsWriter, read_settings
+
+@pytest.fixture
+def path(tmp_path):
+    # The stand-in QSettings keeps values in memory per path; read_settings wants the file to exist
+    path = tmp_path / "spacemouse_config.ini"
+    path.touch()
+    return str(path)
+
+def sample_profiles():
+    profiles = ProfileSet()
+    profiles.set_values(DEFAULT_PROFILE, {"pan_scale": 150, "adaptive_polling": False})
+    profiles.set_values("Inking", {"smoothing_mode": 1, "smoothing": 45, "axis_expo": "50,,,,,20"})
+    profiles.selected = "Inking"
+    profiles.document_profiles["/art/comic page.kra"] = "Inking"
+    profiles.tool_profiles["KritaShape/KisToolBrush"] = DEFAULT_PROFILE
+    return profiles
+
+def test_round_trip(path):
+    profiles = sample_profiles()
+    bindings = {"1": "reset_canvas_rotation", "1+2 hold": "view_show_canvas_only"}
+    writer = SettingsWriter(lambda: path, delay=60.0)
+    # Changes made in quick succession are written once, with the latest values
+    writer.schedule(ProfileSet().snapshot(), {}, delay=60.0)
+    writer.schedule(profiles.snapshot(), bindings)
+    writer.flush()
+    assert (writer.writes, writer.last_error) == (1, None)
+
+    snapshot, loaded_bindings = read_settings(path)
+    loaded = ProfileSet()
+    loaded.load(snapshot)
+    assert loaded.snapshot() == profiles.snapshot()
+    assert loaded_bindings == bindings
+    assert loaded.names() == [DEFAULT_PROFILE, "Inking"]
+    assert loaded.config("Inking") == profiles.config("Inking")
+    assert loaded.resolve(document="/art/comic page.kra", tool="KritaShape/KisToolBrush") == DEFAULT_PROFILE
+    assert loaded.resolve(document="/art/comic page.kra") == "Inking"
+
+def test_worker_writes_after_the_delay(path):
+    profiles = sample_profiles()
+    writer = SettingsWriter(lambda: path, delay=0.01)
+    writer.schedule(profiles.snapshot(), {})
+    deadline = time.monotonic() + 5.0
+    while not writer.writes and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert writer.writes == 1
+    snapshot, bindings = read_settings(path)
+    assert snapshot == profiles.snapshot()
+    assert bindings == {}
+
+def test_missing_file(tmp_path):
+    assert read_settings(str(tmp_path / "absent.ini")) is None